@@ -0,0 +1,171 @@
+"""
+Solves many start and destination queries on the same world. The queries run in waves in a pool of processes, and
+the population of every query is warm started from the best paths of nearby queries solved in earlier waves.
+"""
+import random
+import statistics
+import time
+import numpy
+
+import constants as const
+from chromosome import Chromosome
+from genetic_algorithm import GeneticSearchAlgorithm, seed_generators
+from initializers import initial_genomes
+from solver import default_parameters
+
+# World and GA parameters of a worker process
+batchState = {}
+
+
+def attach_batch(world, parameters, cacheSize):
+    """
+    Initializer of the worker processes - keeps the shared world and the parameters of the GA.
+    :returns: None
+    """
+    batchState["world"] = world
+    batchState["parameters"] = parameters
+    batchState["cacheSize"] = cacheSize
+
+
+def connecting_moves(source, target):
+    """
+    :returns: list of direction codes of a path from the source cell to the target cell (vertical moves, then
+              horizontal moves)
+    """
+    (sourceY, sourceX), (targetY, targetX) = source, target
+    return [0 if targetY > sourceY else 1] * abs(targetY - sourceY) + \
+        [3 if targetX > sourceX else 2] * abs(targetX - sourceX)
+
+
+def nearby_paths(query, solved, radius):
+    """
+    :param query: start and destination cells of the query
+    :param solved: list of the start, destination and direction codes of the paths of solved queries
+    :param radius: maximal sum of the distances between the starts and between the destinations
+    :returns: the paths of the nearest solved queries (at most WARM_START_NEIGHBOURS)
+    """
+    start, dest = query
+    distances = [(Chromosome.manhattan_distance(start, oldStart) + Chromosome.manhattan_distance(dest, oldDest), index)
+                 for index, (oldStart, oldDest, _) in enumerate(solved)]
+    distances = [item for item in distances if item[0] <= radius]
+    distances.sort()
+    return [solved[index] for _, index in distances[:const.WARM_START_NEIGHBOURS]]
+
+
+def warm_genomes(query, paths, count, length):
+    """
+    Creates genomes from the paths of nearby queries - every path is connected to the start and the destination of
+    the query with straight moves, cut or padded with random directions to the length of the genomes. The paths are
+    repeated to fill the rows, and every copy but the first gets a random mutation.
+    :param query: start and destination cells of the query
+    :param paths: start, destination and direction codes of the nearby paths
+    :param count: number of genomes
+    :param length: number of directions in every genome
+    :returns: matrix of direction codes (count x length)
+    """
+    start, dest = query
+    rows = []
+    for oldStart, oldDest, codes in paths:
+        path = connecting_moves(start, oldStart) + list(codes) + connecting_moves(oldDest, dest)
+        path = path[:length] + numpy.random.randint(0, len(const.DIRECTIONS), size=max(length - len(path), 0)).tolist()
+        rows.append(path)
+    genomes = numpy.array(rows, dtype=numpy.int8)[numpy.arange(count) % len(rows)]
+    copies = numpy.arange(len(rows), count)
+    genomes[copies, numpy.random.randint(0, length, size=copies.size)] = \
+        numpy.random.randint(0, len(const.DIRECTIONS), size=copies.size)
+    return genomes
+
+
+def solve_query(task):
+    """
+    Runs the GA of one query on the shared world.
+    :param task: index, start and destination cells, nearby paths and seed of the query
+    :returns: dict of the query's result
+    """
+    index, start, dest, paths, seed = task
+    begin = time.perf_counter()
+    seed_generators(seed, "query", index)
+    world = batchState["world"].query(start, dest, cacheSize=batchState["cacheSize"])
+    parameters = batchState["parameters"]
+    size = int(parameters["populationSize"])
+    length = world.size * 2
+    genomes = None
+    if paths:
+        warmCount = int(size * const.WARM_START_FRACTION)
+        genomes = numpy.concatenate((warm_genomes((start, dest), paths, warmCount, length),
+                                     initial_genomes(parameters.get("initializer", const.DEFAULT_INITIALIZER), world,
+                                                     size - warmCount, length,
+                                                     parameters.get("randomFraction", const.DEFAULT_RANDOM_FRACTION))))
+    ga = GeneticSearchAlgorithm(world, initialGenomes=genomes, **parameters)
+    ga.start()
+    best = ga.bestChromosome
+    return {"index": index,
+            "start": start,
+            "dest": dest,
+            "path": best.path[:best.pathLength],
+            "codes": bytes(best.codes()[:best.pathLength]),
+            "fitness": best.fitness,
+            "found": best.destReached and not best.obstacles,
+            "shortestDistance": world.shortest_distance(),
+            "generations": ga.generation,
+            "warmStarted": bool(paths),
+            "latency": time.perf_counter() - begin}
+
+
+def solve_batch(world, queries, workers=1, seed=None, warmStart=True, cacheSize=const.FITNESS_CACHE_SIZE,
+                **parameters):
+    """
+    Solves start and destination queries on the same world. All the queries share the obstacles index of the world
+    and the cached distance fields of their destinations.
+    The queries run in waves of the number of workers - the population of a query is warm started from the best paths
+    of the nearest queries solved in the earlier waves.
+    :param world: the World object
+    :param queries: list of start and destination cells (free cells of the world, see World.query)
+    :param workers: number of processes (1 - the queries run in the current process)
+    :param seed: base seed of the queries (default - random seed)
+    :param warmStart: warm start the populations from the paths of nearby queries
+    :param cacheSize: maximal number of paths in the fitness cache of every query
+    :param parameters: parameters of the GeneticSearchAlgorithm of every query (default - the default parameters of
+                       main.py, quiet)
+    :returns: list of the results of the queries (dicts), and dict of the total time, the throughput (queries per
+              second) and the latencies (seconds)
+    """
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    parameters = default_parameters(world, **parameters)
+    pool = None
+    if workers > 1:
+        from multiprocessing import Pool
+        pool = Pool(processes=workers, initializer=attach_batch, initargs=(world, parameters, cacheSize))
+    else:
+        attach_batch(world, parameters, cacheSize)
+
+    begin = time.perf_counter()
+    results = []
+    solved = []                 # Start, destination and direction codes of the paths found
+    for first in range(0, len(queries), workers):
+        tasks = []
+        for index, (start, dest) in enumerate(queries[first:first + workers], start=first):
+            start, dest = tuple(start), tuple(dest)
+            paths = nearby_paths((start, dest), solved, world.size) if warmStart else []
+            tasks.append((index, start, dest, paths, seed))
+        wave = pool.map(solve_query, tasks, chunksize=1) if pool else [solve_query(task) for task in tasks]
+        for result in wave:
+            if result["found"]:
+                solved.append((result["start"], result["dest"], result["codes"]))
+        results.extend(wave)
+    seconds = time.perf_counter() - begin
+    if pool:
+        pool.close()
+        pool.join()
+
+    latencies = [result["latency"] for result in results]
+    summary = {"queries": len(results),
+               "found": sum(result["found"] for result in results),
+               "warmStarted": sum(result["warmStarted"] for result in results),
+               "seconds": seconds,
+               "throughput": len(results) / seconds if seconds else 0.0,
+               "meanLatency": statistics.mean(latencies) if latencies else 0.0,
+               "medianLatency": statistics.median(latencies) if latencies else 0.0,
+               "maxLatency": max(latencies, default=0.0)}
+    return results, summary
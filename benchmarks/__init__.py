@@ -0,0 +1,4 @@
+"""
+Benchmarks of the genetic algorithm. Run from the repository root, for example:
+    python -m benchmarks.walk_obstacles
+"""
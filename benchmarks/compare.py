@@ -0,0 +1,52 @@
+"""
+Compares two JSON reports of the benchmark suite and lists the regressions.
+"""
+import argparse as arg
+import json
+import sys
+
+# Metrics where a higher value is better - for all the other timed metrics a lower value is better
+HIGHER_IS_BETTER = ["walkChromosomesPerSecond"]
+LOWER_IS_BETTER = ["generationMeanSeconds", "generationMinSeconds", "solutionSeconds", "solutionGenerations"]
+
+
+def load_results(path):
+    """
+    :returns: dict of the results of a report by their (size, density, engine)
+    """
+    with open(path) as file:
+        report = json.load(file)
+    return {(result["size"], result["density"], result["engine"]): result for result in report["results"]}
+
+
+def compare(baseline, current, threshold):
+    """
+    Compares the metrics of the results found in both reports.
+    :param threshold: relative change considered a regression
+    :returns: list of rows (key, metric, baseline value, current value, relative change, regression)
+    """
+    rows = []
+    for key in sorted(set(baseline) & set(current)):
+        for metric in HIGHER_IS_BETTER + LOWER_IS_BETTER:
+            if metric not in baseline[key] or metric not in current[key] or not baseline[key][metric]:
+                continue
+            old, new = baseline[key][metric], current[key][metric]
+            change = (new - old) / old
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            rows.append((key, metric, old, new, change, worse > threshold))
+    return rows
+
+
+if __name__ == '__main__':
+    parser = arg.ArgumentParser(description="Compare two benchmark reports.")
+    parser.add_argument("baseline", help="JSON report of the baseline run")
+    parser.add_argument("current", help="JSON report of the current run")
+    parser.add_argument("-th", "--threshold", help="Relative change considered a regression. Default=0.1",
+                        default=0.1, type=float)
+    args = parser.parse_args()
+
+    rows = compare(load_results(args.baseline), load_results(args.current), args.threshold)
+    for (size, density, engine), metric, old, new, change, regression in rows:
+        print("{:>5} {:>6} {:>10} {:>26} {:>14.6g} {:>14.6g} {:>+8.1%} {}"
+              .format(size, density, engine, metric, old, new, change, "REGRESSION" if regression else ""))
+    sys.exit(1 if any(row[-1] for row in rows) else 0)
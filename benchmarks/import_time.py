@@ -0,0 +1,44 @@
+"""
+Measures the cold-start import time of the modules (as a new worker process sees it) with python -X importtime, and
+checks that the GUI, plotting and process-pool modules are not imported by the library modules.
+"""
+import argparse as arg
+import os
+import subprocess
+import sys
+
+# Modules that are slow to import and are only needed for windows, graphs or pools of processes
+HEAVY_MODULES = ("tkinter", "matplotlib", "multiprocessing", "parallel")
+
+
+def import_time(module):
+    """
+    Imports a module in a new interpreter.
+    :param module: name of the module
+    :returns: cumulative import time (microseconds) of the module, and the heavy modules it imported
+    """
+    code = "import sys, {0}; print(','.join(name for name in {1} if name in sys.modules))".format(module,
+                                                                                                 HEAVY_MODULES)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=root, capture_output=True,
+                             text=True, check=True)
+    # Every line of the report is "import time: self | cumulative | name" - the module itself is the last line
+    lines = [line for line in process.stderr.splitlines() if line.startswith("import time:")]
+    cumulative = int(lines[-1].split("|")[1])
+    return cumulative, process.stdout.strip()
+
+
+if __name__ == '__main__':
+    parser = arg.ArgumentParser(description="Measure the import time of the modules.")
+    parser.add_argument("-m", "--modules", help="Modules separated by commas. Default=solver,batch,sweep,main",
+                        default="solver,batch,sweep,main", type=str)
+    parser.add_argument("-r", "--repeats", help="Imports of every module (the best is reported). Default=5",
+                        default=5, type=int)
+    args = parser.parse_args()
+
+    # NumPy is needed by every module - its import time is the baseline
+    print("{:>10} {:>12}  {}".format("module", "import ms", "heavy modules"))
+    for module in ["numpy"] + args.modules.split(","):
+        results = [import_time(module) for _ in range(args.repeats)]
+        best = min(microseconds for microseconds, _ in results)
+        print("{:>10} {:>12.1f}  {}".format(module, best / 1000, results[0][1] or "-"))
@@ -0,0 +1,91 @@
+"""
+Compares the initializers of the population - the time to create the initial genomes, and the generations and the
+time until the GA finds its first feasible path (reaches the destination without obstacles).
+"""
+import argparse as arg
+import time
+
+import constants as const
+from genetic_algorithm import GeneticSearchAlgorithm, seed_generators
+from initializers import initial_genomes
+from world import World
+
+
+def create_world(size, density, seed):
+    """
+    :returns: a seeded World object
+    """
+    seed_generators(seed, "world", size, density)
+    world = World(size=size, obstacles=0)
+    world.changeObstacles(int(density * size * size))
+    return world
+
+
+def first_feasible_path(world, engine, initializer, randomFraction, populationFactor, seed):
+    """
+    Runs the GA until its fittest path is feasible or until it stops.
+    :returns: number of generations, seconds and whether a feasible path was found
+    """
+    seed_generators(seed, "run", initializer)
+    begin = time.perf_counter()
+    ga = GeneticSearchAlgorithm(world, populationSize=world.size * populationFactor,
+                                mutationProbability=float(const.DEFAULT_MUTATION_PROBABILITY),
+                                elitePercentage=float(const.DEFAULT_ELITE_PERCENTAGE),
+                                parentPercentage=float(const.DEFAULT_PARENTS_PERCENTAGE), engine=engine,
+                                initializer=initializer, randomFraction=randomFraction, verbose=False)
+    feasible = ga.bestChromosome.destReached and not ga.bestChromosome.obstacles
+    while not feasible and not ga.finished():
+        ga.step()
+        feasible = ga.bestChromosome.destReached and not ga.bestChromosome.obstacles
+    ga.close()
+    return ga.generation, time.perf_counter() - begin, feasible
+
+
+if __name__ == '__main__':
+    parser = arg.ArgumentParser(description="Compare the initializers of the population.")
+    parser.add_argument("-s", "--sizes", help="World sizes separated by commas. Default=30,60",
+                        default="30,60", type=str)
+    parser.add_argument("-d", "--densities", help="Obstacle densities separated by commas. Default=0,0.1,0.25",
+                        default="0,0.1,0.25", type=str)
+    parser.add_argument("-in", "--initializers", help="Initializers separated by commas. Default={}"
+                        .format(",".join(const.INITIALIZERS)), default=",".join(const.INITIALIZERS), type=str)
+    parser.add_argument("-rf", "--random-fraction", help="Part of the initial paths that are random. Default={}"
+                        .format(const.DEFAULT_RANDOM_FRACTION), default=const.DEFAULT_RANDOM_FRACTION, type=float)
+    parser.add_argument("-en", "--engine", help="Engine of the GA. Default={}".format(const.VECTORIZED_ENGINE),
+                        default=const.VECTORIZED_ENGINE, choices=const.ENGINES)
+    parser.add_argument("-p", "--population", help="Population size factor (of the world size). Default={}"
+                        .format(const.POPULATION_FACTOR), default=const.POPULATION_FACTOR, type=float)
+    parser.add_argument("-b", "--build", help="Genomes created when timing the initializers. Default=100000",
+                        default=100000, type=int)
+    parser.add_argument("-r", "--runs", help="Seeded runs of every combination. Default=3", default=3, type=int)
+    args = parser.parse_args()
+
+    initializers = args.initializers.split(",")
+    sizes = [int(x) for x in args.sizes.split(",")]
+    densities = [float(x) for x in args.densities.split(",")]
+
+    print("{:>12} {:>8} {:>10} {:>12}".format("initializer", "size", "genomes", "seconds"))
+    for size in sizes:
+        world = create_world(size, max(densities), 0)
+        for initializer in initializers:
+            seed_generators(0, "build", initializer)
+            begin = time.perf_counter()
+            initial_genomes(initializer, world, args.build, size * 2, args.random_fraction)
+            print("{:>12} {:>8} {:>10} {:>12.3f}".format(initializer, size, args.build, time.perf_counter() - begin))
+
+    print("\n{:>12} {:>8} {:>8} {:>12} {:>12} {:>10}".format("initializer", "size", "density", "generations",
+                                                             "seconds", "feasible"))
+    for size in sizes:
+        for density in densities:
+            for initializer in initializers:
+                generations, seconds, feasible = 0, 0.0, 0
+                for seed in range(args.runs):
+                    world = create_world(size, density, seed)
+                    runGenerations, runSeconds, runFeasible = first_feasible_path(
+                        world, args.engine, initializer, args.random_fraction, args.population, seed)
+                    generations += runGenerations
+                    seconds += runSeconds
+                    feasible += runFeasible
+                print("{:>12} {:>8} {:>8} {:>12.1f} {:>12.3f} {:>10}"
+                      .format(initializer, size, density, generations / args.runs, seconds / args.runs,
+                              "{}/{}".format(feasible, args.runs)))
@@ -0,0 +1,76 @@
+"""
+Compares the GA with and without the local search of the elite - the generations and the time until the optimal path
+is found (or the GA stops), and how often the local search fires and how much of the time it takes.
+"""
+import argparse as arg
+import time
+
+import constants as const
+from genetic_algorithm import GeneticSearchAlgorithm, seed_generators
+from world import World
+
+
+def create_world(size, density, seed):
+    """
+    :returns: a seeded World object
+    """
+    seed_generators(seed, "world", size, density)
+    world = World(size=size, obstacles=0)
+    world.changeObstacles(int(density * size * size))
+    return world
+
+
+def run(world, engine, localSearch, populationFactor, seed):
+    """
+    Runs the GA until it stops.
+    :returns: number of generations, seconds, whether the optimal path was found, and the local search's statistics
+    """
+    seed_generators(seed, "run")
+    begin = time.perf_counter()
+    ga = GeneticSearchAlgorithm(world, populationSize=world.size * populationFactor,
+                                mutationProbability=float(const.DEFAULT_MUTATION_PROBABILITY),
+                                elitePercentage=float(const.DEFAULT_ELITE_PERCENTAGE),
+                                parentPercentage=float(const.DEFAULT_PARENTS_PERCENTAGE), engine=engine,
+                                localSearch=localSearch, verbose=False)
+    while not ga.finished():
+        ga.step()
+    ga.close()
+    return ga.generation, time.perf_counter() - begin, ga.optimal_path_found(), \
+        ga.localSearch.stats() if ga.localSearch else None
+
+
+if __name__ == '__main__':
+    parser = arg.ArgumentParser(description="Compare the GA with and without the local search of the elite.")
+    parser.add_argument("-s", "--sizes", help="World sizes separated by commas. Default=30,60",
+                        default="30,60", type=str)
+    parser.add_argument("-d", "--densities", help="Obstacle densities separated by commas. Default=0,0.1,0.25",
+                        default="0,0.1,0.25", type=str)
+    parser.add_argument("-en", "--engine", help="Engine of the GA. Default={}".format(const.VECTORIZED_ENGINE),
+                        default=const.VECTORIZED_ENGINE, choices=const.ENGINES)
+    parser.add_argument("-p", "--population", help="Population size factor (of the world size). Default={}"
+                        .format(const.POPULATION_FACTOR), default=const.POPULATION_FACTOR, type=float)
+    parser.add_argument("-r", "--runs", help="Seeded runs of every combination. Default=3", default=3, type=int)
+    args = parser.parse_args()
+
+    print("{:>6} {:>8} {:>7} {:>12} {:>10} {:>8} {:>10} {:>10}".format(
+        "size", "density", "local", "generations", "seconds", "optimal", "fire rate", "search %"))
+    for size in [int(x) for x in args.sizes.split(",")]:
+        for density in [float(x) for x in args.densities.split(",")]:
+            for localSearch in (False, True):
+                generations, seconds, optimal, attempts, improved, searchSeconds = 0, 0.0, 0, 0, 0, 0.0
+                for seed in range(args.runs):
+                    world = create_world(size, density, seed)
+                    runGenerations, runSeconds, runOptimal, stats = run(world, args.engine, localSearch,
+                                                                        args.population, seed)
+                    generations += runGenerations
+                    seconds += runSeconds
+                    optimal += runOptimal
+                    if stats:
+                        attempts += stats["attempts"]
+                        improved += stats["improved"]
+                        searchSeconds += stats["seconds"]
+                print("{:>6} {:>8} {:>7} {:>12.1f} {:>10.3f} {:>8} {:>10} {:>10}".format(
+                    size, density, "on" if localSearch else "off", generations / args.runs, seconds / args.runs,
+                    "{}/{}".format(optimal, args.runs),
+                    "{:.1%}".format(improved / attempts) if attempts else "-",
+                    "{:.1%}".format(searchSeconds / seconds) if localSearch else "-"))
@@ -0,0 +1,52 @@
+"""
+Measures the speedup of evaluating the offspring of a generation in a pool of processes.
+"""
+import argparse as arg
+import random
+import time
+import numpy
+
+from parallel import ParallelEvaluator
+from population import evaluate, random_genomes
+from world import World
+
+
+def time_evaluation(evaluate_function, genomes, repeats):
+    """
+    :returns: the best time (in seconds) of evaluating the genomes
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        copy = genomes.copy()
+        begin = time.perf_counter()
+        evaluate_function(copy)
+        best = min(best, time.perf_counter() - begin)
+    return best
+
+
+if __name__ == '__main__':
+    parser = arg.ArgumentParser(description="Measure parallel evaluation speedup for growing numbers of workers.")
+    parser.add_argument("-s", "--sizes", help="World sizes separated by commas. Default=50,100,200",
+                        default="50,100,200", type=str)
+    parser.add_argument("-o", "--obstacles", help="Obstacle density. Default=0.1", default=0.1, type=float)
+    parser.add_argument("-p", "--population", help="Population size factor (of the world size). Default=10",
+                        default=10, type=float)
+    parser.add_argument("-w", "--workers", help="Worker counts separated by commas. Default=1,2,4,8",
+                        default="1,2,4,8", type=str)
+    parser.add_argument("-r", "--repeats", help="Number of repeats. Default=3", default=3, type=int)
+    args = parser.parse_args()
+
+    print("{:>6} {:>10} {:>8} {:>12} {:>8}".format("size", "offspring", "workers", "seconds", "speedup"))
+    for size in [int(x) for x in args.sizes.split(",")]:
+        random.seed(size)
+        numpy.random.seed(size)
+        world = World(size=size, obstacles=int(args.obstacles * size * size))
+        genomes = random_genomes(int(size * args.population), size * 2)
+        serial = time_evaluation(lambda copy: evaluate(world, copy), genomes, args.repeats)
+        print("{:>6} {:>10} {:>8} {:>12.4f} {:>8.2f}".format(size, len(genomes), "serial", serial, 1.0))
+        for workers in [int(x) for x in args.workers.split(",")]:
+            evaluator = ParallelEvaluator(world, workers, rows=len(genomes), length=genomes.shape[1])
+            seconds = time_evaluation(evaluator.evaluate, genomes, args.repeats)
+            evaluator.close()
+            print("{:>6} {:>10} {:>8} {:>12.4f} {:>8.2f}".format(size, len(genomes), workers, seconds,
+                                                                  serial / seconds))
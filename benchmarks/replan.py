@@ -0,0 +1,99 @@
+"""
+Compares re-planning after the obstacles of the world changed against a cold restart - the latency of the re-plan
+(update of the world and evaluation of the affected chromosomes), and the generations and the time until the GA stops
+again, against a new GeneticSearchAlgorithm on the changed world.
+"""
+import argparse as arg
+import random
+import time
+
+import constants as const
+from genetic_algorithm import GeneticSearchAlgorithm, seed_generators
+from world import World
+
+
+def create_ga(world, engine, populationFactor):
+    """
+    :returns: a quiet GeneticSearchAlgorithm object with the default parameters
+    """
+    return GeneticSearchAlgorithm(world, populationSize=world.size * populationFactor,
+                                  mutationProbability=float(const.DEFAULT_MUTATION_PROBABILITY),
+                                  elitePercentage=float(const.DEFAULT_ELITE_PERCENTAGE),
+                                  parentPercentage=float(const.DEFAULT_PARENTS_PERCENTAGE), engine=engine,
+                                  verbose=False)
+
+
+def obstacle_delta(world, path, count, onPath):
+    """
+    Chooses the changes of the obstacles - a part of the new obstacles block the path, the rest are random free cells,
+    and as many random obstacles are removed.
+    :param path: cells visited by the current best path
+    :param count: number of new obstacles (and of removed obstacles)
+    :param onPath: part of the new obstacles that block the path
+    :returns: lists of the added and the removed cells
+    """
+    special = (world.start, world.dest)
+    pathCells = [cell for cell in dict.fromkeys(path) if cell not in special and not world.is_obstacle(cell)]
+    added = random.sample(pathCells, min(int(count * onPath), len(pathCells)))
+    while len(added) < count:
+        cell = divmod(random.randrange(world.size * world.size), world.size)
+        if cell not in special and cell not in added and not world.is_obstacle(cell):
+            added.append(cell)
+    removed = random.sample(world.obstaclesList, min(count, world.obstacleCount))
+    return added, removed
+
+
+if __name__ == '__main__':
+    parser = arg.ArgumentParser(description="Compare re-planning after obstacle changes with a cold restart.")
+    parser.add_argument("-s", "--sizes", help="World sizes separated by commas. Default=30,60",
+                        default="30,60", type=str)
+    parser.add_argument("-d", "--density", help="Obstacle density. Default=0.15", default=0.15, type=float)
+    parser.add_argument("-c", "--changes", help="Added (and removed) obstacles separated by commas. Default=2,10,50",
+                        default="2,10,50", type=str)
+    parser.add_argument("-op", "--on-path", help="Part of the new obstacles that block the best path. Default=0.5",
+                        default=0.5, type=float)
+    parser.add_argument("-en", "--engine", help="Engine of the GA. Default={}".format(const.VECTORIZED_ENGINE),
+                        default=const.VECTORIZED_ENGINE, choices=const.ENGINES)
+    parser.add_argument("-p", "--population", help="Population size factor (of the world size). Default={}"
+                        .format(const.POPULATION_FACTOR), default=const.POPULATION_FACTOR, type=float)
+    parser.add_argument("-r", "--runs", help="Seeded runs of every combination. Default=3", default=3, type=int)
+    args = parser.parse_args()
+
+    print("{:>6} {:>8} {:>9} {:>11} {:>11} {:>13} {:>11} {:>10} {:>13} {:>11} {:>10}".format(
+        "size", "changes", "rescored", "replan ms", "cold ms", "replan gens", "replan s", "replan fit", "cold gens",
+        "cold s", "cold fit"))
+    for size in [int(x) for x in args.sizes.split(",")]:
+        for changes in [int(x) for x in args.changes.split(",")]:
+            totals = [0.0] * 9
+            for seed in range(args.runs):
+                seed_generators(seed, "world", size, changes)
+                world = World(size=size, obstacles=int(args.density * size * size))
+                ga = create_ga(world, args.engine, args.population)
+                ga.start()
+                added, removed = obstacle_delta(world, ga.bestChromosome.history, changes, args.on_path)
+
+                # Re-plan and continue the search
+                seed_generators(seed, "replan", size, changes)
+                begin = time.perf_counter()
+                rescored = ga.replan(added, removed)
+                replanLatency = time.perf_counter() - begin
+                generation = ga.generation
+                ga.start()
+                replanSeconds = time.perf_counter() - begin
+
+                # Cold restart on the changed world
+                seed_generators(seed, "cold", size, changes)
+                changed = World(size, 0, occupancy=bytearray(world.occupancy), start=world.start, dest=world.dest)
+                begin = time.perf_counter()
+                cold = create_ga(changed, args.engine, args.population)
+                coldLatency = time.perf_counter() - begin
+                cold.start()
+                coldSeconds = time.perf_counter() - begin
+
+                for index, value in enumerate((rescored / len(ga.population), replanLatency * 1000,
+                                               coldLatency * 1000, ga.generation - generation, replanSeconds,
+                                               ga.bestChromosome.fitness, cold.generation, coldSeconds,
+                                               cold.bestChromosome.fitness)):
+                    totals[index] += value
+            print("{:>6} {:>8} {:>9.1%} {:>11.2f} {:>11.2f} {:>13.1f} {:>11.3f} {:>10.1f} {:>13.1f} {:>11.3f} {:>10.1f}"
+                  .format(size, changes, *(total / args.runs for total in totals)))
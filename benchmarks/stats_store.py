@@ -0,0 +1,72 @@
+"""
+Compares recording the statistics of the generations in the old nested dicts against the columnar StatsStore - the
+time to record the generations, the time to read the graphs' lines, and the memory of the records.
+"""
+import argparse as arg
+import time
+import tracemalloc
+import numpy
+
+from stats import StatsStore
+
+METRICS = ("max", "min", "avg")
+
+
+def record_dicts(values):
+    """
+    Records the statistics like the old update_data, then reads the lines like the old create_graphs.
+    :param values: matrix of the fitness values (one row per generation)
+    :returns: the data dict, seconds of recording and seconds of reading
+    """
+    begin = time.perf_counter()
+    data = {}
+    for generation, row in enumerate(values):
+        data[generation] = {"max": row.max().item(), "min": row.min().item(), "avg": row.mean().item()}
+    recorded = time.perf_counter()
+    for metric in METRICS:
+        gens = data.keys()
+        [data[gen][metric] for gen in gens]
+    return data, recorded - begin, time.perf_counter() - recorded
+
+
+def record_store(values):
+    """
+    Records the same statistics in a StatsStore, then reads the lines as columns.
+    :param values: matrix of the fitness values (one row per generation)
+    :returns: the StatsStore object, seconds of recording and seconds of reading
+    """
+    begin = time.perf_counter()
+    store = StatsStore()
+    for generation, row in enumerate(values):
+        store.record(generation, max=row.max().item(), min=row.min().item(), avg=row.mean().item())
+    recorded = time.perf_counter()
+    for metric in METRICS:
+        store.column("generation"), store.column(metric)
+    return store, recorded - begin, time.perf_counter() - recorded
+
+
+def measure(function, values):
+    """
+    :returns: seconds of recording, seconds of reading and the peak memory (bytes) of the records
+    """
+    tracemalloc.start()
+    records, recordSeconds, readSeconds = function(values)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return recordSeconds, readSeconds, peak
+
+
+if __name__ == '__main__':
+    parser = arg.ArgumentParser(description="Compare the nested dicts of statistics with the columnar StatsStore.")
+    parser.add_argument("-g", "--generations", help="Generations separated by commas. Default=1000,10000,100000",
+                        default="1000,10000,100000", type=str)
+    parser.add_argument("-p", "--population", help="Population size. Default=100", default=100, type=int)
+    args = parser.parse_args()
+
+    print("{:>12} {:>8} {:>12} {:>12} {:>12}".format("generations", "store", "record s", "read s", "peak KiB"))
+    for generations in [int(x) for x in args.generations.split(",")]:
+        values = numpy.random.default_rng(0).integers(0, 1000, size=(generations, args.population))
+        for name, function in (("dicts", record_dicts), ("columns", record_store)):
+            recordSeconds, readSeconds, peak = measure(function, values)
+            print("{:>12} {:>8} {:>12.4f} {:>12.4f} {:>12.0f}".format(generations, name, recordSeconds, readSeconds,
+                                                                      peak / 1024))
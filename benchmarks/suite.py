@@ -0,0 +1,165 @@
+"""
+Benchmark suite of the genetic algorithm. Measures over a matrix of world sizes and obstacle densities:
+    1. walk - throughput of walking and scoring chromosomes (chromosomes per second).
+    2. generation - latency of GeneticSearchAlgorithm.create_generation.
+    3. solution - time and generations until the GA stops, and whether a path was found.
+Every measurement is seeded, and the results are written as JSON so runs can be compared
+(see benchmarks.compare).
+"""
+import argparse as arg
+import json
+import platform
+import sys
+import time
+import numpy
+
+import constants as const
+from chromosome import Chromosome
+from genetic_algorithm import GeneticSearchAlgorithm, seed_generators
+from population import evaluate, random_genomes
+from world import World
+
+WARMUP_CHROMOSOMES = 16         # Chromosomes walked before the walk throughput is timed
+
+
+def create_world(size, density, seed):
+    """
+    Creates a seeded world without a fitness cache (so every chromosome is walked). The distance field is built
+    here, so its breadth first search isn't timed by the first benchmark.
+    :returns: the World object
+    """
+    seed_generators(seed, "world", size, density)
+    world = World(size=size, obstacles=0, cacheSize=0)
+    world.changeObstacles(int(density * size * size))
+    world.distance_field()
+    return world
+
+
+def create_ga(world, engine, populationFactor):
+    """
+    Creates a GA with the default parameters.
+    :returns: the GeneticSearchAlgorithm object
+    """
+    return GeneticSearchAlgorithm(world, populationSize=world.size * populationFactor,
+                                  mutationProbability=float(const.DEFAULT_MUTATION_PROBABILITY),
+                                  elitePercentage=float(const.DEFAULT_ELITE_PERCENTAGE),
+                                  parentPercentage=float(const.DEFAULT_PARENTS_PERCENTAGE), engine=engine,
+                                  verbose=False)
+
+
+def benchmark_walk(world, engine, count, seed):
+    """
+    :returns: number of chromosomes walked and scored per second (after an untimed warm-up walk)
+    """
+    seed_generators(seed, "walk", world.size)
+    genomes = random_genomes(count, world.size * 2)
+    walk_genomes(world, engine, genomes[:WARMUP_CHROMOSOMES])
+    begin = time.perf_counter()
+    walk_genomes(world, engine, genomes)
+    return count / (time.perf_counter() - begin)
+
+
+def walk_genomes(world, engine, genomes):
+    """
+    Walks and scores the chromosomes of the genomes.
+    :returns: None
+    """
+    if engine == const.VECTORIZED_ENGINE:
+        evaluate(world, genomes)
+    else:
+        for genome in genomes:
+            Chromosome(world, codes=genome.tobytes())
+
+
+def benchmark_generation(world, engine, populationFactor, generations, seed):
+    """
+    :returns: mean and minimal latency (seconds) of create_generation
+    """
+    seed_generators(seed, "generation", world.size)
+    ga = create_ga(world, engine, populationFactor)
+    latencies = []
+    for _ in range(generations):
+        begin = time.perf_counter()
+        ga.create_generation()
+        latencies.append(time.perf_counter() - begin)
+        ga.selection()
+    ga.close()
+    return sum(latencies) / len(latencies), min(latencies)
+
+
+def benchmark_solution(world, engine, populationFactor, seed):
+    """
+    :returns: seconds and generations until the GA stopped, whether a path was found and its fitness value
+    """
+    seed_generators(seed, "solution", world.size)
+    begin = time.perf_counter()
+    ga = create_ga(world, engine, populationFactor)
+    ga.start()
+    best = ga.bestChromosome
+    return time.perf_counter() - begin, ga.generation, best.destReached and not best.obstacles, best.fitness
+
+
+def run_suite(sizes, densities, engines, benchmarks, populationFactor, chromosomes, generations, seed):
+    """
+    Runs the benchmarks over all the combinations of world sizes, obstacle densities and engines.
+    :returns: list of results (dicts)
+    """
+    results = []
+    for size in sizes:
+        for density in densities:
+            for engine in engines:
+                world = create_world(size, density, seed)
+                result = {"size": size, "density": density, "engine": engine,
+                          "obstacles": world.obstacleCount, "manhattanDistance": world.manhattanDistance}
+                if "walk" in benchmarks:
+                    result["walkChromosomesPerSecond"] = benchmark_walk(world, engine, chromosomes, seed)
+                if "generation" in benchmarks:
+                    result["generationMeanSeconds"], result["generationMinSeconds"] = \
+                        benchmark_generation(world, engine, populationFactor, generations, seed)
+                if "solution" in benchmarks:
+                    result["solutionSeconds"], result["solutionGenerations"], result["solutionFound"], \
+                        result["solutionFitness"] = benchmark_solution(world, engine, populationFactor, seed)
+                print(json.dumps(result), file=sys.stderr)
+                results.append(result)
+    return results
+
+
+if __name__ == '__main__':
+    parser = arg.ArgumentParser(description="Run the benchmark suite and write the results as JSON.")
+    parser.add_argument("-s", "--sizes", help="World sizes separated by commas. Default=20,50,100",
+                        default="20,50,100", type=str)
+    parser.add_argument("-d", "--densities", help="Obstacle densities separated by commas. Default=0,0.05,0.2",
+                        default="0,0.05,0.2", type=str)
+    parser.add_argument("-en", "--engines", help="Engines separated by commas. Default={}"
+                        .format(",".join(const.ENGINES)), default=",".join(const.ENGINES), type=str)
+    parser.add_argument("-b", "--benchmarks", help="Benchmarks separated by commas. Default=walk,generation,solution",
+                        default="walk,generation,solution", type=str)
+    parser.add_argument("-p", "--population", help="Population size factor (of the world size). Default={}"
+                        .format(const.POPULATION_FACTOR), default=const.POPULATION_FACTOR, type=float)
+    parser.add_argument("-c", "--chromosomes", help="Chromosomes walked by the walk benchmark. Default=500",
+                        default=500, type=int)
+    parser.add_argument("-g", "--generations", help="Generations timed by the generation benchmark. Default=20",
+                        default=20, type=int)
+    parser.add_argument("-sd", "--seed", help="Seed of the benchmarks. Default=0", default=0, type=int)
+    parser.add_argument("-out", "--output", help="JSON file of the results. Default=stdout", type=str)
+    args = parser.parse_args()
+
+    results = run_suite(sizes=[int(x) for x in args.sizes.split(",")],
+                        densities=[float(x) for x in args.densities.split(",")],
+                        engines=args.engines.split(","),
+                        benchmarks=args.benchmarks.split(","),
+                        populationFactor=args.population,
+                        chromosomes=args.chromosomes,
+                        generations=args.generations,
+                        seed=args.seed)
+    report = {"meta": {"python": platform.python_version(),
+                       "numpy": numpy.__version__,
+                       "machine": platform.machine(),
+                       "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                       "arguments": vars(args)},
+              "results": results}
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
@@ -0,0 +1,87 @@
+"""
+Compares the survivor selection of a generation - partial selection of the fittest chromosomes (only the elite is
+sorted) against sorting the whole enlarged population twice (before and after the mutations).
+"""
+import argparse as arg
+import time
+import numpy
+
+import constants as const
+from genetic_algorithm import seed_generators
+from population import Population, random_genomes
+from selection import survivor_indices
+from world import World
+
+
+def full_sort(engine, population, size):
+    """
+    The survivor selection that sorts the whole population twice.
+    :returns: None
+    """
+    for _ in range(2):
+        if engine == const.VECTORIZED_ENGINE:
+            population = population.sorted(size)
+        else:
+            population = sorted(population, key=lambda x: x.fitness)[:size]
+
+
+def partial_selection(engine, population, size, elite):
+    """
+    The survivor selection that keeps the fittest chromosomes and sorts only the elite, twice.
+    :returns: None
+    """
+    for _ in range(2):
+        if engine == const.VECTORIZED_ENGINE:
+            population = population.take(survivor_indices(population.fitness, size, elite))
+        else:
+            fitness = numpy.array([chrom.fitness for chrom in population])
+            population = [population[index] for index in survivor_indices(fitness, size, elite).tolist()]
+
+
+def best_time(function, repeats):
+    """
+    :returns: the best time (in seconds) of calling the function
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        begin = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - begin)
+    return best
+
+
+if __name__ == '__main__':
+    parser = arg.ArgumentParser(description="Compare partial survivor selection with sorting the whole population.")
+    parser.add_argument("-s", "--size", help="World size. Default=50", default=50, type=int)
+    parser.add_argument("-p", "--population", help="Population sizes separated by commas. Default=1000,10000",
+                        default="1000,10000", type=str)
+    parser.add_argument("-pp", "--parents", help="Parents percentages separated by commas. Default=1,2,4,8",
+                        default="1,2,4,8", type=str)
+    parser.add_argument("-e", "--elite", help="Elite percentage. Default={}".format(const.DEFAULT_ELITE_PERCENTAGE),
+                        default=float(const.DEFAULT_ELITE_PERCENTAGE), type=float)
+    parser.add_argument("-en", "--engines", help="Engines separated by commas. Default={}"
+                        .format(",".join(const.ENGINES)), default=",".join(const.ENGINES), type=str)
+    parser.add_argument("-r", "--repeats", help="Number of repeats. Default=5", default=5, type=int)
+    parser.add_argument("-sd", "--seed", help="Seed of the populations. Default=0", default=0, type=int)
+    args = parser.parse_args()
+
+    seed_generators(args.seed, "world", args.size)
+    world = World(size=args.size, obstacles=0, cacheSize=0)
+    world.changeObstacles(args.size * args.size // 10)
+    print("{:>10} {:>10} {:>8} {:>10} {:>12} {:>12} {:>8}".format("engine", "population", "parents", "enlarged",
+                                                                  "full sort", "partial", "speedup"))
+    for engine in args.engines.split(","):
+        for populationSize in [int(x) for x in args.population.split(",")]:
+            for parentPercentage in [float(x) for x in args.parents.split(",")]:
+                seed_generators(args.seed, engine, populationSize, parentPercentage)
+                enlarged = populationSize + 2 * (int(populationSize * parentPercentage) // 2)
+                population = Population(world, random_genomes(enlarged, args.size * 2))
+                if engine != const.VECTORIZED_ENGINE:
+                    population = [population.chromosome(index) for index in range(enlarged)]
+                elite = int(populationSize * args.elite)
+                sortSeconds = best_time(lambda: full_sort(engine, population, populationSize), args.repeats)
+                partialSeconds = best_time(lambda: partial_selection(engine, population, populationSize, elite),
+                                           args.repeats)
+                print("{:>10} {:>10} {:>8} {:>10} {:>12.5f} {:>12.5f} {:>8.2f}"
+                      .format(engine, populationSize, parentPercentage, enlarged, sortSeconds, partialSeconds,
+                              sortSeconds / partialSeconds))
@@ -0,0 +1,43 @@
+"""
+Measures the cost of Chromosome.walk as the number of obstacles in the world grows.
+"""
+import argparse as arg
+import random
+import time
+
+import constants as const
+from chromosome import Chromosome
+from world import World
+
+
+def time_walks(world, paths, repeats):
+    """
+    Walks all the paths in the world.
+    :returns: the best time (in seconds) of a single walk
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        chromosomes = [Chromosome(world, path=list(path)) for path in paths]
+        begin = time.perf_counter()
+        for chromosome in chromosomes:
+            chromosome.walk()
+        best = min(best, (time.perf_counter() - begin) / len(paths))
+    return best
+
+
+if __name__ == '__main__':
+    parser = arg.ArgumentParser(description="Measure the walk cost for growing numbers of obstacles.")
+    parser.add_argument("-s", "--size", help="Size of the world. Default=100", default=100, type=int)
+    parser.add_argument("-d", "--densities", help="Obstacle densities separated by commas. Default=0,0.05,0.1,0.2,0.4",
+                        default="0,0.05,0.1,0.2,0.4", type=str)
+    parser.add_argument("-c", "--chromosomes", help="Number of walked chromosomes. Default=200", default=200, type=int)
+    parser.add_argument("-r", "--repeats", help="Number of repeats. Default=5", default=5, type=int)
+    args = parser.parse_args()
+
+    random.seed(0)
+    world = World(size=args.size, obstacles=0)
+    paths = [[random.choice(const.DIRECTIONS) for _ in range(args.size * 2)] for _ in range(args.chromosomes)]
+    print("{:>10} {:>16}".format("obstacles", "usec per walk"))
+    for density in [float(x) for x in args.densities.split(",")]:
+        world.changeObstacles(int(density * args.size * args.size))
+        print("{:>10} {:>16.1f}".format(world.obstacleCount, time_walks(world, paths, args.repeats) * 1e6))
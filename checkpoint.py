@@ -0,0 +1,234 @@
+"""
+Checkpoints of the genetic algorithm - the Checkpointer observer saves the state of the search periodically, and
+resume creates a GeneticSearchAlgorithm that continues a saved search.
+"""
+import json
+import os
+import random
+from threading import Condition, Thread
+import time
+import numpy
+
+import constants as const
+from genetic_algorithm import GeneticSearchAlgorithm
+from profiling import GenerationObserver
+from stats import StatsStore
+from world import World
+
+# Prefix of the names of the statistics' columns in a checkpoint
+STATS_PREFIX = "stats_"
+# Counters of the local search saved in a checkpoint
+LOCAL_SEARCH_COUNTERS = ("passes", "attempts", "changed", "improved", "removedMoves", "shortcuts", "seconds")
+
+
+def capture_state(ga):
+    """
+    Copies the state of the search - the population's genomes and fitness values, the generation, the stop counters,
+    the statistics of the generations, the window of the convergence controller, the counters of the local search,
+    the states of the random number generators, the world and the parameters.
+    The times of the controller's window are saved relative to the last generation, so a resumed search doesn't count
+    the time it was stopped.
+    :param ga: the GeneticSearchAlgorithm object
+    :returns: dict of arrays
+    """
+    world = ga.world
+    version, internalState, gaussNext = random.getstate()
+    name, keys, position, hasGauss, cachedGaussian = numpy.random.get_state()
+    parameters = {"populationSize": ga.populationSize,
+                  "mutationProbability": ga.controller.baseMutationProbability if ga.controller
+                  else ga.mutationProbability,
+                  "elitePercentage": ga.elitePercentage,
+                  "parentPercentage": ga.parentPercentage,
+                  "engine": ga.engine,
+                  "evaluationWorkers": ga.evaluationWorkers,
+                  "selectionMethod": ga.selectionMethod,
+                  "tournamentSize": ga.tournamentSize,
+                  "crossoverMethod": ga.crossoverMethod,
+                  "initializer": ga.initializer,
+                  "randomFraction": ga.randomFraction,
+                  "adaptive": ga.controller is not None,
+                  "localSearch": ga.localSearch is not None}
+    state = {"genomes": ga.genomes(numpy.arange(len(ga.population))),
+             "fitness": ga.fitness_values().copy(),
+             "generation": numpy.array(ga.generation),
+             "counters": numpy.array([ga.sameFittestGenerations, ga.samePopulationGenerations, ga.rewalkSteps,
+                                      ga.skippedSteps], dtype=numpy.int64),
+             "mutationProbability": numpy.array(ga.mutationProbability),
+             "randomState": numpy.array((version,) + internalState, dtype=numpy.uint64),
+             "randomGauss": numpy.array(numpy.nan if gaussNext is None else gaussNext),
+             "numpyRandomKeys": keys.copy(),
+             "numpyRandomState": numpy.array([position, hasGauss], dtype=numpy.int64),
+             "numpyRandomGauss": numpy.array(cachedGaussian),
+             "occupancy": numpy.array(world.obstacle_grid(), dtype=numpy.uint8),
+             "world": numpy.array((world.size,) + tuple(world.start) + tuple(world.dest), dtype=numpy.int64),
+             "parameters": numpy.frombuffer(json.dumps(parameters).encode(), dtype=numpy.uint8)}
+    state.update((STATS_PREFIX + name, column) for name, column in ga.stats.arrays().items())
+    if ga.controller:
+        controller = ga.controller
+        times = numpy.array(controller.times, dtype=float)
+        state.update(controllerBests=numpy.array(controller.bests, dtype=numpy.int64),
+                     controllerTimes=times - times[-1] if times.size else times,
+                     controllerVariances=numpy.array(controller.variances, dtype=float),
+                     controllerSums=numpy.array([controller.varianceSum, controller.diversity]))
+    if ga.localSearch:
+        state["localSearch"] = numpy.array([getattr(ga.localSearch, name) for name in LOCAL_SEARCH_COUNTERS],
+                                           dtype=float)
+    return state
+
+
+def write_checkpoint(path, state):
+    """
+    Writes a state to a checkpoint file atomically - a temporary file replaces the checkpoint when it's complete, so
+    a crash while writing leaves the previous checkpoint.
+    :param path: path of the checkpoint file
+    :param state: dict of arrays (see capture_state)
+    :returns: None
+    """
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as file:
+        numpy.savez(file, **state)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+
+def resume(path, observers=None, verbose=True, evaluationWorkers=None, cacheSize=const.FITNESS_CACHE_SIZE):
+    """
+    Creates a GA that continues the search saved in a checkpoint file - with the same world, population, counters,
+    statistics and random number generators, so the search goes on as if it had never stopped.
+    :param path: path of the checkpoint file
+    :param observers: observers of the GA
+    :param verbose: print the status of every generation
+    :param evaluationWorkers: number of processes evaluating the offspring (default - as in the saved search)
+    :param cacheSize: maximal number of paths in the fitness cache of the world
+    :returns: the GeneticSearchAlgorithm object
+    """
+    with numpy.load(path) as checkpoint:
+        state = {name: checkpoint[name] for name in checkpoint.files}
+    size, startY, startX, destY, destX = state["world"].tolist()
+    world = World(size, 0, cacheSize, occupancy=bytearray(state["occupancy"].tobytes()), start=(startY, startX),
+                  dest=(destY, destX))
+    parameters = json.loads(state["parameters"].tobytes().decode())
+    if evaluationWorkers is not None:
+        parameters["evaluationWorkers"] = evaluationWorkers
+    ga = GeneticSearchAlgorithm(world, observers=observers, verbose=verbose, initialGenomes=state["genomes"].copy(),
+                                **parameters)
+
+    ga.generation = int(state["generation"])
+    ga.sameFittestGenerations, ga.samePopulationGenerations, ga.rewalkSteps, ga.skippedSteps = \
+        state["counters"].tolist()
+    ga.mutationProbability = float(state["mutationProbability"])
+    if ga.controller:
+        ga.controller.mutationProbability = ga.mutationProbability
+    if ga.controller and "controllerBests" in state:
+        controller = ga.controller
+        now = time.perf_counter()
+        controller.bests.extend(state["controllerBests"].tolist())
+        controller.times.extend((now + state["controllerTimes"]).tolist())
+        controller.variances.extend(state["controllerVariances"].tolist())
+        controller.varianceSum, controller.diversity = state["controllerSums"].tolist()
+    if ga.localSearch and "localSearch" in state:
+        for name, value in zip(LOCAL_SEARCH_COUNTERS, state["localSearch"].tolist()):
+            setattr(ga.localSearch, name, value if name == "seconds" else int(value))
+    ga.stats = StatsStore.from_arrays({name[len(STATS_PREFIX):]: column for name, column in state.items()
+                                       if name.startswith(STATS_PREFIX)})
+
+    randomState = state["randomState"].tolist()
+    gaussNext = float(state["randomGauss"])
+    random.setstate((randomState[0], tuple(randomState[1:]), None if numpy.isnan(gaussNext) else gaussNext))
+    position, hasGauss = state["numpyRandomState"].tolist()
+    numpy.random.set_state(("MT19937", state["numpyRandomKeys"], position, hasGauss,
+                            float(state["numpyRandomGauss"])))
+    return ga
+
+
+class Checkpointer(GenerationObserver):
+    """
+    Observer of the GA that saves its state every interval generations and when it finishes.
+    The state is copied in the GA's loop and written by a background thread - if a new state is ready before the
+    previous one was written, only the newest state is written. The writer thread is stopped when the GA finishes and
+    started again if the GA is started again (e.g. after GeneticSearchAlgorithm.replan).
+    """
+    def __init__(self, path, interval=const.CHECKPOINT_SAVE_INTERVAL):
+        """
+        Constructor for class Checkpointer.
+        :param path: path of the checkpoint file
+        :param interval: number of generations between checkpoints
+        """
+        self.path = path
+        self.interval = interval
+        self.pending = None                 # State waiting to be written
+        self.closed = False
+        self.written = 0                    # Number of checkpoints written
+        self.condition = Condition()
+        self.writer = None
+        self.start_writer()
+
+    def start_writer(self):
+        """
+        Starts the writer thread.
+        :returns: None
+        """
+        self.closed = False
+        self.writer = Thread(target=self.write_states, daemon=True)
+        self.writer.start()
+
+    def write_states(self):
+        """
+        Writes the pending states until the checkpointer is closed (runs in the writer thread).
+        :returns: None
+        """
+        while True:
+            with self.condition:
+                while self.pending is None and not self.closed:
+                    self.condition.wait()
+                state, self.pending = self.pending, None
+            if state is None:
+                return
+            write_checkpoint(self.path, state)
+            self.written += 1
+
+    def save(self, ga):
+        """
+        Copies the state of the GA and passes it to the writer thread.
+        :param ga: the GeneticSearchAlgorithm object
+        :returns: None
+        """
+        state = capture_state(ga)
+        with self.condition:
+            self.pending = state
+            self.condition.notify()
+
+    def on_start(self, ga):
+        """
+        Starts the writer thread again if it was stopped when the GA finished before.
+        :returns: None
+        """
+        if self.closed:
+            self.start_writer()
+
+    def on_generation(self, ga, stats):
+        """
+        Saves the state every interval generations.
+        :returns: None
+        """
+        if ga.generation % self.interval == 0:
+            self.save(ga)
+
+    def on_finish(self, ga):
+        """
+        Saves the final state and waits until it's written.
+        :returns: None
+        """
+        self.save(ga)
+        self.close()
+
+    def close(self):
+        """
+        Writes the pending state and stops the writer thread.
+        :returns: None
+        """
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+        self.writer.join()
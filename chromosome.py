@@ -1,138 +1,286 @@
 """
 Includes the Chromosome class.
 """
-from random import choice, randint
+from array import array
+from random import randint, randrange
+import numpy
 import constants as const
 
+# Directions are stored as codes (their index in const.DIRECTIONS) packed 4 codes per byte (2 bits each)
+CODES = {direction: code for code, direction in enumerate(const.DIRECTIONS)}
+GENES_PER_BYTE = 4
+UNPACKED_BYTES = [bytes((value >> shift) & 3 for shift in range(0, 8, 2)) for value in range(256)]
+
+# Change of the coordinates for every direction code
+DELTA_Y = numpy.array([delta[0] for delta in const.DIRECTION_DELTAS], dtype=numpy.int64)
+DELTA_X = numpy.array([delta[1] for delta in const.DIRECTION_DELTAS], dtype=numpy.int64)
+
+# A checkpoint of the walk: y, x, revisited cells, obstacles and the number of every direction before the step
+CHECKPOINT_RECORD = 4 + len(const.DIRECTIONS)
+
+
+def pack_genome(codes):
+    """
+    Packs direction codes into a genome - 2 bits per direction.
+    :param codes: sequence of direction codes
+    :returns: the packed genome (bytes)
+    """
+    codes = bytes(codes) + bytes(-len(codes) % GENES_PER_BYTE)
+    return bytes(codes[i] | codes[i + 1] << 2 | codes[i + 2] << 4 | codes[i + 3] << 6
+                 for i in range(0, len(codes), GENES_PER_BYTE))
+
+
+def unpack_genome(genome, size):
+    """
+    Unpacks the direction codes of a genome.
+    :param genome: the packed genome
+    :param size: number of directions in the genome
+    :returns: bytearray of direction codes
+    """
+    return bytearray(b"".join([UNPACKED_BYTES[value] for value in genome])[:size])
+
 
 class Chromosome:
     """
     Represents a chromosome in the population.
     """
-    def __init__(self, world, path=None, size=0):
+    __slots__ = ("world", "genome", "size", "pathLength", "destReached", "obstacles", "fitness", "checkpoints")
+
+    def __init__(self, world, path=None, size=0, codes=None):
         """
         Constructor for class chromosome.
-        If a path is given - set this path to the chromosome.
+        If a path (list of directions) or direction codes are given - set this path to the chromosome.
         If not given a path - randomly create a path.
+        The fitness value is taken from the fitness cache of the world if the path was already walked.
         """
+        if path:
+            codes = [CODES[direction] for direction in path]
+        elif codes is None:
+            codes = self.create_path(size)
         self.world = world
-        self.path = path if path else self.create_path(size)        # The path the chromosome represents
+        self.size = len(codes)                                      # Number of directions in the path
+        self.genome = pack_genome(codes)                            # The path the chromosome represents (packed)
         self.pathLength = 0                                         # Length of the path
         self.destReached = False                                    # Is destination reached
-        self.history = []                                           # Visited cells by the path
         self.obstacles = False                                      # Does the path go through obstacles
-        self.fitness = self.fitness_func()                          # Fitness value of the chromosome
+        self.checkpoints = array("i")                               # Saved states of the walk
+        self.fitness = 0                                            # Fitness value of the chromosome
+        scores = world.fitnessCache.get(self.genome, self.size)
+        if scores:
+            self.fitness, self.pathLength, self.destReached, self.obstacles = scores
+        else:
+            self.fitness = self.fitness_func()
+            world.fitnessCache.put(self)
+
+    @property
+    def path(self):
+        """
+        :returns: the path of the chromosome (list of directions)
+        """
+        return [const.DIRECTIONS[code] for code in self.codes()]
+
+    @path.setter
+    def path(self, path):
+        """
+        Sets a new path (list of directions) to the chromosome.
+        """
+        self.size = len(path)
+        self.genome = pack_genome([CODES[direction] for direction in path])
+        # The saved states belong to the old path
+        self.checkpoints = array("i")
+        self.fitness = self.fitness_func()
+
+    @property
+    def history(self):
+        """
+        Computes the cells visited by the path (until the destination is reached).
+        :returns: list of the visited cells
+        """
+        current = self.world.start
+        history = [current]
+        for code in self.codes()[:self.pathLength]:
+            current = self.update_coordinates(current, code)
+            history.append(current)
+        return history
+
+    def codes(self):
+        """
+        :returns: bytearray of the direction codes of the path
+        """
+        return unpack_genome(self.genome, self.size)
 
     def create_path(self, size):
         """
         Creates a random path.
-        :returns: the path of the chromosome (list of direction)
+        :returns: the path of the chromosome (list of direction codes)
         """
-        path = []
-        for _ in range(size):
-            path.append(choice(const.DIRECTIONS))
-        return path
+        return [randrange(len(const.DIRECTIONS)) for _ in range(size)]
 
-    def fitness_func(self):
+    def fitness_func(self, index=0):
         """
         Calculate fitness as sum of the fallowing values:
             1. Length of the path (or path to destination).
             2. Number of the cells revisited.
             3. Number of obstacles * 10
             4. Number of opposite directions.
+            5. Distance to the destination (around the obstacles) if it isn't reached.
+        :param index: first direction that changed since the last walk (0 - walk the whole path)
         :returns: the fitness value of the chromosome
         """
-        current, revisitedCells, obstacles = self.walk()
+        current, revisitedCells, obstacles, oppositeDirections = self.walk(index)
         fitness = self.pathLength
         fitness += revisitedCells * const.REVISITED_CELL_PENALTY
         fitness += obstacles * const.OBSTACLE_PENALTY
-        fitness += self.count_opposite_directions() * const.OPPOSITE_DIRECTIONS_PENALTY
+        fitness += oppositeDirections * const.OPPOSITE_DIRECTIONS_PENALTY
         if not self.destReached:
-            fitness += self.manhattan_distance(current, self.world.dest)
+            fitness += self.world.remaining_distance(current)
         return fitness
 
-    def walk(self):
+    def rescore(self, index):
+        """
+        Recalculates the fitness value after the direction in the index changed.
+        The path is walked again from the last checkpoint before the index.
+        :param index: index of the changed direction
+        :returns: number of steps that weren't walked again (compared with walking the whole path)
+        """
+        if self.destReached and index >= self.pathLength:
+            return self.pathLength
+        skipped = self.last_checkpoint(index)
+        self.fitness = self.fitness_func(index)
+        return skipped
+
+    def last_checkpoint(self, index):
+        """
+        :param index: index of a direction in the path
+        :returns: index of the last saved state of the walk before the direction (0 - walk the whole path, also when
+                  the state is too close to the start to be worth rebuilding the visited cells)
+        """
+        saved = len(self.checkpoints) // CHECKPOINT_RECORD
+        if not saved:
+            return 0
+        checkpoint = min(index // const.CHECKPOINT_INTERVAL, saved - 1) * const.CHECKPOINT_INTERVAL
+        return checkpoint if checkpoint >= const.MIN_RESUMED_STEPS else 0
+
+    def visited_cells(self, codes, steps):
+        """
+        Creates a bitmap of the cells visited in the first steps of the path.
+        The cells are marked through a NumPy view of the bitmap, so it's allocated once (like in a full walk) and
+        never copied.
+        :param codes: the direction codes of the path (inside the boundaries of the grid)
+        :param steps: number of steps
+        :returns: the bitmap (bytearray)
+        """
+        size = self.world.size
+        startY, startX = self.world.start
+        moves = numpy.frombuffer(codes, dtype=numpy.uint8, count=steps)
+        cells = (startY + numpy.cumsum(DELTA_Y[moves])) * size + startX + numpy.cumsum(DELTA_X[moves])
+        visited = bytearray(size * size)
+        bitmap = numpy.frombuffer(visited, dtype=numpy.uint8)
+        bitmap[cells] = 1
+        bitmap[startY * size + startX] = 1
+        return visited
+
+    def walk(self, index=0):
         """
         1. Checks if destination is reached.
         2. If reached - returns the number of steps to destination.
         3. Counts obstacles visited by the path.
         4. Counts number of cells out of the grid boundaries.
-        :returns: the current cell (or the destination cell if reached), number of cells revisited
-                  and number of obstacles visited.
+        Every CHECKPOINT_INTERVAL steps the state of the walk is saved, so after a change in the path only the
+        steps from the last checkpoint before the change are walked again.
+        :param index: first direction that changed since the last walk (0 - walk the whole path)
+        :returns: the current cell (or the destination cell if reached), number of cells revisited,
+                  number of obstacles visited and number of opposite directions.
         """
-        dest = self.world.dest
-        current = self.world.start
-        revisitedCells = 0
-        obstacles = 0
-        self.history = [self.world.start]
-        for index in range(len(self.path)):
+        destY, destX = self.world.dest
+        size = self.world.size
+        occupancy = self.world.occupancy
+        codes = self.codes()
+        fixed = False
+        first = self.last_checkpoint(index)
+        if first:
+            # Continue from the saved state
+            record = (first // const.CHECKPOINT_INTERVAL) * CHECKPOINT_RECORD
+            currentY, currentX, revisitedCells, obstacles = self.checkpoints[record:record + 4]
+            counts = self.checkpoints[record + 4:record + CHECKPOINT_RECORD].tolist()
+            del self.checkpoints[record:]
+            visited = self.visited_cells(codes, first)
+        else:
+            currentY, currentX = self.world.start
+            revisitedCells = 0
+            obstacles = 0
+            counts = [0] * len(const.DIRECTIONS)
+            self.checkpoints = array("i")
+            visited = bytearray(size * size)        # Bitmap of the visited cells
+            visited[currentY * size + currentX] = 1
+        checkpoint = first
+        self.pathLength = len(codes)
+        self.destReached = False
+        for index in range(first, len(codes)):
+            # Save the state of the walk
+            if index % const.CHECKPOINT_INTERVAL == 0:
+                for code in range(len(counts)):
+                    counts[code] += codes.count(code, checkpoint, index)
+                checkpoint = index
+                self.checkpoints.extend((currentY, currentX, revisitedCells, obstacles))
+                self.checkpoints.extend(counts)
+
             # Update the current position
-            current = self.update_coordinates(current, index)
+            deltaY, deltaX = const.DIRECTION_DELTAS[codes[index]]
+            newY, newX = currentY + deltaY, currentX + deltaX
 
             # Check if path exits the bounds of the grid
-            currentY, currentX = current
-            while currentX >= self.world.size or currentX < 0 or currentY >= self.world.size or currentY < 0:
-                current = self.fix_direction(current, index)
-                currentY, currentX = current
+            while newX >= size or newX < 0 or newY >= size or newY < 0:
+                codes[index] = self.fix_direction(codes[index])
+                deltaY, deltaX = const.DIRECTION_DELTAS[codes[index]]
+                newY, newX = currentY + deltaY, currentX + deltaX
+                fixed = True
+            currentY, currentX = newY, newX
 
             # Check if any cell is revisited
-            if current in self.history:
+            cell = currentY * size + currentX
+            if visited[cell]:
                 revisitedCells += 1
-            self.history.append(current)
+            else:
+                visited[cell] = 1
 
             # Check if destination is reached
-            if currentY == dest[0] and currentX == dest[1]:
+            if currentY == destY and currentX == destX:
                 self.destReached = True
+                self.pathLength = index + 1
                 break
 
             # Check if on obstacle
-            if current in self.world.obstaclesList:
+            if occupancy[cell]:
                 obstacles += 1
 
-        self.pathLength = len(self.history) - 1
-        if obstacles > 0:
-            self.obstacles = True
-        return current, revisitedCells, obstacles
+        if fixed:
+            self.genome = pack_genome(codes)
+        self.obstacles = obstacles > 0
+        up, down, left, right = (counts[code] + codes.count(code, checkpoint, self.pathLength)
+                                 for code in range(len(counts)))
+        return (currentY, currentX), revisitedCells, obstacles, min(up, down) + min(left, right)
 
-    def update_coordinates(self, current, index):
+    @staticmethod
+    def update_coordinates(current, code):
         """
         Updates the coordinates according to the direction.
         :param current: current coordinates
-        :param index: index of the direction
+        :param code: code of the direction
         :return: new coordinates
         """
         currentY, currentX = current
-        direction = self.path[index]
-        if direction == "Up":
-            currentY += 1
-        elif direction == "Down":
-            currentY -= 1
-        elif direction == "Left":
-            currentX -= 1
-        else:
-            currentX += 1
-        return (currentY, currentX)
+        deltaY, deltaX = const.DIRECTION_DELTAS[code]
+        return (currentY + deltaY, currentX + deltaX)
 
-    def fix_direction(self, current, index):
+    @staticmethod
+    def fix_direction(code):
         """
         Fixes direction in the path if it exits the boundaries of the grid.
-        :param current: current coordinates
-        :param index: index of the direction
-        :returns: new coordinates
+        :param code: code of the direction
+        :returns: code of a different random direction
         """
-        direction = self.path[index]
-        currentY, currentX = current
-        if direction == "Up":
-            currentY -= 1
-        elif direction == "Down":
-            currentY += 1
-        elif direction == "Left":
-            currentX += 1
-        else:
-            currentX -= 1
-        self.path[index] = choice([d for d in const.DIRECTIONS if d != direction])
-        new = (currentY, currentX)
-        return self.update_coordinates(new, index)
+        return (code + randint(1, len(const.DIRECTIONS) - 1)) % len(const.DIRECTIONS)
 
     def count_opposite_directions(self):
         """
@@ -140,19 +288,35 @@ class Chromosome:
         If number of opposite directions is high - the path may have redundant actions.
         :returns: sum of minimal number between "up" and "south" directions and "left" and "right" directions.
         """
-        actualPath = self.path[:self.pathLength]
-        upDown = min([actualPath.count("Up"), actualPath.count("Down")])
-        rightLeft = min([actualPath.count("Right"), actualPath.count("Left")])
-        return upDown + rightLeft
+        actualPath = unpack_genome(self.genome, self.pathLength)
+        up, down, left, right = (actualPath.count(code) for code in range(len(const.DIRECTIONS)))
+        return min(up, down) + min(left, right)
 
     def mutate(self):
         """
         Performs mutation on a chromosome.
-        Randomly changes the direction in a random point in the path.
+        Randomly changes the direction in a random point in the path and recalculates the fitness value.
+        :returns: number of steps that weren't walked again (compared with walking the whole path)
+        """
+        index = randint(0, self.size - 1)
+        code = randrange(len(const.DIRECTIONS))
+        if unpack_genome(self.genome, index + 1)[index] == code:
+            return self.pathLength
+        self.set_gene(index, code)
+        return self.rescore(index)
+
+    def set_gene(self, index, code):
+        """
+        Sets the direction in a point in the path.
+        :param index: index of the direction
+        :param code: code of the new direction
         :returns: None
         """
-        index = randint(0, len(self.path)-1)
-        self.path[index] = choice(const.DIRECTIONS)
+        genome = bytearray(self.genome)
+        byte, position = divmod(index, GENES_PER_BYTE)
+        shift = position * 2
+        genome[byte] = genome[byte] & ~(3 << shift) | code << shift
+        self.genome = bytes(genome)
 
     def __str__(self):
         """
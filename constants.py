@@ -7,15 +7,80 @@ POPULATION_FACTOR = 1.5
 DEFAULT_MUTATION_PROBABILITY = "0.4"
 DEFAULT_ELITE_PERCENTAGE = "0.05"
 DEFAULT_PARENTS_PERCENTAGE = "1"
+OBJECT_ENGINE = "object"
+VECTORIZED_ENGINE = "vectorized"
+ENGINES = [OBJECT_ENGINE, VECTORIZED_ENGINE]
+DEFAULT_ENGINE = OBJECT_ENGINE
+ROULETTE_SELECTION = "roulette"
+SUS_SELECTION = "sus"
+TOURNAMENT_SELECTION = "tournament"
+SELECTION_METHODS = [ROULETTE_SELECTION, SUS_SELECTION, TOURNAMENT_SELECTION]
+DEFAULT_SELECTION = ROULETTE_SELECTION
+DEFAULT_TOURNAMENT_SIZE = 3
+UNIFORM_CROSSOVER = "uniform"
+SINGLE_POINT_CROSSOVER = "single-point"
+TWO_POINT_CROSSOVER = "two-point"
+CROSSOVER_METHODS = [UNIFORM_CROSSOVER, SINGLE_POINT_CROSSOVER, TWO_POINT_CROSSOVER]
+DEFAULT_CROSSOVER = UNIFORM_CROSSOVER
+RANDOM_INITIALIZER = "random"
+BIASED_INITIALIZER = "biased"
+GREEDY_INITIALIZER = "greedy"
+INITIALIZERS = [RANDOM_INITIALIZER, BIASED_INITIALIZER, GREEDY_INITIALIZER]
+DEFAULT_INITIALIZER = RANDOM_INITIALIZER
+DEFAULT_RANDOM_FRACTION = 0.2
+
+# Island model default parameters
+RING_TOPOLOGY = "ring"
+FULL_TOPOLOGY = "full"
+TOPOLOGIES = [RING_TOPOLOGY, FULL_TOPOLOGY]
+DEFAULT_ISLANDS = 1
+DEFAULT_MIGRATION_INTERVAL = 10
+DEFAULT_MIGRANTS = 2
 
 # GA constants
 DIRECTIONS = ["Up", "Down", "Left", "Right"]
+DIRECTION_DELTAS = [(1, 0), (-1, 0), (0, -1), (0, 1)]     # (y, x) change of every direction in DIRECTIONS
 SAME_FITTEST_MAX_GENERATIONS = 150
 SAME_POPULATION_MAX_GENERATIONS = 50
 REVISITED_CELL_PENALTY = 1
 OBSTACLE_PENALTY = 10
 OPPOSITE_DIRECTIONS_PENALTY = 1
+EVALUATION_BLOCK_CELLS = 1 << 24  # Visited cells kept at once by the vectorized walk (rows walked together * steps)
+CHECKPOINT_INTERVAL = 32        # Number of steps between saved states of a chromosome's walk
+MIN_RESUMED_STEPS = 64          # Fewer skipped steps don't pay for rebuilding the visited cells (a full walk is used)
+FITNESS_CACHE_SIZE = 50000      # Maximal number of paths in the fitness cache of a world
+FITNESS_CACHE_MAX_PROBES = 8    # Maximal number of prefix lengths checked when looking for a path in the cache
+LOG_BUFFER_SIZE = 1 << 16       # Buffer size (bytes) of the generations log file
+CHECKPOINT_SAVE_INTERVAL = 50   # Generations between saved checkpoints of a search
+WORLD_FILE_MAGIC = b"GAWORLD1"  # First bytes of a world file
+UNREACHABLE = -1                # Distance field value of obstacles and of cells without a path to the destination
+DISTANCE_FIELD_REBUILD = 8      # Rebuild the distance field when more than 1/8 of the cells is affected by a change
+INITIALIZER_BIAS = 0.5          # Probability of a step towards the destination in a biased initial path
+GREEDY_EXPLORATION = 0.1        # Probability of a random step in a greedy initial path
+CONVERGENCE_WINDOW = 50         # Generations in the window of the convergence controller
+MIN_IMPROVEMENT_RATE = 0.05     # Improvement of the best fitness value per second below which the GA converged -
+                                # fitness values are integers, so while the window lasts less than 1 / rate = 20
+                                # seconds this means no improvement in CONVERGENCE_WINDOW generations
+DIVERSITY_SAMPLE = 16           # Pairs of chromosomes compared to estimate the genotype diversity
+LOW_DIVERSITY = 0.1             # Diversity below which the mutation probability is raised
+HIGH_DIVERSITY = 0.3            # Diversity above which the mutation probability returns to its initial value
+MUTATION_INCREASE = 1.5
+MUTATION_DECREASE = 0.9
+MAX_MUTATION_PROBABILITY = 1.0
+QUERY_DISTANCE_FIELDS = 64      # Distance fields of query destinations cached by a world
+WARM_START_FRACTION = 0.5       # Part of a query's initial population created from the paths of nearby queries
+WARM_START_NEIGHBOURS = 4       # Number of nearby solved queries whose paths warm start a query
+STATS_CAPACITY = 1024           # Generations the statistics arrays hold before they grow
+STATS_PERCENTILES = (25, 50, 75)    # Percentiles of the fitness values recorded in every generation
 
 # Gui and graphs constants
 CELL_SIZE = 10
+MAX_IMAGE_SIZE = 2000           # Pixels of the side of a world's image - bigger worlds get smaller cells
+EMPTY_COLOR = (255, 255, 255)   # Colors of the cells in the images of the worlds (RGB)
+OBSTACLE_COLOR = (0, 0, 0)
+PATH_COLOR = (255, 255, 0)
+START_COLOR = (0, 255, 0)
+DEST_COLOR = (255, 0, 0)
+BORDER_COLOR = (0, 0, 0)
+PNG_COMPRESSION = 6             # zlib level of the PNG images
 COLORS = ["red", "green", "blue", "brown", "purple", "pink", "gray", "olive", "cyan", "orange", "yellow"]
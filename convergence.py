@@ -0,0 +1,105 @@
+"""
+Includes the ConvergenceController class - adapts the mutation probability of the GA and decides when it stops.
+"""
+from collections import deque
+import time
+import constants as const
+
+
+class ConvergenceController:
+    """
+    Keeps statistics of a window of the last generations of the GA:
+        1. Improvement rate - how much the best fitness value improved per second over the window.
+        2. Fitness variance - the average variance of the population's fitness values over the window.
+        3. Genotype diversity - part of the directions that differ between pairs of chromosomes of the population.
+    Every statistic is updated in O(1) per generation (the values the GA recorded for the generation, running sums
+    of the window). When the diversity collapses the mutation probability is raised, and when the diversity recovers it
+    returns towards its initial value. The GA stops when the improvement rate drops below the threshold and raising
+    the mutation probability can't help anymore.
+    """
+    def __init__(self, mutationProbability, window=const.CONVERGENCE_WINDOW,
+                 minImprovementRate=const.MIN_IMPROVEMENT_RATE):
+        """
+        Constructor for class ConvergenceController.
+        :param mutationProbability: initial mutation probability of the GA
+        :param window: number of generations in the window of the statistics
+        :param minImprovementRate: improvement of the best fitness value per second that is too slow to continue
+        """
+        self.baseMutationProbability = mutationProbability
+        self.mutationProbability = mutationProbability
+        self.window = window
+        self.minImprovementRate = minImprovementRate
+        self.bests = deque(maxlen=window + 1)       # Best fitness values of the window
+        self.times = deque(maxlen=window + 1)       # Times of the generations of the window
+        self.variances = deque(maxlen=window)       # Fitness variances of the window
+        self.varianceSum = 0.0                      # Sum of the variances of the window
+        self.diversity = 1.0                        # Genotype diversity of the last generation
+
+    def update(self, ga):
+        """
+        Adds the statistics of the last generation of the GA and adapts its mutation probability - the variance and
+        the diversity are taken from the statistics the GA recorded for the generation (update_data runs first).
+        :param ga: the GeneticSearchAlgorithm object
+        :returns: None
+        """
+        self.bests.append(ga.bestChromosome.fitness)
+        self.times.append(time.perf_counter())
+        if len(self.variances) == self.window:
+            self.varianceSum -= self.variances[0]
+        variance = ga.stats.column("std")[-1].item() ** 2
+        self.variances.append(variance)
+        self.varianceSum += variance
+        self.diversity = ga.stats.column("diversity")[-1].item()
+
+        # Raise the mutation probability when the diversity collapses, else return towards the initial value
+        if self.diversity < const.LOW_DIVERSITY:
+            self.mutationProbability = min(self.mutationProbability * const.MUTATION_INCREASE,
+                                           const.MAX_MUTATION_PROBABILITY)
+        elif self.diversity > const.HIGH_DIVERSITY:
+            self.mutationProbability = max(self.mutationProbability * const.MUTATION_DECREASE,
+                                           self.baseMutationProbability)
+        ga.mutationProbability = self.mutationProbability
+
+    def reset(self):
+        """
+        Clears the window (e.g. after the world changed) - the mutation probability is kept.
+        :returns: None
+        """
+        self.bests.clear()
+        self.times.clear()
+        self.variances.clear()
+        self.varianceSum = 0.0
+
+    def improvement_rate(self):
+        """
+        :returns: improvement of the best fitness value per second over the window (infinite until the window is
+                  full)
+        """
+        if len(self.bests) <= self.window:
+            return float("inf")
+        seconds = self.times[-1] - self.times[0]
+        return (self.bests[0] - self.bests[-1]) / seconds if seconds > 0 else float("inf")
+
+    def average_variance(self):
+        """
+        :returns: average variance of the fitness values over the window
+        """
+        return self.varianceSum / len(self.variances) if self.variances else 0.0
+
+    def converged(self):
+        """
+        :returns: True if the best fitness value improves too slowly, and the diversity isn't collapsed or the
+                  mutation probability is already at its maximum
+        """
+        if self.improvement_rate() >= self.minImprovementRate:
+            return False
+        return self.diversity >= const.LOW_DIVERSITY or self.mutationProbability >= const.MAX_MUTATION_PROBABILITY
+
+    def stats(self):
+        """
+        :returns: dict of the statistics of the window
+        """
+        return {"improvementRate": self.improvement_rate(),
+                "variance": self.average_variance(),
+                "diversity": self.diversity,
+                "mutationProbability": self.mutationProbability}
@@ -0,0 +1,49 @@
+"""
+Crossover operators of the GA. Every operator works on all the pairs of parents at once - the genomes of the first
+and the second parents are matrices of direction codes (a row for every pair), and the children are returned as one
+genomes matrix ready to be evaluated.
+"""
+import numpy
+import constants as const
+
+
+def uniform_mask(pairs, length):
+    """
+    :returns: mask of the genes taken from the first parent - every gene is chosen at random
+    """
+    return numpy.random.random((pairs, length)) < 0.5
+
+
+def single_point_mask(pairs, length):
+    """
+    :returns: mask of the genes taken from the first parent - the genes before a random point of every pair
+    """
+    points = numpy.random.randint(1, length, size=(pairs, 1)) if length > 1 else numpy.ones((pairs, 1), dtype=int)
+    return numpy.arange(length) < points
+
+
+def two_point_mask(pairs, length):
+    """
+    :returns: mask of the genes taken from the first parent - all the genes but a random segment of every pair
+    """
+    points = numpy.sort(numpy.random.randint(0, length + 1, size=(pairs, 2)), axis=1)
+    genes = numpy.arange(length)
+    return (genes < points[:, :1]) | (genes >= points[:, 1:])
+
+
+MASKS = {const.UNIFORM_CROSSOVER: uniform_mask,
+         const.SINGLE_POINT_CROSSOVER: single_point_mask,
+         const.TWO_POINT_CROSSOVER: two_point_mask}
+
+
+def crossover(method, parents1, parents2):
+    """
+    Performs crossovers between pairs of parents. Every pair has 2 children - the first gets the genes of the mask
+    from the first parent and the rest from the second parent, and the second child gets the opposite genes.
+    :param method: uniform, single-point or two-point
+    :param parents1: matrix of the direction codes of the first parents
+    :param parents2: matrix of the direction codes of the second parents
+    :returns: matrix of the direction codes of the children (the first children and then the second children)
+    """
+    mask = MASKS[method](*parents1.shape)
+    return numpy.concatenate((numpy.where(mask, parents1, parents2), numpy.where(mask, parents2, parents1)))
@@ -0,0 +1,106 @@
+"""
+Includes the FitnessCache class.
+"""
+from collections import OrderedDict
+import constants as const
+from chromosome import GENES_PER_BYTE
+
+
+class FitnessCache:
+    """
+    LRU cache of the fitness values of walked paths.
+    A path that reaches the destination is stored by its prefix until the destination (the rest of the path doesn't
+    change its fitness), other paths are stored by the whole path.
+    Only paths that are inside the boundaries of the grid are stored, so a cached path is walked the same way every
+    time and gets the same fitness value.
+    """
+    def __init__(self, maxSize=const.FITNESS_CACHE_SIZE):
+        """
+        Constructor for class FitnessCache.
+        :param maxSize: maximal number of cached paths (0 disables the cache)
+        """
+        self.maxSize = maxSize
+        self.entries = OrderedDict()    # (length, packed path) -> (fitness, path length, destination reached, obstacles)
+        self.lengths = OrderedDict()    # Length of the cached prefixes -> number of cached prefixes with this length
+        self.hits = 0                   # Number of paths found in the cache
+        self.misses = 0                 # Number of paths not found in the cache
+
+    def __len__(self):
+        """
+        :returns: number of cached paths
+        """
+        return len(self.entries)
+
+    @staticmethod
+    def key(genome, length):
+        """
+        Creates the key of the first directions of a packed path.
+        :param genome: the packed path
+        :param length: number of directions
+        :returns: the key
+        """
+        full, rest = divmod(length, GENES_PER_BYTE)
+        if not rest:
+            return length, genome[:full]
+        return length, genome[:full] + bytes([genome[full] & ((1 << rest * 2) - 1)])
+
+    def get(self, genome, size):
+        """
+        Finds the scores of a path. Checks the whole path, and the prefixes of the path with the lengths of the
+        recently cached paths that reach the destination.
+        :param genome: the packed path
+        :param size: number of directions in the path
+        :returns: fitness value, path length, destination reached and obstacles - or None if not cached
+        """
+        if not self.maxSize:
+            return None
+        scores = self.entries.get((size, genome))
+        if scores is None:
+            for probe, length in enumerate(reversed(self.lengths)):
+                if probe == const.FITNESS_CACHE_MAX_PROBES:
+                    break
+                if length < size:
+                    scores = self.entries.get(self.key(genome, length))
+                    if scores is not None:
+                        self.lengths.move_to_end(length)
+                        break
+        if scores is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(self.key(genome, scores[1]) if scores[2] else (size, genome))
+        return scores
+
+    def put(self, chromosome):
+        """
+        Stores the scores of a walked chromosome. Removes the least recently used path if the cache is full.
+        :param chromosome: the Chromosome object
+        :returns: None
+        """
+        if not self.maxSize:
+            return
+        if chromosome.destReached:
+            key = self.key(chromosome.genome, chromosome.pathLength)
+        else:
+            key = (chromosome.size, chromosome.genome)
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return
+        self.entries[key] = (chromosome.fitness, chromosome.pathLength, chromosome.destReached, chromosome.obstacles)
+        if chromosome.destReached:
+            self.lengths[key[0]] = self.lengths.get(key[0], 0) + 1
+            self.lengths.move_to_end(key[0])
+        if len(self.entries) > self.maxSize:
+            (length, _), scores = self.entries.popitem(last=False)
+            if scores[2]:
+                self.lengths[length] -= 1
+                if not self.lengths[length]:
+                    del self.lengths[length]
+
+    def clear(self):
+        """
+        Removes all the cached paths (the statistics are kept).
+        :returns: None
+        """
+        self.entries.clear()
+        self.lengths.clear()
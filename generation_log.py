@@ -0,0 +1,90 @@
+"""
+Includes the JsonlLogger class - writes a JSON Lines record of every generation in a background thread.
+"""
+import json
+from queue import SimpleQueue
+from threading import Thread
+import constants as const
+from profiling import GenerationObserver
+
+
+class JsonlLogger(GenerationObserver):
+    """
+    Observer of the GA that logs a compact record of every generation (generation, min, average and max fitness
+    values, best fitness value and seconds) as JSON Lines.
+    The records are written by a background thread through a buffered file, so logging doesn't block the GA. The log
+    is closed when the GA finishes and opened again if the GA is started again (e.g. after a re-plan).
+    """
+    def __init__(self, path, run=None):
+        """
+        Constructor for class JsonlLogger.
+        :param path: path of the log file (appended to)
+        :param run: name of the run added to every record
+        """
+        self.path = path
+        self.run = run
+        self.file = None
+        self.records = SimpleQueue()        # Records waiting to be written (None - stop the writer)
+        self.writer = None
+        self.start_writer()
+
+    def start_writer(self):
+        """
+        Opens the log file and starts the writer thread.
+        :returns: None
+        """
+        self.file = open(self.path, "a", buffering=const.LOG_BUFFER_SIZE)
+        self.writer = Thread(target=self.write_records, daemon=True)
+        self.writer.start()
+
+    def write_records(self):
+        """
+        Writes the records of the queue until the logger is closed (runs in the writer thread).
+        :returns: None
+        """
+        while True:
+            record = self.records.get()
+            if record is None:
+                break
+            self.file.write(json.dumps(record, separators=(",", ":")))
+            self.file.write("\n")
+        self.file.close()
+
+    def on_start(self, ga):
+        """
+        Opens the log file again if it was closed when the GA finished before.
+        :returns: None
+        """
+        if not self.writer.is_alive():
+            self.start_writer()
+
+    def on_generation(self, ga, stats):
+        """
+        Queues the record of the generation.
+        :returns: None
+        """
+        record = {"generation": stats["generation"],
+                  "min": stats["min"],
+                  "avg": stats["avg"],
+                  "max": stats["max"],
+                  "best": stats["best"],
+                  "seconds": stats["seconds"]}
+        if self.run is not None:
+            record["run"] = self.run
+        self.records.put(record)
+
+    def on_finish(self, ga):
+        """
+        Writes the waiting records and closes the log file when the GA finishes.
+        :returns: None
+        """
+        self.close()
+
+    def close(self):
+        """
+        Writes the waiting records and closes the log file.
+        :returns: None
+        """
+        if self.writer.is_alive():
+            self.records.put(None)
+            self.writer.join()
@@ -1,36 +1,103 @@
 """
 Includes the Genetic Algorithm class.
 """
-from random import choice, random
+from random import random, seed as random_seed
+import zlib
 import numpy
 import constants as const
 from chromosome import Chromosome
+from convergence import ConvergenceController
+from crossover import crossover
+from initializers import initial_genomes
+from local_search import LocalSearch
+from population import Population
+from profiling import NullProfiler, PhaseProfiler
+from replanning import visitation_index, visiting_rows, walked_cells
+from selection import pair_parents, select_parents, survivor_indices
+from stats import StatsStore
+
+
+def seed_generators(*parts):
+    """
+    Seeds the random number generators (random and numpy.random) with a seed created from the parts.
+    :returns: None
+    """
+    seed = "-".join(str(part) for part in parts)
+    random_seed(seed)
+    numpy.random.seed(zlib.crc32(seed.encode()))
 
 
 class GeneticSearchAlgorithm:
     """
     Genetic algorithm
     """
-    def __init__(self, world, populationSize, mutationProbability, elitePercentage, parentPercentage):
+    def __init__(self, world, populationSize, mutationProbability, elitePercentage, parentPercentage,
+                 engine=const.DEFAULT_ENGINE, evaluationWorkers=1, observers=None, verbose=True,
+                 selectionMethod=const.DEFAULT_SELECTION, tournamentSize=const.DEFAULT_TOURNAMENT_SIZE,
+                 crossoverMethod=const.DEFAULT_CROSSOVER, initializer=const.DEFAULT_INITIALIZER,
+                 randomFraction=const.DEFAULT_RANDOM_FRACTION, adaptive=False, initialGenomes=None,
+                 localSearch=False):
         """
         Constructor for GA class.
+        The engine decides how the population is stored:
+            1. object - a list of Chromosome objects, each walks its own path.
+            2. vectorized - a Population object, all the chromosomes are walked at once with array operations.
+        With the vectorized engine, the offspring of every generation can be evaluated by a pool of evaluationWorkers
+        processes.
+        Observers (GenerationObserver objects) get the statistics and the phase times of every generation - the phases
+        are timed only when there are observers.
+        If not verbose - the GA doesn't print its status (quiet mode).
+        The parents are chosen by the selection method - roulette, sus (stochastic universal sampling) or tournament
+        (of tournamentSize chromosomes), see the selection module.
+        The children are created by the crossover method - uniform, single-point or two-point, see the crossover
+        module.
+        The initial paths are created by the initializer - random, biased (towards the destination) or greedy (on the
+        distance field of the world), with a randomFraction of random paths, see the initializers module.
+        If adaptive - a ConvergenceController adapts the mutation probability and replaces the stop conditions of the
+        same fittest chromosome and the same population's fitness values.
+        If localSearch - the paths of the elite group are improved by a local search in every generation (loops and
+        detours are cut out), see the local_search module.
+        If initialGenomes are given (e.g. of a checkpoint or of a warm start) - they are the initial population (a saved
+        population keeps its order).
         :return:
         """
         # Parameters
         self.populationSize = int(populationSize)                       # Size of the population
         self.mutationProbability = mutationProbability                  # Probability for a mutation
+        self.elitePercentage = elitePercentage
+        self.parentPercentage = parentPercentage
         self.eliteSize = int(self.populationSize * elitePercentage)     # Size of the elite group
         self.parentSize = int(self.populationSize * parentPercentage)   # Size of the parents group
+        self.engine = engine                                            # Representation of the population
+        self.verbose = verbose                                          # Print the status of every generation
+        self.selectionMethod = selectionMethod                          # How the parents are chosen
+        self.tournamentSize = tournamentSize                            # Size of a tournament of the selection
+        self.crossoverMethod = crossoverMethod                          # How the children are created
+        self.initializer = initializer                                  # How the initial paths are created
+        self.randomFraction = randomFraction                            # Part of the initial paths that are random
 
         self.world = world                          # The World object where the GA searches paths
         self.generation = 0                         # Generation of the GA
         self.sameFittestGenerations = 0             # How many generations the best chromosome hasn't changed
         self.samePopulationGenerations = 0          # How many generations the population's fitness values are equal
+        self.rewalkSteps = 0                        # Steps of full walks needed to rescore the mutated chromosomes
+        self.skippedSteps = 0                       # Steps of those walks skipped thanks to the walk checkpoints
+        self.cacheHits = self.world.fitnessCache.hits       # Fitness cache statistics before the GA started
+        self.cacheMisses = self.world.fitnessCache.misses
         self.chromosomeSize = self.world.size * 2   # Size of the chromosome
         self.population = None                      # The GA's population
         self.bestChromosome = None                  # The chromosome with the highest fitness value
-        self.create_population()
-        self.data = {}                              # Data about the fitness values in every generation
+        self.controller = ConvergenceController(mutationProbability) if adaptive else None   # Adaptive stopping
+        self.localSearch = LocalSearch() if localSearch else None     # Improves the paths of the elite
+        self.observers = []                         # Notified about the progress of the GA
+        self.profiler = NullProfiler()              # Times the phases of every generation
+        for observer in observers or []:
+            self.add_observer(observer)
+        self.evaluator = None                       # Evaluates the offspring in a pool of processes
+        self.evaluationWorkers = evaluationWorkers
+        self.create_evaluator()
+        self.create_population(initialGenomes)
+        self.stats = StatsStore()                   # Statistics of the fitness values in every generation
         self.update_data()
 
     def start(self):
@@ -44,37 +111,36 @@ class GeneticSearchAlgorithm:
             3. Return the optimal path if found.
 
         The stop conditions:
-            1. If the grid doesn't contain obstacles - optimal path was found - a chromosome whose fitness value is the
-               Manhattan distance between the start and the destination points.
+            1. Optimal path was found - the fittest chromosome reaches the destination without obstacles in the length
+               of the shortest path (known from the distance field of the world).
             2. The fittest chromosome hasn't changed for 150 of generations.
             3. All the chromosome in the population have the same fitness values for 50 generations.
         :returns: All the cells that were visited by the path.
         """
-        # Print the initial status of the algorithm
+        # Print the initial status of the algorithm (the evaluation processes are started again if the GA ran before)
         self.print_status()
+        self.create_evaluator()
+        for observer in self.observers:
+            observer.on_start(self)
 
         # Perform the steps of the GA while none of the stop conditions occurred.
-        while self.sameFittestGenerations < const.SAME_FITTEST_MAX_GENERATIONS \
-                and self.samePopulationGenerations < const.SAME_POPULATION_MAX_GENERATIONS:
-            if len(self.world.obstaclesList) == 0 and self.bestChromosome.fitness == self.world.manhattanDistance:
-                break
-
-            # If all chromosomes in the population share the same fitness value - increase counter
-            if len(set(x.fitness for x in self.population)) == 1:
-                self.samePopulationGenerations += 1
-            # Else - set counter to zero
-            else:
-                self.samePopulationGenerations = 0
+        while not self.finished():
+            self.step()
 
-            # Create a new generation of chromosomes and perform selection
-            self.create_generation()
-            self.selection()
+        self.close()
+        for observer in self.observers:
+            observer.on_finish(self)
 
-            # Print status and update data dict
-            self.print_status()
-            self.update_data()
+        self.print_result()
+        return self.bestChromosome.history
 
-        # If a path that reaches destination was found - print it
+    def print_result(self):
+        """
+        If a path that reaches destination was found - prints it (unless in quiet mode).
+        :returns: None
+        """
+        if not self.verbose:
+            return
         if self.bestChromosome.destReached and not self.bestChromosome.obstacles:
             length = self.bestChromosome.pathLength
             string = "Found best path from {0} to {1}".format(self.world.start, self.world.dest)
@@ -84,7 +150,164 @@ class GeneticSearchAlgorithm:
             print(string)
         else:
             print("Path not found")
-        return self.bestChromosome.history
+
+    def step(self):
+        """
+        Performs one generation of the GA:
+            1. Update the counter of generations whose chromosomes share the same fitness value (unless the
+               convergence controller decides when the GA stops).
+            2. Create new generation of chromosomes.
+            3. Perform selection process on the population.
+            4. Print current status and update the data.
+        :returns: None
+        """
+        self.profiler.start()
+        # If all chromosomes in the population share the same fitness value - increase counter
+        if not self.controller:
+            values = self.fitness_values()
+            if values.min() == values.max():
+                self.samePopulationGenerations += 1
+            # Else - set counter to zero
+            else:
+                self.samePopulationGenerations = 0
+        self.profiler.lap("bookkeeping")
+
+        # Create a new generation of chromosomes and perform selection
+        self.create_generation()
+        self.selection()
+        self.profiler.lap("bookkeeping")
+
+        # Print status and update data dict
+        self.print_status()
+        self.profiler.lap("reporting")
+        self.update_data()
+        if self.controller:
+            self.controller.update(self)
+        self.profiler.lap("bookkeeping")
+        if self.observers:
+            self.notify_observers()
+
+    def add_observer(self, observer):
+        """
+        Adds an observer of the GA and starts timing the phases of the generations.
+        :param observer: GenerationObserver object
+        :returns: None
+        """
+        self.observers.append(observer)
+        if isinstance(self.profiler, NullProfiler):
+            self.profiler = PhaseProfiler()
+
+    def notify_observers(self):
+        """
+        Sends the statistics and the phase times of the last generation to the observers.
+        :returns: None
+        """
+        times, calls = self.profiler.reset()
+        stats = self.stats.row(-1)
+        stats.update(generation=self.generation,
+                     best=self.bestChromosome.fitness,
+                     phases=times,
+                     calls=calls,
+                     seconds=sum(times.values()))
+        for observer in self.observers:
+            observer.on_generation(self, stats)
+
+    def finished(self):
+        """
+        Checks the stop conditions of the GA (see start) - or if adaptive, whether the GA converged.
+        :returns: True if any of the stop conditions occurred
+        """
+        if self.controller:
+            return self.controller.converged() or self.optimal_path_found()
+        return self.sameFittestGenerations >= const.SAME_FITTEST_MAX_GENERATIONS \
+            or self.samePopulationGenerations >= const.SAME_POPULATION_MAX_GENERATIONS \
+            or self.optimal_path_found()
+
+    def optimal_path_found(self):
+        """
+        :returns: True if the fittest chromosome reaches the destination without obstacles, in the length of the
+                  shortest path between the start and the destination points
+        """
+        best = self.bestChromosome
+        return best.destReached and not best.obstacles and best.pathLength == self.world.shortest_distance()
+
+    def emigrants(self, count):
+        """
+        :param count: number of chromosomes
+        :returns: matrix of the direction codes of the fittest chromosomes
+        """
+        return self.genomes(survivor_indices(self.fitness_values(), count, count))
+
+    def immigrate(self, genomes):
+        """
+        Replaces the least fit chromosomes of the population with new chromosomes.
+        :param genomes: matrix of the direction codes of the new chromosomes
+        :returns: None
+        """
+        count = min(len(genomes), len(self.population) - self.eliteSize)
+        if count <= 0:
+            return
+        genomes = genomes[:count]
+        size = len(self.population)
+        self.keep_fittest(size - count)
+        if self.engine == const.VECTORIZED_ENGINE:
+            self.population = self.population.extend(Population(self.world, genomes.copy()))
+        else:
+            self.population.extend(Chromosome(self.world, codes=genome.tobytes()) for genome in genomes)
+        self.keep_fittest(size)
+        best = self.population.chromosome(0) if self.engine == const.VECTORIZED_ENGINE else self.population[0]
+
+        # A fitter immigrant is the new fittest chromosome
+        if best.fitness < self.bestChromosome.fitness:
+            self.bestChromosome = best
+            self.sameFittestGenerations = 0
+
+    def replan(self, added=(), removed=()):
+        """
+        Changes the obstacles of the world and re-plans without a cold restart:
+            1. Update the obstacles and the distance field of the world (see World.update_obstacles).
+            2. Evaluate again only the chromosomes whose walks visit the changed cells (found with a cell -> chromosome
+               visitation index), or that stop before the destination in a cell whose distance changed.
+            3. Sort the elite again and restart the stop conditions.
+        The population keeps evolving from its current state - call start (or step) to continue.
+        :param added: coordinates of the new obstacles
+        :param removed: coordinates of the obstacles to remove
+        :returns: number of chromosomes evaluated again
+        """
+        oldDistances = self.world.distance_field().copy()
+        changed = self.world.update_obstacles(added, removed)
+        if self.evaluator:
+            self.evaluator.update_world()
+        moved = numpy.flatnonzero(self.world.distance_field() != oldDistances)
+
+        # Find the chromosomes affected by the changes
+        count = len(self.population)
+        if self.engine == const.VECTORIZED_ENGINE:
+            pathLength, destReached = self.population.pathLength, self.population.destReached
+        else:
+            pathLength = numpy.array([chrom.pathLength for chrom in self.population], dtype=numpy.int64)
+            destReached = numpy.array([chrom.destReached for chrom in self.population], dtype=bool)
+        cells, inPath = walked_cells(self.genomes(numpy.arange(count)), pathLength, self.world.size, self.world.start)
+        offsets, rows = visitation_index(cells, inPath, self.world.size * self.world.size)
+        finalCells = cells[numpy.arange(count), pathLength]
+        stopped = numpy.flatnonzero(~destReached & numpy.isin(finalCells, moved))
+        rescored = numpy.union1d(visiting_rows(offsets, rows, changed), stopped)
+
+        if self.engine == const.VECTORIZED_ENGINE:
+            self.population.rescore(rescored)
+        else:
+            for index in rescored.tolist():
+                self.population[index].fitness = self.population[index].fitness_func()
+
+        # The fitness values changed - the fittest chromosome may be worse than before
+        self.keep_fittest(count)
+        self.bestChromosome = None
+        self.find_best_chromosome()
+        self.samePopulationGenerations = 0
+        if self.controller:
+            self.controller.reset()
+        self.update_data()
+        return len(rescored)
 
     def create_generation(self):
         """
@@ -92,78 +315,180 @@ class GeneticSearchAlgorithm:
         :return:
         """
         self.generation += 1
-        # Choose parents using roulette selection
-        parents = self.roulette_selection()
-
-        # Perform crossovers between parents
-        while parents:
-            if len(parents) >= 2:
-                parent1 = choice(parents)
-                parents.remove(parent1)
-                parent2 = choice(parents)
-                parents.remove(parent2)
-                self.population.extend(self.uniform_crossover(parent1, parent2))
-            else:
-                self.population.extend(parents)
-                parents.clear()
+        if self.engine == const.VECTORIZED_ENGINE:
+            self.create_vectorized_generation()
+            return
+
+        # Choose parents
+        parents = self.select_parents()
+        self.profiler.lap("selection")
+
+        # Pair random parents
+        parents1, parents2, unpaired = pair_parents(parents)
+        self.profiler.lap("pairing")
+
+        # Perform crossovers between the pairs
+        children = crossover(self.crossoverMethod, self.genomes(parents1), self.genomes(parents2))
+        self.profiler.lap("crossover")
+
+        # Evaluate the children - a copy of a parent without a pair moves to the next generation (the parent itself
+        # may survive too, and a shared object would let its mutation change the elite)
+        unpaired = [Chromosome(self.world, codes=self.population[index].codes()) for index in unpaired.tolist()]
+        self.population.extend(Chromosome(self.world, codes=codes.tobytes()) for codes in children)
+        self.population.extend(unpaired)
+        self.profiler.lap("evaluation")
 
         # Perform mutations in population - elite group doesn't change
-        self.population = sorted(self.population, key=lambda x: x.fitness)[:self.populationSize]
+        self.keep_fittest(self.populationSize)
+        self.profiler.lap("sorting")
         for chrom in self.population[self.eliteSize:]:
             if random() < self.mutationProbability:
-                chrom.mutate()
+                self.skippedSteps += chrom.mutate()
+                self.rewalkSteps += chrom.pathLength
+        self.profiler.lap("mutation")
+        if self.localSearch:
+            self.improve_elite()
+            self.profiler.lap("local search")
+
+        self.keep_fittest(self.populationSize)
+        self.profiler.lap("sorting")
+        self.find_best_chromosome()
+        self.profiler.lap("bookkeeping")
+
+    def create_vectorized_generation(self):
+        """
+        Creates a new generation using crossovers and mutations on the genomes matrix of the population.
+        :return:
+        """
+        # Choose parents
+        parents = self.select_parents()
+        self.profiler.lap("selection")
+
+        # Pair random parents - a parent without a pair moves to the next generation
+        parents1, parents2, unpaired = pair_parents(parents)
+        self.profiler.lap("pairing")
 
-        self.population = sorted(self.population, key=lambda x: x.fitness)[:self.populationSize]
+        # Perform crossovers between the pairs
+        genomes = crossover(self.crossoverMethod, self.genomes(parents1), self.genomes(parents2))
+        self.profiler.lap("crossover")
+        children = Population(self.world, genomes, self.evaluator.evaluate(genomes) if self.evaluator else None)
+        self.population = self.population.extend(children).extend(self.population.take(unpaired))
+        self.profiler.lap("evaluation")
+
+        # Perform mutations in population - elite group doesn't change
+        self.keep_fittest(self.populationSize)
+        self.profiler.lap("sorting")
+        population = self.population
+        rows = self.eliteSize + numpy.flatnonzero(numpy.random.random(len(population) - self.eliteSize)
+                                                  < self.mutationProbability)
+        population.genomes[rows, numpy.random.randint(0, self.chromosomeSize, size=rows.size)] = \
+            numpy.random.randint(0, len(const.DIRECTIONS), size=rows.size)
+        population.rescore(rows)
+        self.profiler.lap("mutation")
+        if self.localSearch:
+            self.improve_elite()
+            self.profiler.lap("local search")
+
+        self.keep_fittest(self.populationSize)
+        self.profiler.lap("sorting")
         self.find_best_chromosome()
+        self.profiler.lap("bookkeeping")
+
+    def improve_elite(self):
+        """
+        Runs the local search on the elite group (the fittest chromosome if there is no elite) and replaces the paths
+        that it improved.
+        :returns: None
+        """
+        count = min(max(self.eliteSize, 1), len(self.population))
+        rows, genomes, scores = self.localSearch.improve(self.world, self.genomes(numpy.arange(count)),
+                                                         self.fitness_values()[:count])
+        if self.engine == const.VECTORIZED_ENGINE:
+            self.population.replace(rows, genomes, scores)
+        else:
+            for row, genome in zip(rows.tolist(), genomes):
+                self.population[row] = Chromosome(self.world, codes=genome.tobytes())
+
+    def create_evaluator(self):
+        """
+        Starts the processes that evaluate the offspring (vectorized engine with more than one evaluation worker),
+        unless they are running.
+        :returns: None
+        """
+        if self.evaluator is None and self.engine == const.VECTORIZED_ENGINE and self.evaluationWorkers > 1:
+            from parallel import ParallelEvaluator      # Imported only when needed (shared memory is slow to import)
+            self.evaluator = ParallelEvaluator(self.world, self.evaluationWorkers, rows=2 * (self.parentSize // 2),
+                                               length=self.chromosomeSize)
 
-    def create_population(self):
+    def close(self):
+        """
+        Stops the processes that evaluate the offspring (start runs them again).
+        :returns: None
+        """
+        if self.evaluator:
+            self.evaluator.close()
+            self.evaluator = None
+
+    def create_population(self, genomes=None):
         """
         Creates population of chromosomes (paths) and finds the fittest one.
+        :param genomes: matrix of the direction codes of the initial population (default - created by the initializer)
         :returns: None
         """
-        population = []
-        for _ in range(self.populationSize):
-            population.append(Chromosome(world=self.world, size=self.chromosomeSize))
-        self.population = sorted(population, key=lambda x: x.fitness)
+        if genomes is None and (self.engine == const.VECTORIZED_ENGINE or self.initializer != const.RANDOM_INITIALIZER):
+            genomes = initial_genomes(self.initializer, self.world, self.populationSize, self.chromosomeSize,
+                                      self.randomFraction)
+        if genomes is None:
+            self.population = []
+            for _ in range(self.populationSize):
+                self.population.append(Chromosome(world=self.world, size=self.chromosomeSize))
+        elif self.engine == const.VECTORIZED_ENGINE:
+            self.population = Population(self.world, genomes)
+        else:
+            self.population = [Chromosome(self.world, codes=genome.tobytes()) for genome in genomes]
+        self.keep_fittest(self.populationSize)
         self.find_best_chromosome()
 
-    def roulette_selection(self):
+    def keep_fittest(self, count):
+        """
+        Survivor selection - keeps the fittest chromosomes of the population.
+        Only the elite group is sorted by the fitness values (so the fittest chromosome is first), the rest of the
+        survivors keep their order.
+        :param count: number of survivors
+        :returns: None
+        """
+        survivors = survivor_indices(self.fitness_values(), count, self.eliteSize)
+        if self.engine == const.VECTORIZED_ENGINE:
+            self.population = self.population.take(survivors)
+        else:
+            self.population = [self.population[index] for index in survivors.tolist()]
+
+    def select_parents(self):
         """
-        Roulette wheel selection.
+        Chooses the parents with the selection method of the GA.
         To turn min values to max values - manhattan distance is divided by the fitness value.
-        :returns: a list of parents
-        """
-        manhattan = self.world.manhattanDistance
-        totalFitness = sum([manhattan/x.fitness for x in self.population])
-        probabilities = []
-        for chromosome in self.population:
-            probabilities.append((manhattan/chromosome.fitness) / totalFitness)
-        return numpy.random.choice(self.population, self.parentSize, probabilities).tolist()
-
-    def uniform_crossover(self, parent1, parent2):
-        """
-        Performs Uniform Crossover of two parents.
-        :param: 2 parent chromosomes to crossover.
-        :returns: 2 new child chromosomes.
-        """
-        path1 = []
-        path2 = []
-        for index in range(self.chromosomeSize):
-            if random() < 0.5:
-                path1.append(parent1.path[index])
-                path2.append(parent2.path[index])
-            else:
-                path2.append(parent1.path[index])
-                path1.append(parent2.path[index])
-        return [Chromosome(self.world, path=path1), Chromosome(self.world, path=path2)]
+        :returns: array of the indices of the parents in the population
+        """
+        return select_parents(self.selectionMethod, self.fitness_values(), self.parentSize,
+                              self.world.manhattanDistance, self.tournamentSize)
+
+    def genomes(self, indices):
+        """
+        :param indices: indices of chromosomes in the population
+        :returns: matrix of the direction codes of the chromosomes
+        """
+        if self.engine == const.VECTORIZED_ENGINE:
+            return self.population.genomes[indices]
+        return numpy.array([numpy.frombuffer(self.population[index].codes(), dtype=numpy.int8)
+                            for index in indices.tolist()], dtype=numpy.int8).reshape(-1, self.chromosomeSize)
 
     def selection(self):
         """
-        Performs selection in the population.
+        Performs selection in the population (the generation already kept only the fittest chromosomes).
         :returns: None
         """
-        newPopulation = self.population[:self.populationSize]
-        self.population = newPopulation
+        if len(self.population) > self.populationSize:
+            self.keep_fittest(self.populationSize)
 
     def find_best_chromosome(self):
         """
@@ -171,7 +496,10 @@ class GeneticSearchAlgorithm:
         Checks if the fitness value of the last chromosome changes and updates the generations counter.
         :returns: None
         """
-        newBestChrom = self.population[0]
+        if self.engine == const.VECTORIZED_ENGINE:
+            newBestChrom = self.population.chromosome(0)
+        else:
+            newBestChrom = self.population[0]
         if self.bestChromosome and newBestChrom.fitness == self.bestChromosome.fitness:
             self.sameFittestGenerations += 1
         else:
@@ -180,22 +508,72 @@ class GeneticSearchAlgorithm:
 
     def print_status(self):
         """
-        Prints the current generation and the fittest chromosome.
+        Prints the current generation and the fittest chromosome (unless in quiet mode).
         :returns: None
         """
+        if not self.verbose:
+            return
         string = "Generation: {}".format(self.generation)
         string += "\tBest path found: {}".format(self.bestChromosome)
         print(string)
 
+    @property
+    def data(self):
+        """
+        Data about the fitness values in every generation - {generation: {metric: value}}.
+        :returns: read-only view of the statistics store
+        """
+        return self.stats.view()
+
     def update_data(self):
         """
-        Updates the data of the generation:
+        Records the statistics of the generation:
             1. Max fitness value.
             2. Min fitness value.
             3. Average fitness value.
+            4. Standard deviation of the fitness values.
+            5. Percentiles of the fitness values (STATS_PERCENTILES).
+            6. Genotype diversity - part of the directions that differ between pairs of chromosomes spread evenly over
+               the population (no random numbers are drawn, so recording doesn't change the search).
         :returns: None
         """
-        values = [x.fitness for x in self.population]
-        self.data[self.generation] = {"max": max(values),
-                                      "min": min(values),
-                                      "avg": sum(values)/len(values)}
+        values = self.fitness_values()
+        percentiles = numpy.percentile(values, const.STATS_PERCENTILES)
+        rows = numpy.linspace(0, len(values) - 1, 2 * const.DIVERSITY_SAMPLE).astype(numpy.int64)
+        genomes = self.genomes(rows)
+        diversity = numpy.mean(genomes[:const.DIVERSITY_SAMPLE] != genomes[const.DIVERSITY_SAMPLE:]).item()
+        self.stats.record(self.generation,
+                          max=values.max().item(),
+                          min=values.min().item(),
+                          avg=values.mean().item(),
+                          std=values.std().item(),
+                          diversity=diversity,
+                          **{"p{}".format(percentile): value.item()
+                             for percentile, value in zip(const.STATS_PERCENTILES, percentiles)})
+
+    def skipped_steps_ratio(self):
+        """
+        :returns: part of the steps skipped when rescoring mutated chromosomes (compared with full re-walks)
+        """
+        return self.skippedSteps / self.rewalkSteps if self.rewalkSteps else 0.0
+
+    def cache_stats(self):
+        """
+        Statistics of the fitness cache of the world since the GA was created.
+        The cache is used by the object engine when a new chromosome is created.
+        :returns: dict of the hits, misses, hit rate and number of cached paths
+        """
+        hits = self.world.fitnessCache.hits - self.cacheHits
+        misses = self.world.fitnessCache.misses - self.cacheMisses
+        return {"hits": hits,
+                "misses": misses,
+                "hitRate": hits / (hits + misses) if hits + misses else 0.0,
+                "size": len(self.world.fitnessCache)}
+
+    def fitness_values(self):
+        """
+        :returns: array of the fitness values of the population
+        """
+        if self.engine == const.VECTORIZED_ENGINE:
+            return self.population.fitness
+        return numpy.array([x.fitness for x in self.population])
@@ -0,0 +1,91 @@
+"""
+Initializers of the GA's population. Every initializer creates the genomes of many chromosomes at once - all the
+walks move a step together with array operations.
+"""
+import numpy
+import constants as const
+from chromosome import DELTA_Y, DELTA_X
+from population import random_genomes
+
+
+def random_initializer(world, count, length):
+    """
+    Uniformly random paths.
+    :returns: matrix of direction codes (count x length)
+    """
+    return random_genomes(count, length)
+
+
+def biased_initializer(world, count, length, bias=const.INITIALIZER_BIAS):
+    """
+    Random walks biased towards the destination - in every step, with probability bias the walk moves in a direction
+    that gets closer to the destination (vertical or horizontal at random), else in a random direction.
+    :param bias: probability of a step towards the destination
+    :returns: matrix of direction codes (count x length)
+    """
+    destY, destX = world.dest
+    currentY = numpy.full(count, world.start[0], dtype=numpy.int64)
+    currentX = numpy.full(count, world.start[1], dtype=numpy.int64)
+    genomes = numpy.empty((count, length), dtype=numpy.int8)
+    for index in range(length):
+        vertical = numpy.where(currentY < destY, 0, 1)          # Up or Down
+        horizontal = numpy.where(currentX < destX, 3, 2)        # Right or Left
+        useVertical = numpy.where(currentY == destY, False,
+                                  numpy.where(currentX == destX, True, numpy.random.random(count) < 0.5))
+        genes = numpy.where(numpy.random.random(count) < bias, numpy.where(useVertical, vertical, horizontal),
+                            numpy.random.randint(0, len(const.DIRECTIONS), size=count))
+        genomes[:, index] = genes
+        currentY = numpy.clip(currentY + DELTA_Y[genes], 0, world.size - 1)
+        currentX = numpy.clip(currentX + DELTA_X[genes], 0, world.size - 1)
+    return genomes
+
+
+def greedy_initializer(world, count, length, exploration=const.GREEDY_EXPLORATION):
+    """
+    Greedy walks on the distance field of the world - in every step the walk moves to the neighbour cell closest to
+    the destination around the obstacles (ties are broken at random). With probability exploration the walk moves in
+    a random direction instead, so the walks differ.
+    :param exploration: probability of a random step
+    :returns: matrix of direction codes (count x length)
+    """
+    size = world.size
+    distances = world.distance_field()
+    # Obstacles and unreachable cells are farther than any reachable cell
+    farthest = numpy.where(distances == const.UNREACHABLE, size * size, distances)
+    currentY = numpy.full(count, world.start[0], dtype=numpy.int64)
+    currentX = numpy.full(count, world.start[1], dtype=numpy.int64)
+    genomes = numpy.empty((count, length), dtype=numpy.int8)
+    for index in range(length):
+        newY = currentY[:, None] + DELTA_Y
+        newX = currentX[:, None] + DELTA_X
+        inside = (newY >= 0) & (newY < size) & (newX >= 0) & (newX < size)
+        cells = numpy.clip(newY, 0, size - 1) * size + numpy.clip(newX, 0, size - 1)
+        scores = numpy.where(inside, farthest[cells], 2 * size * size) + numpy.random.random(cells.shape)
+        explore = numpy.random.random(count) < exploration
+        scores[explore] = numpy.where(inside[explore], 0, 1) + numpy.random.random((explore.sum(), scores.shape[1]))
+        genes = numpy.argmin(scores, axis=1)
+        genomes[:, index] = genes
+        rows = numpy.arange(count)
+        currentY = newY[rows, genes]
+        currentX = newX[rows, genes]
+    return genomes
+
+
+INITIALIZERS = {const.RANDOM_INITIALIZER: random_initializer,
+                const.BIASED_INITIALIZER: biased_initializer,
+                const.GREEDY_INITIALIZER: greedy_initializer}
+
+
+def initial_genomes(method, world, count, length, randomFraction=const.DEFAULT_RANDOM_FRACTION):
+    """
+    Creates the genomes of an initial population - a fraction of random paths (for diversity) and the rest by an
+    initializer.
+    :param method: random, biased or greedy
+    :param randomFraction: part of the paths that are random
+    :returns: matrix of direction codes (count x length)
+    """
+    if method == const.RANDOM_INITIALIZER:
+        return random_initializer(world, count, length)
+    randomCount = int(round(count * randomFraction))
+    return numpy.concatenate((random_initializer(world, randomCount, length),
+                              INITIALIZERS[method](world, count - randomCount, length)))
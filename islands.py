@@ -0,0 +1,129 @@
+"""
+Includes the IslandModel class - runs several populations of the genetic algorithm in parallel with migrations.
+"""
+from multiprocessing import Event, Process, Queue
+from queue import Empty
+import random
+import time
+
+import constants as const
+from genetic_algorithm import GeneticSearchAlgorithm, seed_generators
+
+
+def neighbours(island, islands, topology):
+    """
+    :param island: index of the island
+    :param islands: number of islands
+    :param topology: ring - every island sends migrants to the next island, full - to all the other islands
+    :returns: indices of the islands that receive the migrants of the island
+    """
+    if islands < 2:
+        return []
+    if topology == const.RING_TOPOLOGY:
+        return [(island + 1) % islands]
+    return [other for other in range(islands) if other != island]
+
+
+def run_island(island, world, parameters, migration, inboxes, stop, results):
+    """
+    Runs the genetic algorithm of one island (in its own process).
+    Every migration interval generations - sends the fittest chromosomes to the neighbour islands and adds the
+    chromosomes received from other islands. Stops when the island's stop conditions occurred or when any island
+    found the optimal path.
+    :param island: index of the island
+    :param world: the World object
+    :param parameters: parameters of the GeneticSearchAlgorithm
+    :param migration: migration interval, number of migrants, topology and seed
+    :param inboxes: queues of the migrants sent to every island
+    :param stop: event set when the optimal path is found
+    :param results: queue of the results of the islands
+    :returns: None
+    """
+    interval, migrants, topology, seed = migration
+    seed_generators(seed, "island", island)
+    for inbox in inboxes:
+        inbox.cancel_join_thread()
+    begin = time.perf_counter()
+    ga = GeneticSearchAlgorithm(world, **parameters)
+    targets = neighbours(island, len(inboxes), topology)
+    while not stop.is_set() and not ga.finished():
+        ga.step()
+        if ga.generation % interval == 0:
+            emigrants = ga.emigrants(migrants)
+            for target in targets:
+                inboxes[target].put(emigrants)
+            while True:
+                try:
+                    ga.immigrate(inboxes[island].get_nowait())
+                except Empty:
+                    break
+    if ga.optimal_path_found():
+        stop.set()
+    ga.close()
+    best = ga.bestChromosome
+    results.put({"island": island,
+                 "stats": ga.stats,
+                 "path": best.path[:best.pathLength],
+                 "fitness": best.fitness,
+                 "found": best.destReached and not best.obstacles,
+                 "history": best.history,
+                 "generations": ga.generation,
+                 "time": time.perf_counter() - begin})
+
+
+class IslandModel:
+    """
+    Island model of the genetic algorithm - independent populations evolve on the same world in separate processes
+    and periodically exchange their fittest chromosomes.
+    """
+    def __init__(self, world, islands, migrationInterval=const.DEFAULT_MIGRATION_INTERVAL,
+                 migrants=const.DEFAULT_MIGRANTS, topology=const.RING_TOPOLOGY, seed=None, **parameters):
+        """
+        Constructor for class IslandModel.
+        :param world: the World object
+        :param islands: number of populations (processes)
+        :param migrationInterval: number of generations between migrations
+        :param migrants: number of chromosomes sent to every neighbour island
+        :param topology: ring or full (see neighbours)
+        :param seed: seed of the islands (default - random seed)
+        :param parameters: parameters of the GeneticSearchAlgorithm of every island
+        """
+        self.world = world
+        self.islands = islands
+        self.migrationInterval = migrationInterval
+        self.migrants = migrants
+        self.topology = topology
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.parameters = parameters
+        self.results = []                   # Results of all the islands
+
+    def start(self):
+        """
+        Runs all the islands until all of them stop.
+        :returns: the result of the island with the fittest chromosome (dict of the statistics of the generations,
+                  the best path, the cells visited by it, the fitness value, the number of generations and the time)
+        """
+        begin = time.perf_counter()
+        inboxes = [Queue() for _ in range(self.islands)]
+        stop = Event()
+        results = Queue()
+        migration = (self.migrationInterval, self.migrants, self.topology, self.seed)
+        processes = [Process(target=run_island,
+                             args=(island, self.world, self.parameters, migration, inboxes, stop, results))
+                     for island in range(self.islands)]
+        for process in processes:
+            process.start()
+        self.results = sorted((results.get() for _ in processes), key=lambda result: result["island"])
+        for process in processes:
+            process.join()
+
+        best = dict(min(self.results, key=lambda result: (not result["found"], result["fitness"])))
+        best["time"] = time.perf_counter() - begin
+        if self.parameters.get("verbose", True):
+            if best["found"]:
+                print("Island {0} found best path from {1} to {2}\n{3} moves: {4}"
+                      .format(best["island"], self.world.start, self.world.dest, len(best["path"]),
+                              " , ".join(best["path"])))
+            else:
+                print("Path not found")
+        return best
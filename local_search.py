@@ -0,0 +1,200 @@
+"""
+Includes the LocalSearch class - a memetic pass that improves the paths of the elite between generations of the GA.
+"""
+from bisect import bisect_left
+import time
+import numpy
+import constants as const
+from population import evaluate, random_genomes
+
+
+def walk_path(codes, start, dest):
+    """
+    :param codes: direction codes of a path (inside the grid)
+    :param start: start cell
+    :param dest: destination cell
+    :returns: list of the cells visited by the path (from the start until the destination if reached)
+    """
+    cells = [start]
+    y, x = start
+    for code in codes:
+        deltaY, deltaX = const.DIRECTION_DELTAS[code]
+        y, x = y + deltaY, x + deltaX
+        cells.append((y, x))
+        if (y, x) == dest:
+            break
+    return cells
+
+
+def remove_loops(codes, start, dest):
+    """
+    Cuts the loops out of a path - when the walk returns to a cell, the moves since the first visit of the cell are
+    removed. A map of every cell of the path so far to its position (first index) finds the returns, and every cell
+    enters and leaves the map once, so the pass is linear.
+    :param codes: direction codes of a path (inside the grid)
+    :param start: start cell
+    :param dest: destination cell
+    :returns: direction codes of the path without loops (until the destination if reached), number of removed moves
+    """
+    cells = [start]
+    positions = {start: 0}
+    moves = []
+    steps = 0
+    y, x = start
+    for code in codes:
+        steps += 1
+        deltaY, deltaX = const.DIRECTION_DELTAS[code]
+        y, x = y + deltaY, x + deltaX
+        position = positions.get((y, x))
+        if position is None:
+            positions[(y, x)] = len(cells)
+            cells.append((y, x))
+            moves.append(code)
+        else:
+            for cell in cells[position + 1:]:
+                del positions[cell]
+            del cells[position + 1:]
+            del moves[position:]
+        if (y, x) == dest:
+            break
+    return moves, steps - len(moves)
+
+
+def straight_moves(source, target):
+    """
+    :returns: direction codes of the straight path from a cell to another cell in the same row or column
+    """
+    (sourceY, sourceX), (targetY, targetX) = source, target
+    return [0 if targetY > sourceY else 1] * abs(targetY - sourceY) + \
+        [3 if targetX > sourceX else 2] * abs(targetX - sourceX)
+
+
+def shortcut(codes, start, dest, grid):
+    """
+    Replaces detours with straight segments - from every cell of the path, the farthest later cell of the path in the
+    same row or column is reached in a straight line, if it's shorter than the detour and the cells between are free.
+    :param codes: direction codes of a path (inside the grid)
+    :param start: start cell
+    :param dest: destination cell
+    :param grid: boolean grid of the obstacles by (y, x)
+    :returns: direction codes of the shortened path, number of shortcuts
+    """
+    cells = walk_path(codes, start, dest)
+    rows, columns = {}, {}                  # Positions of the cells of the path in every row and column
+    for position, (y, x) in enumerate(cells):
+        rows.setdefault(y, []).append(position)
+        columns.setdefault(x, []).append(position)
+
+    moves = []
+    shortcuts = 0
+    position = 0
+    while position < len(cells) - 1:
+        y, x = cells[position]
+        target = position + 1
+        for positions, line, horizontal in ((rows[y], grid[y], True), (columns[x], grid[:, x], False)):
+            # Later positions in the same line, the farthest first
+            for candidate in reversed(positions[bisect_left(positions, target + 1):]):
+                otherY, otherX = cells[candidate]
+                first, last = sorted((x, otherX) if horizontal else (y, otherY))
+                if abs(otherY - y) + abs(otherX - x) < candidate - position and not line[first:last + 1].any():
+                    target = max(target, candidate)
+                    break
+        if target > position + 1:
+            moves.extend(straight_moves(cells[position], cells[target]))
+            shortcuts += 1
+        else:
+            moves.append(codes[position])
+        position = target
+    return moves, shortcuts
+
+
+class LocalSearch:
+    """
+    Memetic local search on the paths of the elite:
+        1. Loop removal - the moves between two visits of the same cell are cut out.
+        2. Shortcuts - detours between two cells in the same row or column are replaced with straight segments without
+           obstacles (then the loops are removed again).
+    The shortened path is padded with random directions to the length of the genome, and written back only if its
+    fitness value is better. Counts how often the search fires and how long it takes.
+    """
+    def __init__(self):
+        """
+        Constructor for class LocalSearch.
+        """
+        self.passes = 0             # Number of passes (generations)
+        self.attempts = 0           # Paths searched
+        self.changed = 0            # Paths shortened by the search
+        self.improved = 0           # Paths written back (better fitness values)
+        self.removedMoves = 0       # Moves cut out by loop removal
+        self.shortcuts = 0          # Detours replaced with straight segments
+        self.seconds = 0.0          # Time of the passes
+
+    def improve_path(self, world, codes):
+        """
+        :param world: the World object
+        :param codes: direction codes of a path
+        :returns: direction codes of the path without loops and detours (until the destination if reached), or None
+                  if nothing changed
+        """
+        moves, removed = remove_loops(codes, world.start, world.dest)
+        moves, shortcuts = shortcut(moves, world.start, world.dest, world.grid)
+        if shortcuts:
+            moves, more = remove_loops(moves, world.start, world.dest)
+            removed += more
+        self.removedMoves += removed
+        self.shortcuts += shortcuts
+        return moves if removed or shortcuts else None
+
+    def improve(self, world, genomes, fitness):
+        """
+        Searches the paths of chromosomes (identical paths are searched once).
+        :param world: the World object
+        :param genomes: matrix of the direction codes of the chromosomes
+        :param fitness: array of the fitness values of the chromosomes
+        :returns: indices of the improved chromosomes, matrix of their new direction codes, and their fitness, path
+                  length, destination reached and obstacles arrays
+        """
+        begin = time.perf_counter()
+        self.passes += 1
+        length = genomes.shape[1]
+        paths = {}                  # Genome -> improved path (None - not improved)
+        rows = []
+        candidates = []
+        for row, genome in enumerate(genomes):
+            key = genome.tobytes()
+            if key not in paths:
+                self.attempts += 1
+                paths[key] = self.improve_path(world, genome.tolist())
+                self.changed += paths[key] is not None
+            if paths[key] is not None:
+                rows.append(row)
+                candidates.append(paths[key])
+
+        improved = numpy.empty(0, dtype=numpy.int64)
+        new = numpy.empty((0, length), dtype=numpy.int8)
+        scores = tuple(numpy.empty(0, dtype=dtype) for dtype in (numpy.int64, numpy.int64, bool, bool))
+        if rows:
+            new = random_genomes(len(rows), length)
+            for index, moves in enumerate(candidates):
+                new[index, :len(moves)] = moves
+            scores = evaluate(world, new)
+            better = scores[0] < fitness[rows]
+            improved = numpy.array(rows, dtype=numpy.int64)[better]
+            new = new[better]
+            scores = tuple(values[better] for values in scores)
+            self.improved += len(improved)
+        self.seconds += time.perf_counter() - begin
+        return improved, new, scores
+
+    def stats(self):
+        """
+        :returns: dict of the counters of the search
+        """
+        return {"passes": self.passes,
+                "attempts": self.attempts,
+                "changed": self.changed,
+                "improved": self.improved,
+                "fireRate": self.improved / self.attempts if self.attempts else 0.0,
+                "removedMoves": self.removedMoves,
+                "shortcuts": self.shortcuts,
+                "seconds": self.seconds}
@@ -2,103 +2,23 @@
 Runs the program with a list of parameters. Creates graphs and images.
 """
 import argparse as arg
-import tkinter as tk
-import matplotlib.pyplot as plt
+import os
 
-from world import World
-from genetic_algorithm import GeneticSearchAlgorithm
+from plots import save_graphs, show_graphs
+from render import show_image, world_image
+from sweep import create_configurations, build_world, run_configuration, run_sweep
 import constants as const
 
 
-def present_result(world, string):
+def present_result(world, string, history):
     """
     Presents a view of the world, start and destination points, and the path found.
+    :param world: the World object
+    :param string: description of the configuration
+    :param history: cells visited by the path
     :returns: None
     """
-    root = tk.Tk()
-    root.title("Maman 12 - Biological Computation - Lea Ben Zvi")
-
-    # Set label and canvas of the window
-    height = world.size * const.CELL_SIZE
-    label = tk.Label(root)
-    label.pack()
-    label.config(text=string)
-    canvas = tk.Canvas(root, height=height, width=height)
-    canvas.pack()
-
-    # Create the cell objects in the GUI
-    for row in range(world.size):
-        for col in range(world.size):
-            if (row, col) == world.start:
-                color = "green"
-            elif (row, col) == world.dest:
-                color = "red"
-            elif world.grid[row][col]:
-                color = "black"
-            elif (row, col) in history:
-                color = "yellow"
-            else:
-                color = "white"
-            canvas.create_rectangle(row * const.CELL_SIZE,
-                                    col * const.CELL_SIZE,
-                                    (row + 1) * const.CELL_SIZE,
-                                    (col + 1) * const.CELL_SIZE, fill=color)
-    root.mainloop()
-
-
-def create_graphs():
-    """
-    Creates the following graphs:
-        1. Min fitness values over generations.
-        2. Average fitness values over generations.
-        3. Max fitness values over generations.
-    :return: None
-    """
-    plt.figure(1, figsize=(15, 15))
-    plt.subplots_adjust(hspace=0.5)
-
-    # Create min graph
-    plt.subplot(311, title="Fitness Min Values")
-    plt.grid(True)
-    plt.xlabel("Generations")
-    plt.ylabel("Fitness min value")
-    colorIndex = 0
-    for conf in data.keys():
-        gens = data[conf].keys()
-        color = const.COLORS[colorIndex]
-        colorIndex += 1
-        minValues = [data[conf][gen]["min"] for gen in gens]
-        plt.plot(gens, minValues, label=conf, color=color)
-    plt.legend()
-
-    # Create avg graph
-    plt.subplot(312, title="Fitness Average Values")
-    plt.grid(True)
-    plt.xlabel("Generations")
-    plt.ylabel("Fitness avg value")
-    colorIndex = 0
-    for conf in data.keys():
-        gens = data[conf].keys()
-        color = const.COLORS[colorIndex]
-        colorIndex += 1
-        avgs = [data[conf][gen]["avg"] for gen in gens]
-        plt.plot(gens, avgs, label=conf, color=color)
-    plt.legend()
-
-    # Create max graph
-    plt.subplot(313, title="Fitness Max Values")
-    plt.grid(True)
-    plt.xlabel("Generations")
-    plt.ylabel("Fitness max value")
-    colorIndex = 0
-    for conf in data.keys():
-        gens = data[conf].keys()
-        color = const.COLORS[colorIndex]
-        colorIndex += 1
-        maxValues = [data[conf][gen]["max"] for gen in gens]
-        plt.plot(gens, maxValues, label=conf, color=color)
-    plt.legend()
-    plt.show()
+    show_image(world_image(world, history), "Maman 12 - Biological Computation - Lea Ben Zvi", string)
 
 
 if __name__ == '__main__':
@@ -116,7 +36,57 @@ if __name__ == '__main__':
                         .format(const.DEFAULT_ELITE_PERCENTAGE), default=const.DEFAULT_ELITE_PERCENTAGE, type=str)
     parser.add_argument("-pp", "--parents", help="Parents percentage. Can be a list separated by commas. Default={}"
                         .format(const.DEFAULT_PARENTS_PERCENTAGE), default=const.DEFAULT_PARENTS_PERCENTAGE, type=str)
+    parser.add_argument("-en", "--engine", help="Representation of the population. Default={}"
+                        .format(const.DEFAULT_ENGINE), default=const.DEFAULT_ENGINE, choices=const.ENGINES)
+    parser.add_argument("-sm", "--selection", help="Selection method of the parents. Default={}"
+                        .format(const.DEFAULT_SELECTION), default=const.DEFAULT_SELECTION,
+                        choices=const.SELECTION_METHODS)
+    parser.add_argument("-ts", "--tournament-size", help="Chromosomes in every tournament of tournament selection. "
+                        "Default={}".format(const.DEFAULT_TOURNAMENT_SIZE), default=const.DEFAULT_TOURNAMENT_SIZE,
+                        type=int)
+    parser.add_argument("-c", "--crossover", help="Crossover method of the parents. Default={}"
+                        .format(const.DEFAULT_CROSSOVER), default=const.DEFAULT_CROSSOVER,
+                        choices=const.CROSSOVER_METHODS)
+    parser.add_argument("-in", "--initializer", help="Initializer of the population's paths. Default={}"
+                        .format(const.DEFAULT_INITIALIZER), default=const.DEFAULT_INITIALIZER,
+                        choices=const.INITIALIZERS)
+    parser.add_argument("-rf", "--random-fraction", help="Part of the initial paths that are random (biased and "
+                        "greedy initializers). Default={}".format(const.DEFAULT_RANDOM_FRACTION),
+                        default=const.DEFAULT_RANDOM_FRACTION, type=float)
+    parser.add_argument("-a", "--adaptive", help="Adapt the mutation probability and stop when the best fitness value "
+                                                 "improves too slowly", action="store_true")
+    parser.add_argument("-ls", "--local-search", help="Improve the paths of the elite by a local search (loop removal "
+                                                      "and shortcuts) in every generation", action="store_true")
+    parser.add_argument("-cs", "--cache-size", help="Maximal number of paths in the fitness cache. Default={}"
+                        .format(const.FITNESS_CACHE_SIZE), default=const.FITNESS_CACHE_SIZE, type=int)
+    parser.add_argument("-w", "--workers", help="Number of processes running the configurations. Default=1",
+                        default=1, type=int)
+    parser.add_argument("-sd", "--seed", help="Seed of the configurations. Default=random", type=int)
+    parser.add_argument("-ew", "--evaluation-workers", default=1, type=int,
+                        help="Number of processes evaluating the offspring of every generation (vectorized engine). "
+                             "Default=1")
+    parser.add_argument("-i", "--islands", help="Number of populations of the island model. Default={}"
+                        .format(const.DEFAULT_ISLANDS), default=const.DEFAULT_ISLANDS, type=int)
+    parser.add_argument("-mi", "--migration-interval", help="Generations between migrations of islands. Default={}"
+                        .format(const.DEFAULT_MIGRATION_INTERVAL), default=const.DEFAULT_MIGRATION_INTERVAL, type=int)
+    parser.add_argument("-mg", "--migrants", help="Chromosomes sent to every neighbour island. Default={}"
+                        .format(const.DEFAULT_MIGRANTS), default=const.DEFAULT_MIGRANTS, type=int)
+    parser.add_argument("-t", "--topology", help="Migration topology of the islands. Default={}"
+                        .format(const.RING_TOPOLOGY), default=const.RING_TOPOLOGY, choices=const.TOPOLOGIES)
+    parser.add_argument("-q", "--quiet", help="Don't print the status of every generation", action="store_true")
+    parser.add_argument("-l", "--log", help="Directory of JSON Lines logs of the generations of every configuration "
+                                            "(not used by the island model)", type=str)
+    parser.add_argument("-ck", "--checkpoint", help="Directory of checkpoints of every configuration - existing "
+                                                   "checkpoints are resumed (not used by the island model)", type=str)
+    parser.add_argument("-ci", "--checkpoint-interval", help="Generations between checkpoints. Default={}"
+                        .format(const.CHECKPOINT_SAVE_INTERVAL), default=const.CHECKPOINT_SAVE_INTERVAL, type=int)
+    parser.add_argument("-od", "--output-dir", help="Directory of the PNG image of the world and the path found and "
+                                                   "the CSV file of the statistics of every configuration, and of the "
+                                                   "graphs", type=str)
+    parser.add_argument("--headless", help="Don't show the worlds and the graphs", action="store_true")
     args = vars(parser.parse_args())
+    if args["workers"] > 1 and (args["evaluation_workers"] > 1 or args["islands"] > 1):
+        parser.error("--workers can't be used together with --evaluation-workers or --islands")
 
     # Get lists of the arguments
     worldSizes = [int(x) for x in args["size"].split(",")]
@@ -125,53 +95,46 @@ if __name__ == '__main__':
     elitePercentages = [float(x) for x in args["elite"].split(",")]
     parentsPercentages = [float(x) for x in args["parents"].split(",")]
 
-    populationSizes = []
-    populationGiven = False
     # If population sizes specified
+    populationSizes = None
     if args["population"]:
-        populationGiven = True
         populationSizes = [int(x) for x in args["population"].split(",")]
 
-    # Run the configurations
-    configuration = 1
-    data = {}
-    for size in worldSizes:
-        index = 0
-        grid = World(size=size, obstacles=0)
-        for obstacleNumber in obstacleNumbers:
-            grid.changeObstacles(obstacleNumber)
-            for mutationProbability in mutationProbabilities:
-                for elitePercentage in elitePercentages:
-                    for parentsPercentage in parentsPercentages:
-                        # If population sizes not specified - set default size
-                        if not populationGiven:
-                            populationSizes = [size * const.POPULATION_FACTOR]
-                        for populationSize in populationSizes:
-                            # Run genetic algorithm on the world
-                            string = ("Configuration #{0}: world_size={1}, number_of_obstacles={2}, population_size={3}"
-                                      .format(configuration, size, obstacleNumber, populationSize))
-                            if len(mutationProbabilities) > 1:
-                                string += ", mutation_probability={}".format(mutationProbability)
-                            if len(elitePercentages) > 1:
-                                string += ", elite_percentage={}".format(elitePercentage)
-                            if len(parentsPercentages) > 1:
-                                string += ", parents_percentage={}".format(parentsPercentage)
-                            print(string)
-                            ga = GeneticSearchAlgorithm(grid, populationSize=populationSize,
-                                                        mutationProbability=mutationProbability,
-                                                        elitePercentage=elitePercentage,
-                                                        parentPercentage=parentsPercentage)
-                            configuration += 1
-                            history = ga.start()
-
-                            # Update the data dict
-                            name = "size={0}_obstacles={1}_pop={2}".format(size, obstacleNumber, populationSize)
-                            if len(mutationProbabilities) > 1:
-                                name += "_mutation={}".format(mutationProbability)
-                            if len(elitePercentages) > 1:
-                                name += "_elite={}".format(elitePercentage)
-                            if len(parentsPercentages) > 1:
-                                name += "_parents={}".format(parentsPercentage)
-                            data[name] = ga.data
-                            present_result(grid, string)
-    create_graphs()
+    # Run the configurations - in a pool of processes if more than one worker is requested
+    configurations = create_configurations(worldSizes, obstacleNumbers, mutationProbabilities, elitePercentages,
+                                           parentsPercentages, populationSizes=populationSizes,
+                                           engine=args["engine"], cacheSize=args["cache_size"], seed=args["seed"],
+                                           evaluationWorkers=args["evaluation_workers"], islands=args["islands"],
+                                           migrationInterval=args["migration_interval"], migrants=args["migrants"],
+                                           topology=args["topology"], verbose=not args["quiet"],
+                                           logDirectory=args["log"], selectionMethod=args["selection"],
+                                           tournamentSize=args["tournament_size"], crossoverMethod=args["crossover"],
+                                           initializer=args["initializer"], randomFraction=args["random_fraction"],
+                                           adaptive=args["adaptive"], checkpointDirectory=args["checkpoint"],
+                                           checkpointInterval=args["checkpoint_interval"],
+                                           outputDirectory=args["output_dir"], localSearch=args["local_search"])
+    results = run_sweep(configurations, workers=args["workers"]) if args["workers"] > 1 else None
+    stores = {}
+    for index, configuration in enumerate(configurations):
+        world = None
+        if results:
+            result = results[index]
+        else:
+            print(configuration["description"])
+            world = build_world(configuration)
+            result = run_configuration(configuration, world)
+        print("{0} - {1} generations, {2:.2f} seconds".format(configuration["description"], result["generations"],
+                                                             result["time"]))
+        if result.get("localSearch"):
+            print("Local search: improved {improved} of {attempts} paths ({removedMoves} moves removed, {shortcuts} "
+                  "shortcuts) in {seconds:.2f} seconds".format(**result["localSearch"]))
+
+        # Keep the statistics of the configuration
+        stores[result["name"]] = result["stats"]
+        if not args["headless"]:
+            present_result(world if world else build_world(configuration), configuration["description"],
+                           result["history"])
+    if args["output_dir"]:
+        save_graphs(stores, os.path.join(args["output_dir"], "graphs.png"))
+    if not args["headless"]:
+        show_graphs(stores)
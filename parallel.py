@@ -0,0 +1,109 @@
+"""
+Includes the ParallelEvaluator class - evaluates genomes in a pool of processes.
+"""
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+import numpy
+from population import evaluate, evaluate_genomes
+
+# Shared memory and world parameters of a worker process
+workerState = {}
+
+
+def attach_worker(obstaclesName, distancesName, cells, genomesName, rows, length, size, start, dest):
+    """
+    Initializer of the worker processes - attaches to the shared memory of the obstacles, the distance field and the
+    genomes.
+    :returns: None
+    """
+    obstaclesMemory = SharedMemory(name=obstaclesName)
+    distancesMemory = SharedMemory(name=distancesName)
+    genomesMemory = SharedMemory(name=genomesName)
+    workerState["memory"] = (obstaclesMemory, distancesMemory, genomesMemory)
+    workerState["obstacles"] = numpy.ndarray((cells,), dtype=bool, buffer=obstaclesMemory.buf)
+    workerState["distances"] = numpy.ndarray((cells,), dtype=numpy.int32, buffer=distancesMemory.buf)
+    workerState["genomes"] = numpy.ndarray((rows, length), dtype=numpy.int8, buffer=genomesMemory.buf)
+    workerState["world"] = (size, start, dest)
+
+
+def evaluate_rows(task):
+    """
+    Evaluates some of the genomes in the shared memory (directions that exit the grid are fixed in place).
+    :param task: first row, last row and seed of the random numbers used to fix directions
+    :returns: the first row and the fitness values, path lengths, destination reached and obstacles arrays
+    """
+    first, last, seed = task
+    numpy.random.seed(seed)
+    size, start, dest = workerState["world"]
+    return first, evaluate_genomes(workerState["genomes"][first:last], workerState["obstacles"], size, start, dest,
+                                   workerState["distances"])
+
+
+class ParallelEvaluator:
+    """
+    Evaluates genomes in a pool of processes.
+    The obstacles and the distance field of the world and the genomes are stored in shared memory, so only the
+    fitness arrays are sent back from the workers. The pool is kept until the evaluator is closed.
+    """
+    def __init__(self, world, workers, rows, length):
+        """
+        Constructor for class ParallelEvaluator.
+        :param world: the World object
+        :param workers: number of processes
+        :param rows: maximal number of genomes evaluated at once
+        :param length: number of directions in every genome
+        """
+        self.world = world
+        self.workers = workers
+        self.rows = rows
+        self.length = length
+        cells = world.size * world.size
+        self.obstaclesMemory = SharedMemory(create=True, size=cells)
+        self.distancesMemory = SharedMemory(create=True, size=cells * numpy.dtype(numpy.int32).itemsize)
+        self.genomesMemory = SharedMemory(create=True, size=max(rows * length, 1))
+        self.obstacles = numpy.ndarray((cells,), dtype=bool, buffer=self.obstaclesMemory.buf)
+        self.distances = numpy.ndarray((cells,), dtype=numpy.int32, buffer=self.distancesMemory.buf)
+        self.genomes = numpy.ndarray((rows, length), dtype=numpy.int8, buffer=self.genomesMemory.buf)
+        self.update_world()
+        self.pool = Pool(processes=workers, initializer=attach_worker,
+                         initargs=(self.obstaclesMemory.name, self.distancesMemory.name, cells,
+                                   self.genomesMemory.name, rows, length, world.size, world.start, world.dest))
+
+    def update_world(self):
+        """
+        Copies the obstacles and the distance field of the world to the shared memory (after the obstacles changed).
+        :returns: None
+        """
+        self.obstacles[:] = self.world.obstacle_grid()
+        self.distances[:] = self.world.distance_field()
+
+    def evaluate(self, genomes):
+        """
+        Evaluates genomes - the rows are split between the workers.
+        More genomes than the shared memory can hold are evaluated in the current process.
+        Directions that exit the grid are fixed in the genomes matrix.
+        :param genomes: matrix of direction codes
+        :returns: arrays of fitness values, path lengths, destination reached flags and obstacles flags
+        """
+        count = len(genomes)
+        if not count or count > self.rows or genomes.shape[1] != self.length:
+            return evaluate(self.world, genomes)
+        self.genomes[:count] = genomes
+        bounds = numpy.linspace(0, count, self.workers + 1).astype(int)
+        seeds = numpy.random.randint(0, 2 ** 32, size=self.workers, dtype=numpy.uint64)
+        tasks = [(first, last, int(seed)) for first, last, seed in zip(bounds[:-1], bounds[1:], seeds) if last > first]
+        results = sorted(self.pool.map(evaluate_rows, tasks, chunksize=1), key=lambda result: result[0])
+        genomes[:] = self.genomes[:count]
+        return tuple(numpy.concatenate([scores[index] for _, scores in results]) for index in range(4))
+
+    def close(self):
+        """
+        Stops the workers and releases the shared memory.
+        :returns: None
+        """
+        self.pool.close()
+        self.pool.join()
+        del self.obstacles, self.distances, self.genomes
+        for memory in (self.obstaclesMemory, self.distancesMemory, self.genomesMemory):
+            memory.close()
+            memory.unlink()
@@ -0,0 +1,61 @@
+"""
+Graphs of the fitness statistics of the configurations. The graphs are drawn on a matplotlib Figure, so they can be
+written to a file on the non-interactive Agg backend (without a display and without blocking), or shown in a window.
+"""
+import constants as const
+
+# Metric, title and label of the y axis of every graph
+GRAPHS = (("min", "Fitness Min Values", "Fitness min value"),
+          ("avg", "Fitness Average Values", "Fitness avg value"),
+          ("max", "Fitness Max Values", "Fitness max value"))
+FIGURE_SIZE = (15, 15)
+
+
+def draw_graphs(figure, stores):
+    """
+    Draws the following graphs:
+        1. Min fitness values over generations.
+        2. Average fitness values over generations.
+        3. Max fitness values over generations.
+    Every metric is a column of the statistics stores, so every line is plotted from an array without copying.
+    :param figure: matplotlib Figure object
+    :param stores: dict of the StatsStore objects of the configurations by their names
+    :returns: None
+    """
+    figure.subplots_adjust(hspace=0.5)
+    for index, (metric, title, label) in enumerate(GRAPHS):
+        axes = figure.add_subplot(len(GRAPHS), 1, index + 1, title=title)
+        axes.grid(True)
+        axes.set_xlabel("Generations")
+        axes.set_ylabel(label)
+        for colorIndex, (name, store) in enumerate(stores.items()):
+            axes.plot(store.column("generation"), store.column(metric), label=name,
+                      color=const.COLORS[colorIndex % len(const.COLORS)])
+        axes.legend()
+
+
+def save_graphs(stores, path):
+    """
+    Writes the graphs to an image file (the format is chosen by the extension of the path) on the Agg backend.
+    :param stores: dict of the StatsStore objects of the configurations by their names
+    :param path: path of the file
+    :returns: None
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    figure = Figure(figsize=FIGURE_SIZE)
+    FigureCanvasAgg(figure)
+    draw_graphs(figure, stores)
+    figure.savefig(path)
+
+
+def show_graphs(stores):
+    """
+    Shows the graphs in a window (blocks until the window is closed).
+    :param stores: dict of the StatsStore objects of the configurations by their names
+    :returns: None
+    """
+    import matplotlib.pyplot as plt
+    figure = plt.figure(1, figsize=FIGURE_SIZE)
+    draw_graphs(figure, stores)
+    plt.show()
@@ -0,0 +1,219 @@
+"""
+Includes the Population class - the whole population of the GA stored as a single matrix.
+"""
+import numpy
+import constants as const
+from chromosome import Chromosome, DELTA_Y, DELTA_X
+
+
+def random_genomes(count, size):
+    """
+    Creates random genomes.
+    :param count: number of genomes
+    :param size: number of directions in every genome
+    :returns: matrix of direction codes (count x size)
+    """
+    return numpy.random.randint(0, len(const.DIRECTIONS), size=(count, size)).astype(numpy.int8)
+
+
+def evaluate(world, genomes):
+    """
+    Walks all the genomes at once in the world and calculates their fitness values.
+    :param world: the World object
+    :param genomes: matrix of direction codes (one row per chromosome)
+    :returns: arrays of fitness values, path lengths, destination reached flags and obstacles flags
+    """
+    return evaluate_genomes(genomes, world.obstacle_grid(), world.size, world.start, world.dest,
+                            world.distance_field())
+
+
+def evaluate_genomes(genomes, obstacles, size, start, dest, distances=None):
+    """
+    Walks all the genomes at once and calculates their fitness values.
+    The fitness is the same as Chromosome.fitness_func:
+        1. Length of the path (or path to destination).
+        2. Number of the cells revisited.
+        3. Number of obstacles * 10
+        4. Number of opposite directions.
+        5. Distance to the destination if it isn't reached - from the distance field, or the Manhattan distance for
+           obstacles and unreachable cells.
+    Directions that exit the grid are replaced in the genomes matrix (like Chromosome.fix_direction).
+    The revisited cells are counted from the history of the visited cells of every walk, so large populations are
+    walked in blocks of rows - the history of a block holds at most EVALUATION_BLOCK_CELLS cells.
+    :param genomes: matrix of direction codes (one row per chromosome)
+    :param obstacles: flat boolean array of the obstacles (cell (y, x) is in index y * size + x)
+    :param size: size of the grid
+    :param start: start cell
+    :param dest: destination cell
+    :param distances: flat distance field of the world (default - Manhattan distances)
+    :returns: arrays of fitness values, path lengths, destination reached flags and obstacles flags
+    """
+    count, length = genomes.shape
+    blockRows = max(const.EVALUATION_BLOCK_CELLS // (length + 1), 1)
+    if count <= blockRows:
+        return evaluate_block(genomes, obstacles, size, start, dest, distances)
+    blocks = [evaluate_block(genomes[first:first + blockRows], obstacles, size, start, dest, distances)
+              for first in range(0, count, blockRows)]
+    return tuple(numpy.concatenate(arrays) for arrays in zip(*blocks))
+
+
+def evaluate_block(genomes, obstacles, size, start, dest, distances=None):
+    """
+    Walks a block of genomes at once and calculates their fitness values (see evaluate_genomes).
+    :returns: arrays of fitness values, path lengths, destination reached flags and obstacles flags
+    """
+    count, length = genomes.shape
+    startY, startX = start
+    destY, destX = dest
+
+    currentY = numpy.full(count, startY, dtype=numpy.int64)
+    currentX = numpy.full(count, startX, dtype=numpy.int64)
+    active = numpy.ones(count, dtype=bool)
+    destReached = numpy.zeros(count, dtype=bool)
+    pathLength = numpy.full(count, length, dtype=numpy.int64)
+    obstacleCells = numpy.zeros(count, dtype=numpy.int64)
+    # Visited cells - steps after the destination is reached keep the start cell (32 bit indices unless the grid is
+    # too large for them)
+    cellType = numpy.int32 if size * size <= numpy.iinfo(numpy.int32).max else numpy.int64
+    history = numpy.full((count, length + 1), startY * size + startX, dtype=cellType)
+
+    for index in range(length):
+        rows = numpy.flatnonzero(active)
+        if not rows.size:
+            break
+
+        # Update the current positions
+        genes = genomes[rows, index].astype(numpy.int64)
+        newY = currentY[rows] + DELTA_Y[genes]
+        newX = currentX[rows] + DELTA_X[genes]
+
+        # Replace directions that exit the bounds of the grid with a different random direction
+        outside = (newY < 0) | (newY >= size) | (newX < 0) | (newX >= size)
+        while outside.any():
+            fix = numpy.flatnonzero(outside)
+            genes[fix] = (genes[fix] + numpy.random.randint(1, len(const.DIRECTIONS), size=fix.size)) \
+                % len(const.DIRECTIONS)
+            newY[fix] = currentY[rows[fix]] + DELTA_Y[genes[fix]]
+            newX[fix] = currentX[rows[fix]] + DELTA_X[genes[fix]]
+            outside[fix] = (newY[fix] < 0) | (newY[fix] >= size) | (newX[fix] < 0) | (newX[fix] >= size)
+        genomes[rows, index] = genes
+        currentY[rows] = newY
+        currentX[rows] = newX
+        cells = newY * size + newX
+        history[rows, index + 1] = cells
+
+        # Check if destination is reached, else check if on obstacle
+        reached = (newY == destY) & (newX == destX)
+        obstacleCells[rows] += obstacles[cells] & ~reached
+        done = rows[reached]
+        destReached[done] = True
+        pathLength[done] = index + 1
+        active[done] = False
+
+    # Revisited cells - steps in the history minus the number of distinct cells
+    history.sort(axis=1)
+    distinct = 1 + numpy.count_nonzero(numpy.diff(history, axis=1), axis=1)
+    revisitedCells = pathLength + 1 - distinct
+
+    # Opposite directions in the actual path
+    actualPath = numpy.arange(length) < pathLength[:, None]
+    counts = [numpy.count_nonzero((genomes == code) & actualPath, axis=1) for code in range(len(const.DIRECTIONS))]
+    up, down, left, right = counts
+    oppositeDirections = numpy.minimum(up, down) + numpy.minimum(left, right)
+
+    fitness = pathLength.copy()
+    fitness += revisitedCells * const.REVISITED_CELL_PENALTY
+    fitness += obstacleCells * const.OBSTACLE_PENALTY
+    fitness += oppositeDirections * const.OPPOSITE_DIRECTIONS_PENALTY
+    remaining = numpy.abs(currentY - destY) + numpy.abs(currentX - destX)
+    if distances is not None:
+        fieldDistances = distances[currentY * size + currentX]
+        remaining = numpy.where(fieldDistances != const.UNREACHABLE, fieldDistances, remaining)
+    fitness += remaining
+    return fitness, pathLength, destReached, obstacleCells > 0
+
+
+class Population:
+    """
+    Represents the population of the GA as a matrix of direction codes (one row per chromosome).
+    The fitness values of all the chromosomes are calculated at once.
+    """
+    def __init__(self, world, genomes, scores=None):
+        """
+        Constructor for class Population.
+        If scores are not given - evaluates the genomes.
+        :param world: the World object
+        :param genomes: matrix of direction codes
+        :param scores: fitness, path length, destination reached and obstacles arrays of the genomes
+        """
+        self.world = world
+        self.genomes = genomes                      # Matrix of direction codes
+        if scores is None:
+            scores = evaluate(world, genomes)
+        self.fitness, self.pathLength, self.destReached, self.obstacles = scores
+
+    def __len__(self):
+        """
+        :returns: number of chromosomes in the population
+        """
+        return len(self.fitness)
+
+    def take(self, indices):
+        """
+        Creates a population from some of the chromosomes (without evaluating them again).
+        :param indices: indices of the chromosomes
+        :returns: new Population object
+        """
+        scores = (self.fitness[indices], self.pathLength[indices], self.destReached[indices], self.obstacles[indices])
+        return Population(self.world, self.genomes[indices], scores)
+
+    def extend(self, other):
+        """
+        Creates a population of the chromosomes of both populations.
+        :param other: another Population object
+        :returns: new Population object
+        """
+        scores = tuple(numpy.concatenate((mine, others)) for mine, others in
+                       zip((self.fitness, self.pathLength, self.destReached, self.obstacles),
+                           (other.fitness, other.pathLength, other.destReached, other.obstacles)))
+        return Population(self.world, numpy.concatenate((self.genomes, other.genomes)), scores)
+
+    def sorted(self, size=None):
+        """
+        Sorts the population by the fitness values.
+        :param size: number of the fittest chromosomes to keep
+        :returns: new Population object
+        """
+        return self.take(numpy.argsort(self.fitness, kind="stable")[:size])
+
+    def rescore(self, rows):
+        """
+        Evaluates again some of the chromosomes (after their genomes changed).
+        :param rows: indices of the chromosomes
+        :returns: None
+        """
+        genomes = self.genomes[rows]
+        scores = evaluate(self.world, genomes)
+        self.genomes[rows] = genomes
+        for values, new in zip((self.fitness, self.pathLength, self.destReached, self.obstacles), scores):
+            values[rows] = new
+
+    def replace(self, rows, genomes, scores):
+        """
+        Replaces some of the chromosomes with evaluated chromosomes.
+        :param rows: indices of the chromosomes
+        :param genomes: matrix of the direction codes of the new chromosomes
+        :param scores: fitness, path length, destination reached and obstacles arrays of the new chromosomes
+        :returns: None
+        """
+        self.genomes[rows] = genomes
+        for values, new in zip((self.fitness, self.pathLength, self.destReached, self.obstacles), scores):
+            values[rows] = new
+
+    def chromosome(self, index):
+        """
+        Creates a Chromosome object of one of the chromosomes.
+        :param index: index of the chromosome
+        :returns: Chromosome object
+        """
+        return Chromosome(self.world, codes=self.genomes[index].tobytes())
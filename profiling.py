@@ -0,0 +1,88 @@
+"""
+Includes the profilers of the phases of a generation and the base class of the GA's observers.
+"""
+from time import perf_counter
+
+
+class PhaseProfiler:
+    """
+    Records the wall time and the number of calls of every phase of a generation.
+    A phase is timed from the end of the previous phase (or from start) until lap is called with its name.
+    """
+    def __init__(self):
+        """
+        Constructor for class PhaseProfiler.
+        """
+        self.times = {}         # Phase -> seconds spent in the phase since the last reset
+        self.calls = {}         # Phase -> number of calls since the last reset
+        self.last = 0.0         # Time when the last phase ended
+
+    def start(self):
+        """
+        Starts timing the first phase.
+        :returns: None
+        """
+        self.last = perf_counter()
+
+    def lap(self, phase):
+        """
+        Ends the current phase.
+        :param phase: name of the phase
+        :returns: None
+        """
+        now = perf_counter()
+        self.times[phase] = self.times.get(phase, 0.0) + now - self.last
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        self.last = now
+
+    def reset(self):
+        """
+        Clears the recorded phases.
+        :returns: the times and the calls of the phases before the reset
+        """
+        times, calls = self.times, self.calls
+        self.times, self.calls = {}, {}
+        return times, calls
+
+
+class NullProfiler:
+    """
+    Profiler used when nobody observes the GA - records nothing.
+    """
+    def start(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+    def reset(self):
+        return {}, {}
+
+
+class GenerationObserver:
+    """
+    Base class of the observers of the GA. An observer is notified when the GA starts, after every generation (with
+    the statistics and the phase times of the generation) and when the GA finishes.
+    """
+    def on_start(self, ga):
+        """
+        Called before the first generation (and again if the GA is started again, e.g. after a re-plan).
+        :param ga: the GeneticSearchAlgorithm object
+        :returns: None
+        """
+
+    def on_generation(self, ga, stats):
+        """
+        Called after every generation.
+        :param ga: the GeneticSearchAlgorithm object
+        :param stats: dict of the generation, the min, max and average fitness values, the best fitness value,
+                      the seconds and the calls of every phase, and the total seconds of the generation
+        :returns: None
+        """
+
+    def on_finish(self, ga):
+        """
+        Called after the GA stopped.
+        :param ga: the GeneticSearchAlgorithm object
+        :returns: None
+        """
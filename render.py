@@ -0,0 +1,97 @@
+"""
+Renders the world, the start and destination points and the path found as an image - the pixels of all the cells are
+created at once with array operations. The image is shown in a single Tk image, or written to a PNG file without a
+display.
+"""
+import base64
+import struct
+import zlib
+import numpy
+import constants as const
+
+# Colors of the cells by their code in the image
+EMPTY, OBSTACLE, PATH, START, DEST = range(5)
+PALETTE = numpy.array([const.EMPTY_COLOR, const.OBSTACLE_COLOR, const.PATH_COLOR, const.START_COLOR,
+                       const.DEST_COLOR], dtype=numpy.uint8)
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def world_image(world, history, cellSize=None):
+    """
+    Creates the image of a world. Like the canvas of the original GUI, cell (y, x) is drawn in column y and row x,
+    and every cell has a border (unless the cells are too small).
+    :param world: the World object
+    :param history: cells visited by the path
+    :param cellSize: side of a cell in pixels (default - CELL_SIZE, smaller if the image is bigger than
+                     MAX_IMAGE_SIZE)
+    :returns: array of RGB pixels (height x width x 3)
+    """
+    size = world.size
+    if cellSize is None:
+        cellSize = max(1, min(const.CELL_SIZE, const.MAX_IMAGE_SIZE // size))
+    codes = numpy.where(world.grid, OBSTACLE, EMPTY).astype(numpy.uint8)
+    if history:
+        visited = numpy.array(list(history), dtype=numpy.int64).reshape(-1, 2)
+        codes[visited[:, 0], visited[:, 1]] = numpy.where(world.grid[visited[:, 0], visited[:, 1]], OBSTACLE, PATH)
+    codes[world.start] = START
+    codes[world.dest] = DEST
+
+    cells = PALETTE[codes.T].repeat(cellSize, axis=0).repeat(cellSize, axis=1)
+    if cellSize <= 2:
+        return cells
+    image = numpy.empty((size * cellSize + 1, size * cellSize + 1, 3), dtype=numpy.uint8)
+    image[:-1, :-1] = cells
+    image[::cellSize] = const.BORDER_COLOR
+    image[:, ::cellSize] = const.BORDER_COLOR
+    return image
+
+
+def png_bytes(image):
+    """
+    Encodes an image as PNG (8 bits RGB, no filters).
+    :param image: array of RGB pixels (height x width x 3)
+    :returns: the PNG file's content (bytes)
+    """
+    height, width = image.shape[:2]
+    rows = numpy.zeros((height, 1 + width * 3), dtype=numpy.uint8)     # Every row starts with its filter type
+    rows[:, 1:] = image.reshape(height, width * 3)
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    return PNG_SIGNATURE + \
+        chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)) + \
+        chunk(b"IDAT", zlib.compress(rows.tobytes(), const.PNG_COMPRESSION)) + \
+        chunk(b"IEND", b"")
+
+
+def write_png(path, image):
+    """
+    Writes an image to a PNG file.
+    :param path: path of the file
+    :param image: array of RGB pixels
+    :returns: None
+    """
+    with open(path, "wb") as file:
+        file.write(png_bytes(image))
+
+
+def show_image(image, title, string):
+    """
+    Shows an image in a Tk window (blocks until the window is closed).
+    :param image: array of RGB pixels
+    :param title: title of the window
+    :param string: label above the image
+    :returns: None
+    """
+    import tkinter as tk
+    height, width = image.shape[:2]
+    root = tk.Tk()
+    root.title(title)
+    label = tk.Label(root)
+    label.pack()
+    label.config(text=string)
+    ppm = b"P6 %d %d 255\n" % (width, height) + numpy.ascontiguousarray(image).tobytes()
+    photo = tk.PhotoImage(master=root, data=base64.b64encode(ppm), format="PPM")
+    tk.Label(root, image=photo).pack()
+    root.mainloop()
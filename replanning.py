@@ -0,0 +1,55 @@
+"""
+Re-planning of the GA after the obstacles of the world changed. A cell -> chromosome visitation index finds the
+chromosomes whose walks touch the changed cells, so only they are evaluated again and the population keeps evolving.
+"""
+import numpy
+from chromosome import DELTA_Y, DELTA_X
+
+
+def walked_cells(genomes, pathLength, size, start):
+    """
+    Replays the walks of evaluated genomes (their directions were already fixed to stay inside the grid).
+    :param genomes: matrix of direction codes (one row per chromosome)
+    :param pathLength: array of the path lengths of the chromosomes
+    :param size: size of the grid
+    :param start: start cell
+    :returns: matrix of the visited cells' indices (the start cell, then a cell per direction), and a mask of the
+              cells that are in the paths
+    """
+    startY, startX = start
+    genes = genomes.astype(numpy.int64)
+    cells = numpy.empty((len(genomes), genomes.shape[1] + 1), dtype=numpy.int64)
+    cells[:, 0] = startY * size + startX
+    cells[:, 1:] = (startY + numpy.cumsum(DELTA_Y[genes], axis=1)) * size + \
+        startX + numpy.cumsum(DELTA_X[genes], axis=1)
+    inPath = numpy.arange(cells.shape[1]) <= numpy.asarray(pathLength)[:, None]
+    return cells, inPath
+
+
+def visitation_index(cells, inPath, cellCount):
+    """
+    Creates an index of the chromosomes that visit every cell (compressed sparse rows - the chromosomes that visit cell
+    c are rows[offsets[c]:offsets[c + 1]], a chromosome appears once per visit).
+    :param cells: matrix of the visited cells (see walked_cells)
+    :param inPath: mask of the cells that are in the paths
+    :param cellCount: number of cells in the grid
+    :returns: offsets array (cellCount + 1) and rows array
+    """
+    rows, steps = numpy.nonzero(inPath)
+    visited = cells[rows, steps]
+    order = numpy.argsort(visited, kind="stable")
+    offsets = numpy.zeros(cellCount + 1, dtype=numpy.int64)
+    numpy.cumsum(numpy.bincount(visited, minlength=cellCount), out=offsets[1:])
+    return offsets, rows[order]
+
+
+def visiting_rows(offsets, rows, cells):
+    """
+    :param offsets: offsets array of a visitation index
+    :param rows: rows array of a visitation index
+    :param cells: indices of cells
+    :returns: sorted array of the chromosomes that visit any of the cells
+    """
+    if not len(cells):
+        return numpy.empty(0, dtype=numpy.int64)
+    return numpy.unique(numpy.concatenate([rows[offsets[cell]:offsets[cell + 1]] for cell in cells]))
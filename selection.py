@@ -0,0 +1,120 @@
+"""
+Selection methods of the GA. Every method works on the array of the population's fitness values (lower is better) and
+returns the indices of the chosen chromosomes - the parents of the next generation or the survivors.
+"""
+import numpy
+import constants as const
+
+
+def selection_weights(fitness, scale):
+    """
+    Turns min values to max values - the scale (manhattan distance) is divided by the fitness value.
+    :returns: array of the selection weights
+    """
+    return scale / numpy.asarray(fitness, dtype=float)
+
+
+def roulette_selection(fitness, count, scale):
+    """
+    Roulette wheel selection - every parent is chosen with probability proportional to its weight.
+    :param fitness: array of fitness values
+    :param count: number of parents
+    :param scale: scale of the weights
+    :returns: array of the indices of the parents
+    """
+    cumulative = numpy.cumsum(selection_weights(fitness, scale))
+    spins = numpy.random.random(count) * cumulative[-1]
+    return numpy.minimum(numpy.searchsorted(cumulative, spins, side="right"), len(cumulative) - 1)
+
+
+def stochastic_universal_sampling(fitness, count, scale):
+    """
+    Stochastic universal sampling - one spin of a wheel with count equally spaced pointers.
+    Every parent is chosen about (count * its probability) times.
+    :param fitness: array of fitness values
+    :param count: number of parents
+    :param scale: scale of the weights
+    :returns: array of the indices of the parents (empty if no parents are needed)
+    """
+    if count <= 0:
+        return numpy.empty(0, dtype=numpy.intp)
+    cumulative = numpy.cumsum(selection_weights(fitness, scale))
+    distance = cumulative[-1] / count
+    pointers = (numpy.random.random() + numpy.arange(count)) * distance
+    return numpy.minimum(numpy.searchsorted(cumulative, pointers, side="right"), len(cumulative) - 1)
+
+
+def tournament_selection(fitness, count, size=const.DEFAULT_TOURNAMENT_SIZE):
+    """
+    Tournament selection - every parent is the fittest of size random chromosomes.
+    :param fitness: array of fitness values
+    :param count: number of parents
+    :param size: number of chromosomes in every tournament
+    :returns: array of the indices of the parents
+    """
+    fitness = numpy.asarray(fitness)
+    contestants = numpy.random.randint(0, len(fitness), size=(count, size))
+    return contestants[numpy.arange(count), numpy.argmin(fitness[contestants], axis=1)]
+
+
+def select_parents(method, fitness, count, scale, tournamentSize=const.DEFAULT_TOURNAMENT_SIZE):
+    """
+    Chooses parents with one of the selection methods.
+    :param method: roulette, sus or tournament
+    :returns: array of the indices of the parents
+    """
+    if method == const.SUS_SELECTION:
+        return stochastic_universal_sampling(fitness, count, scale)
+    if method == const.TOURNAMENT_SELECTION:
+        return tournament_selection(fitness, count, tournamentSize)
+    return roulette_selection(fitness, count, scale)
+
+
+def smallest(values, count):
+    """
+    Partial selection of the smallest values in linear time - equal values are chosen by their order.
+    :param values: array of values
+    :param count: number of values to choose
+    :returns: boolean mask of the chosen values
+    """
+    if count >= len(values):
+        return numpy.ones(len(values), dtype=bool)
+    if count <= 0:
+        return numpy.zeros(len(values), dtype=bool)
+    threshold = numpy.partition(values, count - 1)[count - 1]
+    chosen = values < threshold
+    chosen[numpy.flatnonzero(values == threshold)[:count - numpy.count_nonzero(chosen)]] = True
+    return chosen
+
+
+def survivor_indices(fitness, count, elite=1):
+    """
+    Partial selection of the fittest chromosomes - only the elite prefix is ordered, so the best chromosome is first.
+    Takes linear time (plus sorting the elite) instead of sorting the whole population.
+    The result is the same as taking the first count chromosomes of a stable sort, and then moving the chromosomes
+    after the elite back to their order in the population - so selecting again from the survivors keeps them as they
+    are.
+    :param fitness: array of fitness values
+    :param count: number of survivors
+    :param elite: number of the fittest survivors that are sorted (at least 1)
+    :returns: array of the indices of the survivors - the elite sorted by the fitness values, then the other
+              survivors in their order in the population
+    """
+    fitness = numpy.asarray(fitness)
+    survivors = numpy.flatnonzero(smallest(fitness, count))
+    values = fitness[survivors]
+    elites = smallest(values, max(elite, 1))
+    order = numpy.flatnonzero(elites)
+    order = order[numpy.argsort(values[order], kind="stable")]
+    return numpy.concatenate((survivors[order], survivors[~elites]))
+
+
+def pair_parents(parents):
+    """
+    Pairs the parents with a single random permutation.
+    :param parents: array of the indices of the parents
+    :returns: indices of the first parents and the second parents of the pairs, and of the parent without a pair
+    """
+    parents = numpy.random.permutation(parents)
+    pairs = len(parents) // 2
+    return parents[:pairs], parents[pairs:2 * pairs], parents[2 * pairs:]
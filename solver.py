@@ -0,0 +1,94 @@
+"""
+Library API of the path search - solve runs the genetic algorithm on a world and returns a SolveResult. Nothing is
+printed, and no GUI or plotting module is imported, so short-lived worker processes start quickly.
+"""
+import time
+import constants as const
+from genetic_algorithm import GeneticSearchAlgorithm
+
+
+def default_parameters(world, **parameters):
+    """
+    Completes the parameters of a GeneticSearchAlgorithm with the default parameters of main.py (quiet).
+    :param world: the World object
+    :param parameters: parameters of the GeneticSearchAlgorithm
+    :returns: dict of the parameters
+    """
+    parameters.setdefault("populationSize", world.size * const.POPULATION_FACTOR)
+    parameters.setdefault("mutationProbability", float(const.DEFAULT_MUTATION_PROBABILITY))
+    parameters.setdefault("elitePercentage", float(const.DEFAULT_ELITE_PERCENTAGE))
+    parameters.setdefault("parentPercentage", float(const.DEFAULT_PARENTS_PERCENTAGE))
+    parameters.setdefault("verbose", False)
+    return parameters
+
+
+class SolveResult:
+    """
+    Result of a search on a world - the best path found, its score, and the statistics and the timings of the GA.
+    """
+    def __init__(self, ga, history, setupSeconds, searchSeconds):
+        """
+        Constructor for class SolveResult.
+        :param ga: the GeneticSearchAlgorithm object after it stopped
+        :param history: cells visited by the best path
+        :param setupSeconds: seconds of creating the GA (and its initial population)
+        :param searchSeconds: seconds of the generations
+        """
+        best = ga.bestChromosome
+        self.path = best.path[:best.pathLength]                 # Directions of the best path
+        self.cells = history                                    # Cells visited by the best path
+        self.pathLength = best.pathLength
+        self.fitness = best.fitness
+        self.found = best.destReached and not best.obstacles   # Reaches the destination without obstacles
+        self.optimal = ga.optimal_path_found()                  # Found in the length of the shortest path
+        self.shortestDistance = ga.world.shortest_distance()
+        self.generations = ga.generation
+        self.setupSeconds = setupSeconds
+        self.searchSeconds = searchSeconds
+        self.stats = ga.stats                                   # StatsStore of the generations
+        self.localSearch = ga.localSearch.stats() if ga.localSearch else None   # Counters of the local search
+
+    @property
+    def seconds(self):
+        """
+        :returns: total running time
+        """
+        return self.setupSeconds + self.searchSeconds
+
+    def to_dict(self):
+        """
+        :returns: dict of the result (without the statistics)
+        """
+        return {"path": self.path,
+                "cells": self.cells,
+                "pathLength": self.pathLength,
+                "fitness": self.fitness,
+                "found": self.found,
+                "optimal": self.optimal,
+                "shortestDistance": self.shortestDistance,
+                "generations": self.generations,
+                "setupSeconds": self.setupSeconds,
+                "searchSeconds": self.searchSeconds,
+                "localSearch": self.localSearch}
+
+    def __repr__(self):
+        """
+        :returns: string describing the result
+        """
+        return "SolveResult(found={0}, optimal={1}, pathLength={2}, fitness={3}, generations={4}, seconds={5:.3f})" \
+            .format(self.found, self.optimal, self.pathLength, self.fitness, self.generations, self.seconds)
+
+
+def solve(world, observers=None, **parameters):
+    """
+    Searches the shortest path between the start and the destination points of a world.
+    :param world: the World object
+    :param observers: observers of the GA (GenerationObserver objects)
+    :param parameters: parameters of the GeneticSearchAlgorithm (default - the default parameters of main.py, quiet)
+    :returns: SolveResult object
+    """
+    begin = time.perf_counter()
+    ga = GeneticSearchAlgorithm(world, observers=observers, **default_parameters(world, **parameters))
+    created = time.perf_counter()
+    history = ga.start()
+    return SolveResult(ga, history, created - begin, time.perf_counter() - created)
@@ -0,0 +1,190 @@
+"""
+Includes the StatsStore class - a columnar store of the statistics of every generation of the GA.
+"""
+from collections.abc import Mapping
+import numpy
+import constants as const
+
+
+class StatsStore:
+    """
+    Keeps the statistics of the generations as columns - an array of the generations and an array of every metric
+    (max, min, avg, std, percentiles, diversity...). The arrays are preallocated and grow by doubling, so recording a
+    generation is O(1) and reading a metric over all the generations is a view of its array.
+    New metrics can be recorded at any time - the generations before them get NaN (0 for integer metrics).
+    """
+    def __init__(self, capacity=const.STATS_CAPACITY):
+        """
+        Constructor for class StatsStore.
+        :param capacity: initial number of generations the arrays can hold
+        """
+        self.length = 0                                                 # Number of recorded generations
+        self.generations = numpy.empty(capacity, dtype=numpy.int64)
+        self.columns = {}                                               # Array of every metric
+
+    def __len__(self):
+        """
+        :returns: number of recorded generations
+        """
+        return self.length
+
+    @property
+    def metrics(self):
+        """
+        :returns: list of the names of the metrics
+        """
+        return list(self.columns)
+
+    def record(self, generation, **values):
+        """
+        Records the statistics of a generation. Recording the last generation again replaces its statistics.
+        :param generation: the generation (not smaller than the last recorded generation)
+        :param values: values of the metrics
+        :returns: None
+        """
+        if self.length and self.generations[self.length - 1] == generation:
+            index = self.length - 1
+        else:
+            if self.length == len(self.generations):
+                self.grow(2 * len(self.generations))
+            index = self.length
+            self.generations[index] = generation
+            self.length += 1
+        for metric, value in values.items():
+            if metric not in self.columns:
+                self.add_metric(metric, numpy.int64 if isinstance(value, (int, numpy.integer)) else float)
+            self.columns[metric][index] = value
+
+    def grow(self, capacity):
+        """
+        Reallocates the arrays with more room.
+        :param capacity: new number of generations the arrays can hold
+        :returns: None
+        """
+        generations = numpy.empty(capacity, dtype=numpy.int64)
+        generations[:self.length] = self.generations[:self.length]
+        self.generations = generations
+        for metric, column in self.columns.items():
+            self.columns[metric] = numpy.empty(capacity, dtype=column.dtype)
+            self.columns[metric][:self.length] = column[:self.length]
+
+    def add_metric(self, metric, dtype=float):
+        """
+        Adds an empty column of a metric.
+        :param metric: name of the metric
+        :param dtype: type of the values
+        :returns: None
+        """
+        column = numpy.empty(len(self.generations), dtype=dtype)
+        column[:self.length] = numpy.nan if numpy.issubdtype(column.dtype, numpy.floating) else 0
+        self.columns[metric] = column
+
+    def column(self, metric):
+        """
+        :param metric: name of the metric (or "generation")
+        :returns: array of the values of the metric in every recorded generation (a view)
+        """
+        if metric == "generation":
+            return self.generations[:self.length]
+        return self.columns[metric][:self.length]
+
+    def row(self, index):
+        """
+        :param index: index of a recorded generation (negative indices count from the last generation)
+        :returns: dict of the values of the metrics in the generation
+        """
+        index = range(self.length)[index]
+        return {metric: column[index].item() for metric, column in self.columns.items()}
+
+    def arrays(self):
+        """
+        :returns: dict of copies of the columns (including the generations)
+        """
+        arrays = {"generation": self.column("generation").copy()}
+        arrays.update((metric, self.column(metric).copy()) for metric in self.columns)
+        return arrays
+
+    @staticmethod
+    def from_arrays(arrays):
+        """
+        Creates a store from columns (see arrays).
+        :param arrays: dict of the columns (including the generations)
+        :returns: StatsStore object
+        """
+        generations = numpy.asarray(arrays["generation"], dtype=numpy.int64)
+        store = StatsStore(max(len(generations), const.STATS_CAPACITY))
+        store.generations[:len(generations)] = generations
+        store.length = len(generations)
+        for metric, values in arrays.items():
+            if metric != "generation":
+                store.add_metric(metric, numpy.asarray(values).dtype)
+                store.columns[metric][:store.length] = values
+        return store
+
+    def to_npz(self, path):
+        """
+        Writes the columns to a NumPy .npz file (see load_npz).
+        :param path: path of the file
+        :returns: None
+        """
+        numpy.savez(path, **self.arrays())
+
+    @staticmethod
+    def load_npz(path):
+        """
+        :param path: path of a file written by to_npz
+        :returns: StatsStore object
+        """
+        with numpy.load(path) as file:
+            return StatsStore.from_arrays({name: file[name] for name in file.files})
+
+    def to_csv(self, path):
+        """
+        Writes the columns to a CSV file - a header row of the names, then a row per generation.
+        :param path: path of the file
+        :returns: None
+        """
+        names = ["generation"] + self.metrics
+        table = numpy.column_stack([self.column(name).astype(float) for name in names])
+        formats = ["%d" if numpy.issubdtype(self.column(name).dtype, numpy.integer) else "%.6g" for name in names]
+        numpy.savetxt(path, table, fmt=formats, delimiter=",", header=",".join(names), comments="")
+
+    def view(self):
+        """
+        :returns: read-only dict-like view of the statistics by generation (see StatsView)
+        """
+        return StatsView(self)
+
+
+class StatsView(Mapping):
+    """
+    Read-only view of a StatsStore in the form of the old data dict of the GA - {generation: {metric: value}}.
+    """
+    def __init__(self, store):
+        """
+        Constructor for class StatsView.
+        :param store: the StatsStore object
+        """
+        self.store = store
+
+    def __getitem__(self, generation):
+        """
+        :returns: dict of the values of the metrics in the generation
+        """
+        generations = self.store.column("generation")
+        index = numpy.searchsorted(generations, generation)
+        if index == len(generations) or generations[index] != generation:
+            raise KeyError(generation)
+        return self.store.row(int(index))
+
+    def __iter__(self):
+        """
+        :returns: iterator over the recorded generations
+        """
+        return iter(self.store.column("generation").tolist())
+
+    def __len__(self):
+        """
+        :returns: number of recorded generations
+        """
+        return len(self.store)
@@ -0,0 +1,212 @@
+"""
+Runs configurations of the genetic algorithm - one after another or in parallel in a pool of processes.
+"""
+from itertools import product
+import os
+import random
+import time
+
+import constants as const
+from world import World
+from genetic_algorithm import GeneticSearchAlgorithm, seed_generators
+from generation_log import JsonlLogger
+from checkpoint import Checkpointer, resume
+from render import world_image, write_png
+
+
+def create_configurations(worldSizes, obstacleNumbers, mutationProbabilities, elitePercentages, parentsPercentages,
+                          populationSizes=None, engine=const.DEFAULT_ENGINE, cacheSize=const.FITNESS_CACHE_SIZE,
+                          seed=None, evaluationWorkers=1, islands=const.DEFAULT_ISLANDS,
+                          migrationInterval=const.DEFAULT_MIGRATION_INTERVAL, migrants=const.DEFAULT_MIGRANTS,
+                          topology=const.RING_TOPOLOGY, verbose=True, logDirectory=None,
+                          selectionMethod=const.DEFAULT_SELECTION, tournamentSize=const.DEFAULT_TOURNAMENT_SIZE,
+                          crossoverMethod=const.DEFAULT_CROSSOVER, initializer=const.DEFAULT_INITIALIZER,
+                          randomFraction=const.DEFAULT_RANDOM_FRACTION, adaptive=False, checkpointDirectory=None,
+                          checkpointInterval=const.CHECKPOINT_SAVE_INTERVAL, outputDirectory=None, localSearch=False):
+    """
+    Creates the configurations of all the combinations of the parameters.
+    :param populationSizes: list of population sizes (default - world size * 1.5)
+    :param seed: base seed of the configurations (default - random seed)
+    :param islands: number of populations of the island model (1 - a single GeneticSearchAlgorithm)
+    :param verbose: print the status of every generation
+    :param logDirectory: directory of the JSON Lines logs of the generations of every configuration
+    :param selectionMethod: how the parents are chosen (roulette, sus or tournament)
+    :param crossoverMethod: how the children are created (uniform, single-point or two-point)
+    :param initializer: how the initial paths are created (random, biased or greedy)
+    :param randomFraction: part of the initial paths that are random
+    :param adaptive: adapt the mutation probability and stop when the GA converged
+    :param localSearch: improve the paths of the elite by a local search in every generation
+    :param checkpointDirectory: directory of the checkpoints of every configuration (existing checkpoints are resumed)
+    :param checkpointInterval: number of generations between checkpoints
+    :param outputDirectory: directory of the PNG image of the world and the path found, and of the CSV file of the
+                            statistics of every configuration
+    (the directories are created if they don't exist)
+    :returns: list of configurations (dicts)
+    """
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    for directory in (logDirectory, checkpointDirectory, outputDirectory):
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    configurations = []
+    for size in worldSizes:
+        for obstacleIndex, obstacleNumber in enumerate(obstacleNumbers):
+            for mutationProbability, elitePercentage, parentsPercentage in \
+                    product(mutationProbabilities, elitePercentages, parentsPercentages):
+                sizes = populationSizes if populationSizes else [size * const.POPULATION_FACTOR]
+                for populationSize in sizes:
+                    configuration = len(configurations) + 1
+                    string = ("Configuration #{0}: world_size={1}, number_of_obstacles={2}, population_size={3}"
+                              .format(configuration, size, obstacleNumber, populationSize))
+                    name = "size={0}_obstacles={1}_pop={2}".format(size, obstacleNumber, populationSize)
+                    if len(mutationProbabilities) > 1:
+                        string += ", mutation_probability={}".format(mutationProbability)
+                        name += "_mutation={}".format(mutationProbability)
+                    if len(elitePercentages) > 1:
+                        string += ", elite_percentage={}".format(elitePercentage)
+                        name += "_elite={}".format(elitePercentage)
+                    if len(parentsPercentages) > 1:
+                        string += ", parents_percentage={}".format(parentsPercentage)
+                        name += "_parents={}".format(parentsPercentage)
+                    configurations.append({"configuration": configuration,
+                                           "name": name,
+                                           "description": string,
+                                           "size": size,
+                                           "obstacles": obstacleNumbers[:obstacleIndex + 1],
+                                           "populationSize": populationSize,
+                                           "mutationProbability": mutationProbability,
+                                           "elitePercentage": elitePercentage,
+                                           "parentPercentage": parentsPercentage,
+                                           "engine": engine,
+                                           "selectionMethod": selectionMethod,
+                                           "tournamentSize": tournamentSize,
+                                           "crossoverMethod": crossoverMethod,
+                                           "initializer": initializer,
+                                           "randomFraction": randomFraction,
+                                           "adaptive": adaptive,
+                                           "localSearch": localSearch,
+                                           "evaluationWorkers": evaluationWorkers,
+                                           "islands": islands,
+                                           "migrationInterval": migrationInterval,
+                                           "migrants": migrants,
+                                           "topology": topology,
+                                           "verbose": verbose,
+                                           "logDirectory": logDirectory,
+                                           "checkpointDirectory": checkpointDirectory,
+                                           "checkpointInterval": checkpointInterval,
+                                           "outputDirectory": outputDirectory,
+                                           "cacheSize": cacheSize,
+                                           "seed": seed})
+    return configurations
+
+
+def build_world(configuration):
+    """
+    Creates the world of a configuration.
+    Like a serial run of main.py, a world of a given size gets its obstacles added one number after another - every
+    step is seeded, so the same world is created in every process.
+    :returns: the World object
+    """
+    size = configuration["size"]
+    seed_generators(configuration["seed"], size)
+    world = World(size=size, obstacles=0, cacheSize=configuration["cacheSize"])
+    for obstacleNumber in configuration["obstacles"]:
+        seed_generators(configuration["seed"], size, obstacleNumber)
+        world.changeObstacles(obstacleNumber)
+    return world
+
+
+def save_outputs(configuration, world, history, stats):
+    """
+    Writes the image of the world and the path found, and the statistics of a configuration (if it has an output
+    directory).
+    :returns: None
+    """
+    if configuration["outputDirectory"]:
+        path = os.path.join(configuration["outputDirectory"], configuration["name"])
+        write_png(path + ".png", world_image(world, history))
+        stats.to_csv(path + ".csv")
+
+
+def run_configuration(configuration, world=None):
+    """
+    Runs the genetic algorithm with the parameters of a configuration.
+    With a checkpoint directory the search is saved periodically, and a search whose checkpoint exists is resumed.
+    With an output directory the world and the path found are written to a PNG image, and the statistics to a CSV
+    file.
+    :param configuration: the configuration (dict)
+    :param world: the World object of the configuration (created if not given)
+    :returns: dict of the configuration's name and description, the statistics of the generations, the best path,
+              the cells visited by the best path and the running time (seconds)
+    """
+    if world is None:
+        world = build_world(configuration)
+    seed_generators(configuration["seed"], configuration["configuration"])
+    parameters = {"populationSize": configuration["populationSize"],
+                  "mutationProbability": configuration["mutationProbability"],
+                  "elitePercentage": configuration["elitePercentage"],
+                  "parentPercentage": configuration["parentPercentage"],
+                  "engine": configuration["engine"],
+                  "selectionMethod": configuration["selectionMethod"],
+                  "tournamentSize": configuration["tournamentSize"],
+                  "crossoverMethod": configuration["crossoverMethod"],
+                  "initializer": configuration["initializer"],
+                  "randomFraction": configuration["randomFraction"],
+                  "adaptive": configuration["adaptive"],
+                  "localSearch": configuration["localSearch"],
+                  "evaluationWorkers": configuration["evaluationWorkers"],
+                  "verbose": configuration["verbose"]}
+    if configuration["islands"] > 1:
+        from islands import IslandModel
+        model = IslandModel(world, configuration["islands"], migrationInterval=configuration["migrationInterval"],
+                            migrants=configuration["migrants"], topology=configuration["topology"],
+                            seed="{0}-{1}".format(configuration["seed"], configuration["configuration"]),
+                            **parameters)
+        result = model.start()
+        result.update(name=configuration["name"], description=configuration["description"])
+        save_outputs(configuration, world, result["history"], result["stats"])
+        return result
+
+    logger = None
+    if configuration["logDirectory"]:
+        logger = JsonlLogger(os.path.join(configuration["logDirectory"], configuration["name"] + ".jsonl"),
+                             run=configuration["name"])
+    checkpointer = None
+    if configuration["checkpointDirectory"]:
+        checkpointer = Checkpointer(os.path.join(configuration["checkpointDirectory"], configuration["name"] + ".npz"),
+                                    interval=configuration["checkpointInterval"])
+    observers = [observer for observer in (logger, checkpointer) if observer]
+    begin = time.perf_counter()
+    if checkpointer and os.path.exists(checkpointer.path):
+        ga = resume(checkpointer.path, observers=observers, verbose=configuration["verbose"],
+                    evaluationWorkers=configuration["evaluationWorkers"], cacheSize=configuration["cacheSize"])
+    else:
+        ga = GeneticSearchAlgorithm(world, observers=observers, **parameters)
+    history = ga.start()
+    save_outputs(configuration, ga.world, history, ga.stats)
+    best = ga.bestChromosome
+    return {"name": configuration["name"],
+            "description": configuration["description"],
+            "stats": ga.stats,
+            "path": best.path[:best.pathLength],
+            "fitness": best.fitness,
+            "found": best.destReached and not best.obstacles,
+            "history": history,
+            "generations": ga.generation,
+            "localSearch": ga.localSearch.stats() if ga.localSearch else None,
+            "time": time.perf_counter() - begin}
+
+
+def run_sweep(configurations, workers=1):
+    """
+    Runs all the configurations. If more than one worker is requested - the configurations run in a pool of processes.
+    Every configuration is seeded, so the results are the same as in a serial run.
+    :param configurations: list of configurations
+    :param workers: number of processes
+    :returns: list of the results of the configurations (in the same order)
+    """
+    if workers <= 1:
+        return [run_configuration(configuration) for configuration in configurations]
+    from multiprocessing import Pool
+    with Pool(processes=workers) as pool:
+        return pool.map(run_configuration, configurations, chunksize=1)
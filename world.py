@@ -1,77 +1,409 @@
 """
 Includes class representing the world of the robot.
 """
-from random import sample
+from heapq import heappop, heappush
+from collections import OrderedDict
+from random import randrange, sample
+import struct
+import numpy
+import constants as const
 from chromosome import Chromosome
+from fitness_cache import FitnessCache
+
+# Header of a world file - magic, size, start (y, x) and destination (y, x), followed by the occupancy grid
+WORLD_HEADER = struct.Struct("<8s5I")
 
 
 class World:
     """
     Class representing a world which the robot has to explore.
     """
-    def __init__(self, size, obstacles):
+    def __init__(self, size, obstacles, cacheSize=const.FITNESS_CACHE_SIZE, occupancy=None, start=None, dest=None):
         """
         Constructor for class world.
+        If an occupancy grid is given (with the start and destination points) - the world uses it instead of creating
+        random obstacles (see load).
+        :param size: size of the grid
+        :param obstacles: number of obstacles
+        :param cacheSize: maximal number of paths in the fitness cache (0 disables the cache)
+        :param occupancy: obstacles index of an existing world
         """
-        # Create grid of the world
         self.size = size
-        self.grid = []
-        for row in range(size):
-            self.grid.append([])
-            for col in range(size):
-                self.grid[row].append(False)
+        self.path = None                            # World file that the obstacles index is mapped from
+        self.obstacleCells = None                   # Cached list of the obstacles (see obstaclesList)
+        self.distances = None                       # Distance field to the destination (see distance_field)
+        self.queryDistances = OrderedDict()         # Distance fields of the query worlds by destination (see query)
 
         # Add the obstacles
-        self.obstaclesList = []
+        if occupancy is None:
+            occupancy = bytearray(size * size)
+        self.occupancy = occupancy                  # Obstacles index - cell (y, x) is in index y * size + x
+        self.obstacleCount = 0                      # Number of obstacles
+        self.grid = self.obstacle_grid().reshape(size, size)    # Boolean view of the obstacles index by (y, x)
 
         # Choose start and destination points
-        self.start = None
-        self.dest = None
-        self.choose_special_cells(obstacles)
+        self.start = start
+        self.dest = dest
+        if start is None or dest is None:
+            self.choose_special_cells(obstacles)
+        else:
+            self.obstacleCount = int(numpy.count_nonzero(self.obstacle_grid()))
         self.manhattanDistance = Chromosome.manhattan_distance(self.start, self.dest)
+        self.fitnessCache = FitnessCache(cacheSize)     # Fitness values of paths walked in the world
+
+    @staticmethod
+    def load(path, cacheSize=const.FITNESS_CACHE_SIZE):
+        """
+        Opens a world file (see save). The obstacles index is memory-mapped - opening doesn't read the grid, and
+        processes that load the same file share its pages. Changes of the obstacles are private to the world.
+        :param path: path of the world file
+        :param cacheSize: maximal number of paths in the fitness cache
+        :returns: the World object
+        """
+        with open(path, "rb") as file:
+            magic, size, startY, startX, destY, destX = WORLD_HEADER.unpack(file.read(WORLD_HEADER.size))
+        if magic != const.WORLD_FILE_MAGIC:
+            raise ValueError("{} is not a world file".format(path))
+        world = World(size, 0, cacheSize, occupancy=World.map_occupancy(path, size),
+                      start=(startY, startX), dest=(destY, destX))
+        world.path = path
+        return world
+
+    @staticmethod
+    def map_occupancy(path, size):
+        """
+        :returns: copy-on-write memory map of the obstacles index of a world file
+        """
+        return numpy.memmap(path, dtype=numpy.uint8, mode="c", offset=WORLD_HEADER.size, shape=(size * size,))
+
+    def save(self, path):
+        """
+        Writes the world to a file - a header of the size, start and destination points, followed by the obstacles
+        index (a byte for every cell).
+        :param path: path of the world file
+        :returns: None
+        """
+        with open(path, "wb") as file:
+            file.write(WORLD_HEADER.pack(const.WORLD_FILE_MAGIC, self.size, *self.start, *self.dest))
+            self.obstacle_grid().view(numpy.uint8).tofile(file)
+
+    def __getstate__(self):
+        """
+        A mapped world is sent to other processes without its obstacles index - they map the file again.
+        The distance fields of the queries are not sent.
+        :returns: the attributes of the world
+        """
+        state = dict(self.__dict__)
+        del state["grid"]
+        state["queryDistances"] = OrderedDict()
+        if self.path is not None:
+            state["occupancy"] = None
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the attributes of the world (and maps the world file again).
+        :returns: None
+        """
+        self.__dict__.update(state)
+        if self.path is not None:
+            self.occupancy = World.map_occupancy(self.path, self.size)
+        self.grid = self.obstacle_grid().reshape(self.size, self.size)
+
+    def query(self, start, dest, cacheSize=const.FITNESS_CACHE_SIZE):
+        """
+        Creates a world with the same obstacles and other start and destination points. The query world shares the
+        obstacles index of this world, so its obstacles must not be changed (and query worlds created before the
+        obstacles of this world change must be created again).
+        The start and destination cells must be inside the world and free of obstacles.
+        The distance fields of the last destinations are cached, so queries to the same destination share them.
+        :param start: start cell (y, x)
+        :param dest: destination cell (y, x)
+        :param cacheSize: maximal number of paths in the fitness cache of the query world
+        :returns: the World object
+        """
+        start, dest = tuple(start), tuple(dest)
+        for y, x in (start, dest):
+            if not (0 <= y < self.size and 0 <= x < self.size):
+                raise ValueError("cell {} is outside the world".format((y, x)))
+            if self.occupancy[y * self.size + x]:
+                raise ValueError("cell {} is an obstacle".format((y, x)))
+        if start == dest:
+            raise ValueError("the start and the destination are the same cell {}".format(start))
+        world = World(self.size, 0, cacheSize, occupancy=self.occupancy, start=start, dest=dest)
+        if dest == self.dest:
+            world.distances = self.distance_field()
+        elif dest in self.queryDistances:
+            self.queryDistances.move_to_end(dest)
+            world.distances = self.queryDistances[dest]
+        else:
+            self.queryDistances[dest] = world.distance_field()
+            if len(self.queryDistances) > const.QUERY_DISTANCE_FIELDS:
+                self.queryDistances.popitem(last=False)
+        return world
+
+    @property
+    def obstaclesList(self):
+        """
+        List of the obstacles' cells - created from the obstacles index when needed.
+        :returns: list of (y, x) coordinates
+        """
+        if self.obstacleCells is None:
+            self.obstacleCells = [divmod(cell, self.size) for cell in numpy.flatnonzero(self.obstacle_grid()).tolist()]
+        return self.obstacleCells
+
+    def distance_field(self):
+        """
+        Distances from every cell to the destination through cells without obstacles (UNREACHABLE for obstacles and
+        for cells without such path). Calculated once by a breadth first search, and updated when obstacles are added.
+        :returns: flat array of the distances (cell (y, x) is in index y * size + x)
+        """
+        if self.distances is None:
+            self.distances = self.breadth_first_search()
+        return self.distances
+
+    def shortest_distance(self):
+        """
+        :returns: length of the shortest path from the start to the destination that avoids the obstacles
+                  (UNREACHABLE if there is no such path)
+        """
+        startY, startX = self.start
+        return int(self.distance_field()[startY * self.size + startX])
+
+    def remaining_distance(self, cell):
+        """
+        :param cell: coordinates of the cell
+        :returns: distance from the cell to the destination - Manhattan distance for obstacles and unreachable cells
+        """
+        y, x = cell
+        distance = int(self.distance_field()[y * self.size + x])
+        return distance if distance != const.UNREACHABLE else Chromosome.manhattan_distance(cell, self.dest)
+
+    def breadth_first_search(self):
+        """
+        Calculates the distance field - every level of the search is expanded at once with array operations.
+        :returns: flat array of the distances to the destination
+        """
+        free = ~self.obstacle_grid()
+        distances = numpy.full(self.size * self.size, const.UNREACHABLE, dtype=numpy.int32)
+        frontier = numpy.array([self.dest[0] * self.size + self.dest[1]])
+        distances[frontier] = 0
+        distance = 0
+        while frontier.size:
+            distance += 1
+            cells = self.neighbour_indices(frontier)
+            frontier = numpy.unique(cells[free[cells] & (distances[cells] == const.UNREACHABLE)])
+            distances[frontier] = distance
+        return distances
+
+    def neighbour_indices(self, cells):
+        """
+        :param cells: array of cells' indices
+        :returns: array of the indices of the cells next to them (inside the grid)
+        """
+        y, x = numpy.divmod(cells, self.size)
+        return numpy.concatenate((cells[y + 1 < self.size] + self.size, cells[y > 0] - self.size,
+                                  cells[x > 0] - 1, cells[x + 1 < self.size] + 1))
+
+    def neighbours(self, cell):
+        """
+        :param cell: index of a cell
+        :returns: list of the indices of the cells next to it (inside the grid)
+        """
+        y, x = divmod(cell, self.size)
+        cells = []
+        if y + 1 < self.size:
+            cells.append(cell + self.size)
+        if y > 0:
+            cells.append(cell - self.size)
+        if x > 0:
+            cells.append(cell - 1)
+        if x + 1 < self.size:
+            cells.append(cell + 1)
+        return cells
+
+    def block_distances(self, cells):
+        """
+        Updates the distance field after obstacles were added to cells.
+        Distances only grow, so:
+            1. Invalidate the cells whose shortest paths passed through the new obstacles - in order of their distance,
+               a cell is invalid when none of its neighbours is one step closer to the destination.
+            2. Search again from the valid cells around the invalid cells, with a heap ordered by the distance.
+        If too many cells are invalid - the whole field is calculated again.
+        :param cells: indices of the new obstacles
+        :returns: None
+        """
+        distances = self.distances
+        heap = []
+        for cell in cells:
+            if distances[cell] != const.UNREACHABLE:
+                heappush(heap, (int(distances[cell]), cell))
+                distances[cell] = const.UNREACHABLE
+
+        # Invalidate the cells that lost their shortest paths
+        invalid = []
+        limit = len(distances) // const.DISTANCE_FIELD_REBUILD
+        while heap:
+            distance, cell = heappop(heap)
+            for neighbour in self.neighbours(cell):
+                if distances[neighbour] == distance + 1 and \
+                        all(distances[other] != distance for other in self.neighbours(neighbour)):
+                    distances[neighbour] = const.UNREACHABLE
+                    invalid.append(neighbour)
+                    heappush(heap, (distance + 1, neighbour))
+            if len(invalid) > limit:
+                self.distances = self.breadth_first_search()
+                return
+
+        # Search again from the valid cells around the invalid cells
+        pending = set(invalid)
+        for cell in invalid:
+            reachable = [int(distances[neighbour]) for neighbour in self.neighbours(cell)
+                         if distances[neighbour] != const.UNREACHABLE]
+            if reachable:
+                heappush(heap, (min(reachable) + 1, cell))
+        while heap:
+            distance, cell = heappop(heap)
+            if cell not in pending:
+                continue
+            pending.remove(cell)
+            distances[cell] = distance
+            for neighbour in self.neighbours(cell):
+                if neighbour in pending:
+                    heappush(heap, (distance + 1, neighbour))
+
+    def unblock_distances(self, cells):
+        """
+        Updates the distance field after obstacles were removed from cells.
+        Distances only shrink, so the search starts from the freed cells (one step farther than their closest
+        neighbour) and continues, with a heap ordered by the distance, only to the cells that get closer.
+        :param cells: indices of the removed obstacles
+        :returns: None
+        """
+        distances = self.distances
+        heap = []
+        for cell in cells:
+            reachable = [int(distances[neighbour]) for neighbour in self.neighbours(cell)
+                         if distances[neighbour] != const.UNREACHABLE]
+            if reachable:
+                heappush(heap, (min(reachable) + 1, cell))
+        while heap:
+            distance, cell = heappop(heap)
+            if distances[cell] != const.UNREACHABLE and distances[cell] <= distance:
+                continue
+            distances[cell] = distance
+            for neighbour in self.neighbours(cell):
+                if not self.occupancy[neighbour] and \
+                        (distances[neighbour] == const.UNREACHABLE or distances[neighbour] > distance + 1):
+                    heappush(heap, (distance + 1, neighbour))
+
+    def is_obstacle(self, cell):
+        """
+        Checks if there is an obstacle in a cell.
+        :param cell: coordinates of the cell
+        :returns: True if the cell is an obstacle
+        """
+        y, x = cell
+        return self.occupancy[y * self.size + x] == 1
+
+    def obstacle_grid(self):
+        """
+        Creates a flat boolean NumPy view of the obstacles index (shares memory with the index).
+        :returns: the obstacles array
+        """
+        return numpy.frombuffer(self.occupancy, dtype=bool)
 
     def choose_special_cells(self, obstacles):
         """
         Adds obstacles to the map, chooses start and destination points.
+        The cells are sampled from the range of the cells' indices, so a list of all the cells is never created.
         :returns: None
         """
-        cells = []
-        for y in range(self.size):
-            for x in range(self.size):
-                cells.append((y, x))
+        cells = sample(range(self.size * self.size), obstacles + 2)
+
+        # Choose start and destination points
+        self.start = divmod(cells[0], self.size)
+        self.dest = divmod(cells[1], self.size)
 
         # Add obstacles to the map
-        self.obstaclesList.extend(sample(cells, obstacles))
-        for cell in self.obstaclesList:
-            y, x = cell
-            self.grid[y][x] = True
+        self.add_obstacles(cells[2:])
 
-        # Choose start and destination points
-        cells = set(cells) - set(self.obstaclesList)
-        points = sample(cells, 2)
-        self.start = points[0]
-        self.dest = points[1]
+    def add_obstacles(self, cells):
+        """
+        Marks cells as obstacles - the distance field is updated and the distance fields of the query worlds are
+        cleared.
+        :param cells: indices of the cells
+        :returns: None
+        """
+        for cell in cells:
+            self.occupancy[cell] = 1
+        self.obstacleCount += len(cells)
+        self.obstacleCells = None
+        self.path = None
+        if self.distances is not None:
+            self.block_distances(cells)
+        self.queryDistances.clear()
 
     def changeObstacles(self, number):
         """
         Adds new obstacles to the grid.
+        Free cells are drawn at random until enough new obstacles are found. If most of the cells are taken - the new
+        obstacles are sampled from the indices of the free cells.
         :param number: Total number of obstacles required.
         :returns: None
         """
-        # Create a list of all cells
-        cells = []
-        for y in range(self.size):
-            for x in range(self.size):
-                cells.append((y, x))
-
-        # Remove the start, destination and obstacles points
-        cells = set(cells) - set(self.obstaclesList)
-        cells.remove(self.start)
-        cells.remove(self.dest)
-
-        # Randomly add obstacles to the grid
-        new = number - len(self.obstaclesList)
-        newCells = sample(cells, new)
-        for y, x in newCells:
-            self.grid[y][x] = True
-        self.obstaclesList.extend(newCells)
+        new = number - self.obstacleCount
+        if new <= 0:
+            return
+        cells = self.size * self.size
+        special = (self.start[0] * self.size + self.start[1], self.dest[0] * self.size + self.dest[1])
+        free = cells - self.obstacleCount - len(special)
+        if new * 2 > free:
+            freeCells = numpy.flatnonzero(~self.obstacle_grid())
+            newCells = sample([cell for cell in freeCells.tolist() if cell not in special], new)
+        else:
+            newCells = []
+            chosen = set()
+            while len(newCells) < new:
+                cell = randrange(cells)
+                if not self.occupancy[cell] and cell not in special and cell not in chosen:
+                    chosen.add(cell)
+                    newCells.append(cell)
+        self.add_obstacles(newCells)
+
+        # Cached fitness values are not valid anymore
+        self.fitnessCache.clear()
+
+    def update_obstacles(self, added=(), removed=()):
+        """
+        Adds and removes obstacles while the world is in use (e.g. by a GA that re-plans, see
+        GeneticSearchAlgorithm.replan). The distance field is updated incrementally, and the fitness cache and the
+        distance fields of the query worlds are cleared.
+        Cells that are already obstacles (or already free) are ignored, and cells outside the world raise ValueError.
+        :param added: coordinates of the new obstacles
+        :param removed: coordinates of the obstacles to remove
+        :returns: sorted array of the indices of the cells that changed
+        """
+        added = {tuple(cell) for cell in added}
+        removed = {tuple(cell) for cell in removed}
+        for y, x in added | removed:
+            if not (0 <= y < self.size and 0 <= x < self.size):
+                raise ValueError("cell {} is outside the world".format((y, x)))
+        if self.start in added or self.dest in added:
+            raise ValueError("The start and destination points can't be obstacles")
+        addedCells = sorted({y * self.size + x for y, x in added if not self.occupancy[y * self.size + x]})
+        removedCells = sorted({y * self.size + x for y, x in removed if self.occupancy[y * self.size + x]})
+
+        self.add_obstacles(addedCells)
+        for cell in removedCells:
+            self.occupancy[cell] = 0
+        self.obstacleCount -= len(removedCells)
+        self.obstacleCells = None
+        self.path = None
+        if self.distances is not None and removedCells:
+            self.unblock_distances(removedCells)
+
+        # Cached fitness values and distance fields are not valid anymore
+        self.fitnessCache.clear()
+        self.queryDistances.clear()
+        return numpy.array(sorted(addedCells + removedCells), dtype=numpy.int64)